@@ -1,5 +1,7 @@
 import os
-from pydantic import BaseSettings, root_validator
+from pydantic import BaseSettings, root_validator, validator
+from helpers.excel_reader import EXCEL_ENGINES
+from helpers.file_watcher import FILE_WATCH_MODES
 
 class DD20Settings(BaseSettings):
     """BaseSetting superclass for managing configuration"""
@@ -16,9 +18,18 @@ class DD20Settings(BaseSettings):
     mrid_mapping_filepath: str = "/input/seg_line_mrid_PROD.csv"
     station_data_valid_hash: str = "6ac10cff51c6dbc586e729e10b943854"
     line_data_valid_hash: str = "86e61101fa327e1b4f769c26300be01f"
+    dd20_streaming_read: bool = False
+    excel_engine: str = "openpyxl"
+    parse_cache_dir: str = ""
+    parallel_parse: bool = False
+    compact_dtypes: bool = False
+    mrid_csv_chunk_size: int = 0
+    file_watch_mode: str = "auto"
+    file_watch_debounce: float = 0.5
     api_port: int = 5000
     api_dbname: str = "CONDUCTOR_DATA"
     api_refresh_rate: float = 60
+    http_port: int = 0
 
     @root_validator(pre=False)
     def assign_mock_data(cls, values):
@@ -35,6 +46,20 @@ class DD20Settings(BaseSettings):
 
         return values
 
+    @validator("excel_engine")
+    def validate_excel_engine(cls, value):
+
+        assert value in EXCEL_ENGINES, f"excel_engine must be one of {EXCEL_ENGINES}"
+
+        return value
+
+    @validator("file_watch_mode")
+    def validate_file_watch_mode(cls, value):
+
+        assert value in FILE_WATCH_MODES, f"file_watch_mode must be one of {FILE_WATCH_MODES}"
+
+        return value
+
     # Configure how envionment .env file should be parsed
     class Config:
         env_file = os.path.join(os.path.split(os.path.abspath(__file__))[0], ".env")
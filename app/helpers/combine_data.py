@@ -1,12 +1,94 @@
 # Generic modules
 import logging
+from dataclasses import dataclass, field, asdict
 
 # Modules
+import numpy as np
+from numpy import nan
 import pandas as pd
 
 # Initialize log
 log = logging.getLogger(__name__)
 
+"""
+Compact dtypes of columns in the ACLineSegment dataframe:
+- Names and other strings with few unique values are categoricals (MRIDs are unique, so they are kept as strings)
+- Counts, temperature and conductor/component limits are nullable 32 bit integers
+- Cable limits are 32 bit floats, since most AC-lines have no cable limits
+"""
+ACLINESEGMENT_SCHEMA = {
+    "LINE_EMSNAME": "category",
+    "DLR_ENABLED": "bool",
+    "ACLINE_NAME_DATASOURCE": "category",
+    "DATASOURCE": "category",
+    "CONDUCTOR_TYPE": "category",
+    "CONDUCTOR_COUNT": "Int32",
+    "SYSTEM_COUNT": "Int32",
+    "MAX_TEMPERATURE": "Int32",
+    "RESTRICT_CONDUCTOR_LIM_CONTINUOUS": "Int32",
+    "RESTRICT_COMPONENT_LIM_CONTINUOUS": "Int32",
+    "RESTRICT_COMPONENT_LIM_15M": "Int32",
+    "RESTRICT_COMPONENT_LIM_1H": "Int32",
+    "RESTRICT_COMPONENT_LIM_40H": "Int32",
+    "RESTRICT_CABLE_LIM_CONTINUOUS": "float32",
+    "RESTRICT_CABLE_LIM_15M": "float32",
+    "RESTRICT_CABLE_LIM_1H": "float32",
+    "RESTRICT_CABLE_LIM_40H": "float32",
+}
+
+# Maximum amount of AC-line names kept as samples in each list of the reconciliation report
+MAX_RECONCILIATION_SAMPLES = 10
+
+
+@dataclass
+class ReconciliationReport:
+    """
+    Class for representing how well AC-lines in DD20 and SCADA data match, when they are joined.
+    The report is stored in 'reconciliation_report' of the joined dataframe attrs, as a dictionary.
+
+    Attributes
+    ----------
+    aclinesegment_count : int
+        Amount of ACLineSegments in the joined dataframe.
+    dd20_only_count : int
+        Amount of AC-lines which were found in conductor data but not in SCADA data.
+    dd20_only_samples : list[str]
+        Names of the first AC-lines which were found in conductor data but not in SCADA data.
+    scada_only_count : int
+        Amount of AC-lines which exist in SCADA data but not in conductor data.
+    scada_only_samples : list[str]
+        Names of the first AC-lines which exist in SCADA data but not in conductor data.
+    dlr_enabled_without_conductor_data_count : int
+        Amount of AC-lines which are enabled for DLR but have no conductor data.
+    dlr_enabled_without_conductor_data_samples : list[str]
+        Names of the first AC-lines which are enabled for DLR but have no conductor data.
+    """
+
+    aclinesegment_count: int = 0
+    dd20_only_count: int = 0
+    dd20_only_samples: list = field(default_factory=list)
+    scada_only_count: int = 0
+    scada_only_samples: list = field(default_factory=list)
+    dlr_enabled_without_conductor_data_count: int = 0
+    dlr_enabled_without_conductor_data_samples: list = field(default_factory=list)
+
+    def log(self):
+        """
+        Log the report once, as info and as an error if AC-lines enabled for DLR have no conductor data.
+        """
+        if log.isEnabledFor(logging.INFO):
+            log.info(
+                f"{self.aclinesegment_count} ACLineSegments were joined. "
+                + f"{self.dd20_only_count} lines were found in conductor data but not in SCADA data, "
+                + f"i.e. {self.dd20_only_samples}. {self.scada_only_count} lines exist in SCADA data "
+                + f"but not in conductor data, i.e. {self.scada_only_samples}."
+            )
+        if self.dlr_enabled_without_conductor_data_count:
+            log.error(
+                f"{self.dlr_enabled_without_conductor_data_count} lines are enabled for DLR "
+                + f"but have no conductor data, i.e. {self.dlr_enabled_without_conductor_data_samples}."
+            )
+
 
 def create_aclinesegment_dataframe(
     dd20_data: pd.DataFrame,
@@ -26,6 +108,9 @@ def create_aclinesegment_dataframe(
     The ACLineSegment will only appear in the dataframe if the AC-line name exist in both DD20 and SCADA.
     Each ACLinesegment will be represented by a unique MRID from the SCADA system.
 
+    The data is combined in stages, which can also be used separately to only recompute the stages affected by a change:
+    create_acline_namemap_dict, create_mapped_dd20_dataframe and join_aclinesegment_dataframe.
+
     Parameters
     ----------
     dd20_data : pd.DataFrame
@@ -55,56 +140,266 @@ def create_aclinesegment_dataframe(
         Dataframe containing a record for each ACLineSegment existing in SCADA, if it can be linked to properties from DD20.
     """
     try:
-        # Dictionary which maps from dd20 to SCADA name, if mapping is specified.
-        acline_namemap_dict = dd20_to_scada_name_map.set_index(dd20_name_col_nm)[scada_name_col_nm].to_dict()
-
-        # List which contains either translated name from DD20 or mapped name if existing in mapping dictionary
-        mapped_name_list = [
-            acline_namemap_dict[x] if x in acline_namemap_dict else x
-            for x in dd20_data[translated_acline_name_col_nm]
-        ]
-
-        # Update column in DD20 data with mapped names
-        dd20_data[scada_acline_name_col_nm] = mapped_name_list
-
-        # Extract lists of unique line names from conductor and SCADA dataframe
-        aclines_in_dd20_data = set(dd20_data[scada_acline_name_col_nm].to_list())
-        aclines_in_scada_data = set(
-            scada_aclinesegment_map[scada_acline_name_col_nm].to_list()
+        acline_namemap_dict = create_acline_namemap_dict(
+            dd20_to_scada_name_map=dd20_to_scada_name_map,
+            dd20_name_col_nm=dd20_name_col_nm,
+            scada_name_col_nm=scada_name_col_nm,
         )
 
-        # Create list of AC-lines which have DLR enabled flag set True
-        aclines_dlr_enabled = scada_aclinesegment_map.loc[
-            scada_aclinesegment_map[dlr_enabled_col_nm], scada_acline_name_col_nm
-        ].to_list()
+        mapped_dd20_data = create_mapped_dd20_dataframe(
+            dd20_data=dd20_data,
+            acline_namemap_dict=acline_namemap_dict,
+            scada_acline_name_col_nm=scada_acline_name_col_nm,
+            translated_acline_name_col_nm=translated_acline_name_col_nm,
+        )
 
-        # Log line names which are in DD20, but not SCADA as info
-        for acline in [acline_name for acline_name in aclines_in_dd20_data if acline_name not in aclines_in_scada_data]:
-            log.info(f"Line with name '{acline}' was found in conductor data but not in SCADA data.")
+        return join_aclinesegment_dataframe(
+            mapped_dd20_data=mapped_dd20_data,
+            scada_aclinesegment_map=scada_aclinesegment_map,
+            dlr_enabled_col_nm=dlr_enabled_col_nm,
+            scada_acline_name_col_nm=scada_acline_name_col_nm,
+        )
+
+    except Exception as e:
+        log.exception(f"Combining data to ACLineSegment dataframe failed with message: {e}.")
+        raise e
 
-        # Log line names which are in SCADA, but not DD20 as info
-        for acline in [acline_name for acline_name in aclines_in_scada_data if acline_name not in aclines_in_dd20_data]:
-            log.info(f"Line with name '{acline}' exists in SCADA data but not in conductor data.")
 
-        # Log lines for which DLR enabled flag is set but data is not availiable in DD20, as errors
-        for acline in [acline_name for acline_name in aclines_dlr_enabled if acline_name not in aclines_in_dd20_data]:
-            log.error(f"Line with name '{acline}' is enabled for DLR but has no conductor data.")
+def create_acline_namemap_dict(
+    dd20_to_scada_name_map: pd.DataFrame,
+    dd20_name_col_nm="DD20 Name",
+    scada_name_col_nm="ETS Name",
+) -> dict:
+    """
+    Create dictionary which maps from DD20 AC-line name to SCADA AC-line name, for AC-lines where mapping is specified.
 
-        # Join two dataframes where AC-line name is the common key.
-        dlr_dataframe = scada_aclinesegment_map.join(
-            dd20_data.set_index(scada_acline_name_col_nm),
-            on=scada_acline_name_col_nm,
-            how="inner",
-        )
+    Parameters
+    ----------
+    dd20_to_scada_name_map : pd.DataFrame
+        Dataframe with mapping from AC-line name in DD20 to AC-line name in SCADA.
+    dd20_name_col_nm: str, Default = "DD20 Name"
+        (optional) Name of column which contains DD20 name in name mapping dataframe.
+    scada_name_col_nm: str, Default = "ETS Name"
+        (optional) Name of column which contains SCADA name in name mapping dataframe.
 
-        # drop column with translated names
-        dlr_dataframe.drop(columns=[translated_acline_name_col_nm], inplace=True)
+    Returns
+    -------
+    dict
+        Dictionary with DD20 AC-line name as key and SCADA AC-line name as value.
+    """
+    return dd20_to_scada_name_map.set_index(dd20_name_col_nm)[scada_name_col_nm].to_dict()
+
+
+def create_mapped_dd20_dataframe(
+    dd20_data: pd.DataFrame,
+    acline_namemap_dict: dict,
+    scada_acline_name_col_nm: str = "LINE_EMSNAME",
+    translated_acline_name_col_nm: str = "acline_name_translated",
+) -> pd.DataFrame:
+    """
+    Create dataframe with data from DD20 indexed by SCADA AC-line name, ready to be joined with SCADA data.
+    The SCADA AC-line name is the mapped name if mapping is specified, otherwise the translated name from DD20.
+
+    The DD20 dataframe is not modified.
+
+    Parameters
+    ----------
+    dd20_data : pd.DataFrame
+        Dataframe containing data from DD20, where each row represents an AC-line.
+    acline_namemap_dict : dict
+        Dictionary with DD20 AC-line name as key and SCADA AC-line name as value, see create_acline_namemap_dict.
+    scada_acline_name_col_nm : str, Default = "LINE_EMSNAME"
+        (optional) Name of index holding SCADA AC-line name.
+    translated_name_col_nm: str, Default = "acline_name_translated"
+        (optional) Name of column which contains translated name in DD20 dataframe.
+        The column is not included in the resulting dataframe.
 
-        # Force uppercase on all column names
-        dlr_dataframe.columns = dlr_dataframe.columns.str.upper()
+    Returns
+    -------
+    pd.Dataframe
+        Dataframe with data from DD20 and SCADA AC-line name as index.
+    """
+    # Either translated name from DD20 or mapped name if existing in mapping dictionary, mapped for all rows at once
+    translated_names = dd20_data[translated_acline_name_col_nm]
+    acline_namemap = pd.Series(acline_namemap_dict, dtype=object)
+    is_mapped = translated_names.isin(acline_namemap.index)
+    mapped_names = translated_names.map(acline_namemap).where(is_mapped, translated_names)
 
-        return dlr_dataframe
+    return (
+        dd20_data.drop(columns=[translated_acline_name_col_nm])
+        .set_axis(pd.Index(mapped_names.to_numpy(dtype=object), name=scada_acline_name_col_nm), axis="index")
+    )
+
+
+def join_aclinesegment_dataframe(
+    mapped_dd20_data: pd.DataFrame,
+    scada_aclinesegment_map: pd.DataFrame,
+    dlr_enabled_col_nm: str = "DLR_ENABLED",
+    scada_acline_name_col_nm: str = "LINE_EMSNAME",
+) -> pd.DataFrame:
+    """
+    Join SCADA ACLineSegment mapping with data from DD20 indexed by SCADA AC-line name,
+    and report AC-lines which only exist in one of them.
+
+    The report is logged once and stored in attrs["reconciliation_report"] of the resulting dataframe,
+    see ReconciliationReport.
+
+    Parameters
+    ----------
+    mapped_dd20_data : pd.DataFrame
+        Dataframe with data from DD20 and SCADA AC-line name as index, see create_mapped_dd20_dataframe.
+    scada_ACLineSegment_map : pd.Dataframe
+        Dataframe with:
+        - Mapping from ACLineSegment MRID to ACLine name
+        - Flag indicating if Dynamic Line Rating is enabled on the ACLineSegment in SCADA system.
+    dlr_enabled_col_nm : str, Default = "DLR_ENABLED"
+        (optional) Name of column which contains DLR Enabled flag in SCADA ACLineSegment mapping dataframe
+    scada_acline_name_col_nm : str, Default = "LINE_EMSNAME"
+        (optional) Name of column which contains SCADA AC-line name in SCADA ACLineSegment mapping dataframe.
+
+    Returns
+    -------
+    pd.Dataframe
+        Dataframe containing a record for each ACLineSegment existing in SCADA, if it can be linked to properties from DD20.
+    """
+    # Factorize AC-line names of both dataframes together, so each name is hashed once and has the same code in both
+    dd20_codes, scada_codes, acline_names = _factorize_join_keys(
+        mapped_dd20_data.index, scada_aclinesegment_map[scada_acline_name_col_nm]
+    )
+    in_dd20_data = np.zeros(len(acline_names), dtype=bool)
+    in_dd20_data[dd20_codes] = True
+    in_scada_data = np.zeros(len(acline_names), dtype=bool)
+    in_scada_data[scada_codes] = True
+
+    # Line names which are only in DD20 or only in SCADA, and lines for which DLR enabled flag is set
+    # but data is not availiable in DD20
+    is_dlr_enabled = scada_aclinesegment_map[dlr_enabled_col_nm].to_numpy(dtype=bool)
+    in_dlr_enabled_data = np.zeros(len(acline_names), dtype=bool)
+    in_dlr_enabled_data[scada_codes[is_dlr_enabled]] = True
+    dd20_only_codes = np.flatnonzero(in_dd20_data & ~in_scada_data)
+    scada_only_codes = np.flatnonzero(in_scada_data & ~in_dd20_data)
+    no_conductor_data_codes = np.flatnonzero(in_dlr_enabled_data & ~in_dd20_data)
+
+    # Join two dataframes where AC-line name is the common key, on the integer codes of the names
+    scada_positions, dd20_positions = _inner_join_positions(scada_codes, dd20_codes)
+    scada_rows = scada_aclinesegment_map.take(scada_positions)
+    dd20_rows = mapped_dd20_data.take(dd20_positions).set_axis(scada_rows.index, axis="index")
+    dlr_dataframe = pd.concat([scada_rows, dd20_rows], axis="columns")
+
+    # Force uppercase on all column names
+    dlr_dataframe.columns = dlr_dataframe.columns.str.upper()
+
+    report = ReconciliationReport(
+        aclinesegment_count=len(dlr_dataframe),
+        dd20_only_count=len(dd20_only_codes),
+        dd20_only_samples=_sample_names(acline_names, dd20_only_codes),
+        scada_only_count=len(scada_only_codes),
+        scada_only_samples=_sample_names(acline_names, scada_only_codes),
+        dlr_enabled_without_conductor_data_count=len(no_conductor_data_codes),
+        dlr_enabled_without_conductor_data_samples=_sample_names(acline_names, no_conductor_data_codes),
+    )
+    report.log()
+    dlr_dataframe.attrs["reconciliation_report"] = asdict(report)
+
+    return dlr_dataframe
+
+
+def _sample_names(acline_names: np.ndarray, codes: np.ndarray) -> list:
+    """
+    Returns the first AC-line names of codes, with None for missing names.
+    """
+    return [None if pd.isna(name) else name for name in acline_names[codes[:MAX_RECONCILIATION_SAMPLES]]]
+
+
+def _factorize_join_keys(dd20_keys: pd.Index, scada_keys: pd.Series) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Returns codes of DD20 and SCADA AC-line names from a shared factorization, and the name of each code.
+
+    The many SCADA names are hashed once when factorized, and only the few unique names are matched with DD20 names.
+    Missing names (None or NaN) share the last code, so they are joined like the pandas join does.
+    """
+    scada_codes, scada_names = pd.factorize(scada_keys.to_numpy(dtype=object))
+    dd20_codes = pd.Index(scada_names, dtype=object).get_indexer(dd20_keys)
+    is_dd20_missing = pd.isna(dd20_keys)
+
+    # DD20 names which are not in SCADA get codes after the SCADA names
+    is_dd20_only = (dd20_codes == -1) & ~is_dd20_missing
+    dd20_only_codes, dd20_only_names = pd.factorize(dd20_keys[is_dd20_only].to_numpy(dtype=object))
+    dd20_codes[is_dd20_only] = dd20_only_codes + len(scada_names)
+
+    missing_code = len(scada_names) + len(dd20_only_names)
+    scada_codes[scada_codes == -1] = missing_code
+    dd20_codes[is_dd20_missing] = missing_code
+
+    acline_names = np.concatenate([np.asarray(scada_names, dtype=object), dd20_only_names, [nan]])
+    return dd20_codes, scada_codes, acline_names
+
+
+def _inner_join_positions(left_codes: np.ndarray, right_codes: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns positions of matching rows for an inner join on codes. Rows are in the order of the left side,
+    and rows of the right side matching the same left row are in the order of the right side.
+
+    Right rows are grouped by code, so the matches of a left row are found by indexing with its code.
+    """
+    code_count = max(left_codes.max(initial=-1), right_codes.max(initial=-1)) + 1
+    right_order = np.argsort(right_codes, kind="stable")
+    right_code_counts = np.bincount(right_codes, minlength=code_count)
+    right_code_begins = np.cumsum(right_code_counts) - right_code_counts
+
+    match_begins = right_code_begins[left_codes]
+    match_counts = right_code_counts[left_codes]
+    left_positions = np.repeat(np.arange(len(left_codes)), match_counts)
+    match_offsets = np.arange(len(left_positions)) - np.repeat(np.cumsum(match_counts) - match_counts, match_counts)
+    right_positions = right_order[np.repeat(match_begins, match_counts) + match_offsets]
+    return left_positions, right_positions
+
+
+def enforce_aclinesegment_schema(dlr_dataframe: pd.DataFrame, schema: dict = ACLINESEGMENT_SCHEMA) -> pd.DataFrame:
+    """
+    Cast columns of ACLineSegment dataframe to compact dtypes, and log memory usage before and after.
+
+    Integer columns with values which are not whole numbers are cast to float32 instead, with a warning,
+    so no values are changed. Columns not in the schema keep their dtype.
+
+    Parameters
+    ----------
+    dlr_dataframe : pd.DataFrame
+        Dataframe containing a record for each ACLineSegment, see create_aclinesegment_dataframe.
+    schema : dict, Default = ACLINESEGMENT_SCHEMA
+        (optional) Mapping from column name to dtype.
+
+    Returns
+    -------
+    pd.Dataframe
+        Dataframe with columns cast to dtypes of schema.
+    """
+    try:
+        memory_before = dlr_dataframe.memory_usage(deep=True).sum()
+
+        # Numeric columns are converted first, so i.e. numeric strings are cast as numbers
+        column_dtypes = {}
+        numeric_columns = {}
+        for column_name, dtype in schema.items():
+            if column_name not in dlr_dataframe.columns:
+                continue
+            if dtype in ["Int32", "float32"]:
+                numeric_columns[column_name] = pd.to_numeric(dlr_dataframe[column_name])
+            if dtype == "Int32" and not numeric_columns[column_name].dropna().mod(1).eq(0).all():
+                log.warning(f"Column '{column_name}' has values which are not whole numbers and is cast to float32.")
+                dtype = "float32"
+            column_dtypes[column_name] = dtype
+
+        compact_dataframe = dlr_dataframe.assign(**numeric_columns).astype(column_dtypes)
+
+        memory_after = compact_dataframe.memory_usage(deep=True).sum()
+        log.info(
+            f"Memory usage of ACLineSegment dataframe was reduced from {memory_before} to {memory_after} bytes "
+            + "by compact dtypes."
+        )
+
+        return compact_dataframe
 
     except Exception as e:
-        log.exception(f"Combining data to ACLineSegment dataframe failed with message: {e}.")
+        log.exception(f"Casting ACLineSegment dataframe to compact dtypes failed with message: {e}.")
         raise e
@@ -36,9 +36,42 @@ def calculate_dd20_format_hash(data_frame: pd.DataFrame) -> str:
         the hash value of the headers of the dd20 sheet
 
     """
-    headers = data_frame.columns
+    return calculate_dd20_header_hash(list(data_frame.columns))
 
-    header_names = str(list(headers)).encode()
+
+def validate_dd20_header_format(header_columns: list, expected_hash: str) -> bool:
+    """Compare hash of header columns with expected hash value
+
+    Parameters
+    ----------
+    header_columns: list
+        names of all columns in dd20 station data or line data sheet
+    expected_hash: str
+        the expected known hash value that must match the computed hash of the dd20 headers
+
+    Returns
+    -------
+    bool
+        true if hash values match.
+    """
+    return calculate_dd20_header_hash(header_columns) == expected_hash
+
+
+def calculate_dd20_header_hash(header_columns: list) -> str:
+    """
+    summarizes the hash value for each cell in the (header row/column row).
+
+    Parameters
+    ----------
+    header_columns: list
+        names of all columns in dd20 station data or line data sheet
+
+    Returns
+    -------
+    str
+        the hash value of the headers of the dd20 sheet
+    """
+    header_names = str(list(header_columns)).encode()
     dd20_header_hash = hashlib.md5(header_names).hexdigest()
 
     return dd20_header_hash
@@ -0,0 +1,220 @@
+# Generic modules
+import logging
+import importlib.util
+from dataclasses import dataclass
+from typing import Union
+
+# Modules
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+# Engines which can be selected for reading excel-files, where "auto" picks calamine if available
+EXCEL_ENGINES = ["auto", "openpyxl", "calamine"]
+
+
+def resolve_excel_engine(engine: str = "auto") -> str:
+    """
+    Returns name of engine to use with pd.read_excel.
+
+    The calamine engine (Rust based) is used if it is selected or if engine is "auto",
+    and it is available, i.e. python-calamine is installed and pandas is version 2.2 or newer.
+    Otherwise the openpyxl engine is used.
+
+    Parameters
+    ----------
+    engine : str, Default = "auto"
+        (optional) Selected engine, must be one of "auto", "openpyxl" or "calamine".
+
+    Returns
+    -------
+    str
+        Name of engine, either "openpyxl" or "calamine".
+    """
+    if engine not in EXCEL_ENGINES:
+        raise ValueError(f"Excel engine is set to '{engine}', but must be one of {EXCEL_ENGINES}.")
+
+    if engine == "openpyxl":
+        return "openpyxl"
+
+    if is_calamine_available():
+        return "calamine"
+
+    if engine == "calamine":
+        log.warning("Excel engine 'calamine' is not available, 'openpyxl' is used instead.")
+    return "openpyxl"
+
+
+def is_calamine_available() -> bool:
+    """
+    Returns True if pandas can read excel-files with the calamine engine.
+    """
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return pandas_version >= (2, 2) and importlib.util.find_spec("python_calamine") is not None
+
+
+@dataclass
+class StreamedExcelSheet:
+    """
+    Class for representing selected columns of an excel-sheet read by streaming.
+
+    Attributes
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe containing only the selected columns, in the order they appear in the sheet.
+    header_columns : list
+        Names of all columns in the sheet, as pandas would name them when reading the whole sheet.
+    column_positions : list[int]
+        Position in the sheet of each column in the dataframe.
+    """
+
+    dataframe: pd.DataFrame
+    header_columns: list
+    column_positions: list[int]
+
+
+def read_excelsheets_streaming(
+    file_path: str,
+    sheet_columns: dict[str, list[Union[str, int]]],
+    header_index: int = 1,
+) -> dict[str, StreamedExcelSheet]:
+    """
+    Read selected columns of excel-sheets to dataframes, by streaming rows of a read-only workbook.
+
+    Only values are loaded (no formatting, formulas or macros) and only cells in the selected columns are converted.
+    Cells are converted and typed the same way as pd.read_excel does with the openpyxl engine,
+    so each dataframe equals the same columns of a dataframe read with pd.read_excel.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of excel-file.
+    sheet_columns : dict[str, list[Union[str, int]]]
+        Mapping from name of sheet to columns to keep.
+        Columns can be given by name (as named by pandas, i.e. 'Unnamed: 5' or 'Kommentar.1') or by position.
+    header_index : int, Default = 1
+        (optional) Index of header row in the excel-sheets.
+
+    Returns
+    -------
+    dict[str, StreamedExcelSheet]
+        Mapping from name of sheet to object holding dataframe with selected columns.
+    """
+    try:
+        workbook = load_workbook(filename=file_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            return {
+                sheet_name: _read_excelsheet_streaming(
+                    worksheet=workbook[sheet_name], columns=columns, header_index=header_index
+                )
+                for sheet_name, columns in sheet_columns.items()
+            }
+        finally:
+            workbook.close()
+
+    except Exception as e:
+        log.exception(
+            f"Streaming sheets: {list(sheet_columns)} from excel-file '{file_path}' failed with message: '{e}'."
+        )
+        raise e
+
+
+def _read_excelsheet_streaming(worksheet, columns: list[Union[str, int]], header_index: int) -> StreamedExcelSheet:
+    """
+    Read selected columns of a single read-only worksheet, see read_excelsheets_streaming.
+    """
+    # Rows are read without assumed dimensions, like pandas does for read-only workbooks
+    worksheet.reset_dimensions()
+    rows = worksheet.iter_rows(values_only=True)
+
+    # Header rows are kept in full, since all column names are needed to name columns as pandas does
+    header_rows = []
+    for row in rows:
+        header_rows.append([_convert_cell_value(value) for value in row])
+        if len(header_rows) > header_index:
+            break
+    header_columns = _get_header_columns(header_rows=header_rows, header_index=header_index)
+
+    # Position of each selected column in the sheet, sorted to keep order of sheet
+    column_positions = sorted(
+        {column if isinstance(column, int) else header_columns.index(column) for column in columns}
+    )
+
+    """
+    Remaining rows are streamed and only cells in selected columns are converted.
+    The width of all rows is tracked, since pandas pads all rows to the widest row without trailing empty cells.
+    Trailing rows without any data are trimmed, like pandas does.
+    """
+    max_width = max((_get_row_width(header_row) for header_row in header_rows), default=0)
+    selected_rows = []
+    last_row_with_data = -1
+    for row_number, row in enumerate(rows):
+        row_width = _get_row_width(row)
+        if row_width:
+            max_width = max(max_width, row_width)
+            last_row_with_data = row_number
+        selected_rows.append(
+            [_convert_cell_value(row[position]) if position < len(row) else "" for position in column_positions]
+        )
+    del selected_rows[last_row_with_data + 1:]
+
+    # Columns beyond the header row are named as pandas names them, when rows are wider than header
+    if max_width > len(header_columns):
+        header_columns = _get_header_columns(header_rows=header_rows, header_index=header_index, width=max_width)
+
+    dataframe = TextParser(
+        selected_rows,
+        names=[header_columns[position] for position in column_positions],
+        header=None,
+        skip_blank_lines=False,
+    ).read()
+
+    return StreamedExcelSheet(
+        dataframe=dataframe, header_columns=header_columns, column_positions=column_positions
+    )
+
+
+def _get_header_columns(header_rows: list[list], header_index: int, width: int = 0) -> list:
+    """
+    Returns names of all columns as pandas names them,
+    i.e. 'Unnamed: <position>' for empty names and '<name>.<n>' for duplicated names.
+    """
+    width = max([width] + [_get_row_width(header_row) for header_row in header_rows])
+    return list(
+        TextParser(
+            [header_row[:width] + [""] * (width - len(header_row)) for header_row in header_rows],
+            header=header_index,
+            skip_blank_lines=False,
+        )
+        .read()
+        .columns
+    )
+
+
+def _get_row_width(row: Union[tuple, list]) -> int:
+    """
+    Returns width of row without trailing empty cells.
+    """
+    width = len(row)
+    while width and (row[width - 1] is None or row[width - 1] == ""):
+        width -= 1
+    return width
+
+
+def _convert_cell_value(value):
+    """
+    Convert value of cell the same way as pandas does for openpyxl cells:
+    Empty cells become empty strings, errors become NaN and whole numbers become integers.
+    """
+    if value is None:
+        return ""
+    elif isinstance(value, str) and value in ERROR_CODES:
+        return np.nan
+    elif isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
@@ -0,0 +1,90 @@
+# Generic modules
+import logging
+import hashlib
+import os
+from dataclasses import dataclass
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+
+def calculate_file_hash(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Calculate hash value of the content of a file, by streaming it through BLAKE2b in chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of file.
+    chunk_size : int, Default = 1048576
+        (optional) Amount of bytes read from file at a time.
+
+    Returns
+    -------
+    str
+        Hex digest of the hash value of the file content.
+    """
+    try:
+        file_hash = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(chunk_size), b""):
+                file_hash.update(chunk)
+        return file_hash.hexdigest()
+
+    except Exception as e:
+        log.exception(f"Calculating hash of file '{file_path}' failed with message: '{e}'.")
+        raise e
+
+
+@dataclass(frozen=True)
+class FileSignature:
+    """
+    Class for representing the state of a file, used to detect changes in file content.
+
+    Attributes
+    ----------
+    size : int
+        Size of file in bytes.
+    mtime : float
+        Time of last modification of file.
+    hash : str
+        Hash value of the file content.
+    """
+
+    size: int
+    mtime: float
+    hash: str
+
+
+def get_file_signature(file_path: str, previous_signature: FileSignature = None) -> FileSignature:
+    """
+    Returns signature of a file.
+
+    The file content is only hashed if size or modification time differs from the previous signature,
+    otherwise the hash of the previous signature is reused. Comparing hash values of signatures
+    thereby detects changes in content cheaply, also when a file is touched or copied without changes.
+
+    Parameters
+    ----------
+    file_path : str
+        Path of file.
+    previous_signature : FileSignature, Default = None
+        (optional) Signature of the file from the last check.
+
+    Returns
+    -------
+    FileSignature
+        Signature of the file.
+    """
+    file_stat = os.stat(file_path)
+
+    if (
+        previous_signature is not None
+        and previous_signature.size == file_stat.st_size
+        and previous_signature.mtime == file_stat.st_mtime
+    ):
+        return previous_signature
+
+    return FileSignature(
+        size=file_stat.st_size, mtime=file_stat.st_mtime, hash=calculate_file_hash(file_path)
+    )
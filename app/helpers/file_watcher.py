@@ -0,0 +1,248 @@
+# Generic modules
+import logging
+import os
+import sys
+import ctypes
+import ctypes.util
+import select
+import struct
+from time import sleep, monotonic
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+# Modes for watching files, where "auto" uses inotify if it is available
+FILE_WATCH_MODES = ["auto", "inotify", "poll"]
+
+# inotify flags, see 'man 7 inotify'
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+"""
+Directories are watched instead of files, since files replaced by an atomic rename (or a new symlink)
+are new inodes which a watch on the old file would not follow. Writes are only seen when the file is closed,
+so partially written files do not trigger a refresh. Creating, truncating or changing attributes of a file
+is not a change by itself, since a writer does that before writing the content.
+"""
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+def is_inotify_available() -> bool:
+    """
+    Returns True if inotify can be used for watching files, i.e. on Linux with inotify in libc.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        return hasattr(libc, "inotify_init1") and hasattr(libc, "inotify_add_watch")
+    except OSError:
+        return False
+
+
+class FileWatcher:
+    """
+    Class for waiting on changes of a set of files.
+
+    In "inotify" mode the parent directories of the files are watched with Linux inotify, and waiting returns
+    when one of the files is closed after writing, replaced or deleted. Events are debounced, so a burst of events
+    (i.e. a file copied in several writes or replaced by a rename) results in a single wakeup.
+    In "poll" mode waiting always returns after the poll interval, leaving the check for changes to the caller.
+
+    Attributes
+    ----------
+    mode : str
+        Mode in use, either "inotify" or "poll".
+
+    Methods
+    -------
+    wait(timeout=None)
+        Wait until one of the files changes, returns True if a change was seen.
+    close()
+        Stop watching files.
+    """
+
+    def __init__(
+        self,
+        file_paths: list[str],
+        mode: str = "auto",
+        debounce: float = 0.5,
+        poll_interval: float = 60,
+    ):
+        """
+        Create new FileWatcher instance.
+
+        Parameters
+        ----------
+        file_paths : list[str]
+            Paths of files to watch.
+        mode : str, default: "auto"
+            Mode for watching files, "inotify", "poll" or "auto" (inotify if it is available).
+        debounce : float, default: 0.5
+            Seconds without new events before a change is reported.
+        poll_interval : float, default: 60
+            Seconds between wakeups in "poll" mode.
+        """
+        if mode not in FILE_WATCH_MODES:
+            raise ValueError(f"File watch mode is set to '{mode}', but must be one of {FILE_WATCH_MODES}.")
+
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.__fd = None
+        self.__watched_dirs = {}
+
+        # Names of watched files in each directory, where None means any name (the file is a symlink)
+        self.__watched_names = {}
+        for file_path in file_paths:
+            directory, name = os.path.split(os.path.abspath(file_path))
+            names = self.__watched_names.setdefault(directory, set())
+            if names is not None:
+                self.__watched_names[directory] = None if os.path.islink(file_path) else names | {name}
+
+        self.mode = "poll"
+        if mode != "poll":
+            if is_inotify_available():
+                try:
+                    self.__start_inotify()
+                    self.mode = "inotify"
+                except OSError as e:
+                    log.warning(f"Watching files with inotify failed with message: '{e}', polling is used instead.")
+            elif mode == "inotify":
+                log.warning("Watching files with inotify is not available, polling is used instead.")
+
+        log.info(f"Input files are watched in '{self.mode}' mode.")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __start_inotify(self):
+        """
+        Initialize inotify and add a watch on each directory holding watched files.
+        """
+        self.__libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = self.__libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.__fd = fd
+
+        try:
+            for directory in self.__watched_names:
+                self.__add_watch(directory)
+        except OSError:
+            self.close()
+            raise
+
+    def __add_watch(self, directory: str):
+        """
+        Add inotify watch on directory.
+        """
+        wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"{os.strerror(errno)}: '{directory}'")
+        self.__watched_dirs[wd] = directory
+
+    def close(self):
+        """
+        Stop watching files.
+        """
+        if self.__fd is not None:
+            os.close(self.__fd)
+            self.__fd = None
+            self.__watched_dirs = {}
+
+    def wait(self, timeout: float = None) -> bool:
+        """
+        Wait until one of the watched files changes.
+
+        Parameters
+        ----------
+        timeout : float, Default = None
+            (optional) Maximum seconds to wait. If None, wait until a change is seen
+            in "inotify" mode, or for the poll interval in "poll" mode.
+
+        Returns
+        -------
+        bool
+            True if a change was seen (always True in "poll" mode after the poll interval), otherwise False.
+        """
+        if self.mode == "poll":
+            sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return timeout is None or timeout >= self.poll_interval
+
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(deadline - monotonic(), 0)
+            if not self.__read_events(timeout=remaining):
+                if deadline is not None and monotonic() >= deadline:
+                    return False
+                continue
+
+            # Wait until events stop arriving, so a burst of events only gives a single wakeup
+            while self.__read_events(timeout=self.debounce):
+                pass
+            return True
+
+    def __read_events(self, timeout: float = None) -> bool:
+        """
+        Read pending inotify events, waiting at most timeout seconds for the first.
+        Returns True if any of the events concern a watched file.
+        """
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if not readable:
+            return False
+
+        try:
+            buffer = os.read(self.__fd, 64 * 1024)
+        except BlockingIOError:
+            return False
+
+        changed = False
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, length = INOTIFY_EVENT.unpack_from(buffer, offset)
+            name = os.fsdecode(buffer[offset + INOTIFY_EVENT.size: offset + INOTIFY_EVENT.size + length].rstrip(b"\0"))
+            offset += INOTIFY_EVENT.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                log.debug("inotify event queue overflowed, files are treated as changed.")
+                changed = True
+            elif mask & IN_IGNORED:
+                # Directory was removed or unmounted, watch it again if it comes back
+                directory = self.__watched_dirs.pop(wd, None)
+                log.warning(f"Watch on directory '{directory}' was removed.")
+                changed = True
+                self.__rewatch(directory)
+            elif wd in self.__watched_dirs:
+                watched_names = self.__watched_names[self.__watched_dirs[wd]]
+                if watched_names is None or name in watched_names:
+                    log.debug(f"File '{name}' in '{self.__watched_dirs[wd]}' changed (inotify mask {mask:#x}).")
+                    changed = True
+
+        return changed
+
+    def __rewatch(self, directory: str):
+        """
+        Try to watch a directory again, after its watch was removed.
+        """
+        if directory is None:
+            return
+        try:
+            self.__add_watch(directory)
+        except OSError as e:
+            log.warning(f"Watching directory '{directory}' again failed with message: '{e}'.")
+            if not self.__watched_dirs:
+                log.warning("No directories are watched with inotify, polling is used instead.")
+                self.close()
+                self.mode = "poll"
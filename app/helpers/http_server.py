@@ -0,0 +1,152 @@
+# Generic modules
+import logging
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qsl
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class HTTPRequest:
+    """
+    Class for representing a HTTP GET request given to a route handler.
+
+    Attributes
+    ----------
+    path : str
+        Path of the request, without query string.
+    query : dict[str, str]
+        Query parameters of the request.
+    headers : dict[str, str]
+        Headers of the request, with lower case names.
+    """
+
+    path: str
+    query: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+
+
+@dataclass
+class HTTPResponse:
+    """
+    Class for representing a HTTP response returned by a route handler.
+
+    Attributes
+    ----------
+    body : bytes
+        Body of the response. A string is encoded as utf-8.
+    status : int
+        HTTP status code.
+    content_type : str
+        Content type of the body.
+    headers : dict[str, str]
+        Additional headers of the response.
+    """
+
+    body: bytes = b""
+    status: int = 200
+    content_type: str = "text/plain; charset=utf-8"
+    headers: dict = field(default_factory=dict)
+
+
+class HTTPServer:
+    """
+    Class for serving HTTP GET requests in a background thread, by routing paths to handler functions.
+
+    The server runs next to the API from singupy, and serves endpoints which are not part of it,
+    i.e. metrics. Each request is handled in its own thread.
+
+    Methods
+    -------
+    add_route(path, handler)
+        Route requests for path to handler.
+    start()
+        Start serving requests in a background thread.
+    stop()
+        Stop serving requests.
+    """
+
+    def __init__(self, port: int, host: str = "0.0.0.0"):
+        """
+        Parameters
+        ----------
+        port : int
+            Port to serve on. If 0 a free port is picked, which can be read from 'port' after start.
+        host : str, Default = "0.0.0.0"
+            (optional) Address to serve on.
+        """
+        self.host = host
+        self.port = port
+        self.__routes = {}
+        self.__server = None
+        self.__thread = None
+
+    def add_route(self, path: str, handler: callable):
+        """
+        Route GET requests for path to handler.
+
+        Parameters
+        ----------
+        path : str
+            Path of route, i.e. "/metrics".
+        handler : callable
+            Function which is called with a HTTPRequest and must return a HTTPResponse.
+        """
+        self.__routes[path] = handler
+
+    def start(self):
+        """
+        Start serving requests in a background thread.
+        """
+        routes = self.__routes
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlsplit(self.path)
+                handler = routes.get(url.path)
+                if handler is None:
+                    response = HTTPResponse(body=f"Path '{url.path}' was not found.", status=404)
+                else:
+                    try:
+                        response = handler(
+                            HTTPRequest(
+                                path=url.path,
+                                query=dict(parse_qsl(url.query)),
+                                headers={name.lower(): value for name, value in self.headers.items()},
+                            )
+                        )
+                    except Exception as e:
+                        log.exception(f"Handling request for '{self.path}' failed with message: '{e}'.")
+                        response = HTTPResponse(body="Internal server error.", status=500)
+
+                body = response.body.encode("utf-8") if isinstance(response.body, str) else response.body
+                self.send_response(response.status)
+                self.send_header("Content-Type", response.content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                log.debug(f"{self.address_string()} - {format % args}")
+
+        self.__server = ThreadingHTTPServer((self.host, self.port), RequestHandler)
+        self.__server.daemon_threads = True
+        self.port = self.__server.server_address[1]
+        self.__thread = threading.Thread(target=self.__server.serve_forever, name="http-server", daemon=True)
+        self.__thread.start()
+        log.info(f"HTTP server is serving {sorted(self.__routes)} on port '{self.port}'.")
+
+    def stop(self):
+        """
+        Stop serving requests.
+        """
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__thread.join()
+            self.__server = None
@@ -0,0 +1,182 @@
+# Generic modules
+import json
+import logging
+
+# App modules
+from helpers.http_server import HTTPServer, HTTPRequest, HTTPResponse
+from helpers.snapshot_store import SnapshotStore, RENDERERS
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+# Maximum amount of keys in a single lookup request
+MAX_LOOKUP_KEYS = 100
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+class LookupAPI:
+    """
+    Class for serving ACLineSegment records from the current snapshot.
+
+    Unlike the SQL API from singupy, which queries the whole dataframe for each request,
+    lookups use the index of the snapshot and only cost a dictionary lookup for each key.
+
+    Endpoints
+    ---------
+    GET /aclinesegments?mrid=<mrid>[,<mrid>...]
+        Records of ACLineSegments with the given MRIDs.
+    GET /aclinesegments?line_emsname=<name>[,<name>...]
+        Records of ACLineSegments of the AC-lines with the given names.
+    GET /aclinesegments.json and /aclinesegments.csv
+        All ACLineSegments, rendered when the snapshot was published.
+    GET /aclinesegments.arrow and /aclinesegments.parquet
+        All ACLineSegments in Arrow IPC stream and Parquet format, if pyarrow is installed.
+    GET /aclinesegments/changes?since=<generation>
+        ACLineSegments which were added, changed or removed since the generation.
+    GET /aclinesegments/reconciliation
+        Report of AC-lines which only exist in DD20 or SCADA data, when the dataframe was joined.
+
+    Lookup responses are JSON objects with the generation of the snapshot and a list of records.
+    The status is 404 if no records were found, and 400 if the request has no keys or too many keys.
+
+    Responses with all ACLineSegments have an ETag header. If it matches the If-None-Match header of
+    the request, the status is 304 and the body is empty, so polling unchanged data costs almost nothing.
+
+    Changes are a JSON object with the current generation, records of added and changed ACLineSegments and MRIDs of
+    removed ACLineSegments. The status is 410 if changes since the generation are no longer kept, in which case
+    the client must get all ACLineSegments again.
+
+    Methods
+    -------
+    add_routes(http_server)
+        Add the endpoints to a HTTP server.
+    """
+
+    def __init__(self, snapshot_store: SnapshotStore):
+        """
+        Parameters
+        ----------
+        snapshot_store : SnapshotStore
+            Store holding the snapshot which lookups are served from.
+        """
+        self.snapshot_store = snapshot_store
+
+    def add_routes(self, http_server: HTTPServer):
+        """
+        Add the endpoints to a HTTP server.
+        """
+        http_server.add_route("/aclinesegments", self.get_aclinesegments)
+        http_server.add_route("/aclinesegments/changes", self.get_aclinesegment_changes)
+        http_server.add_route("/aclinesegments/reconciliation", self.get_reconciliation_report)
+        for format in RENDERERS:
+            http_server.add_route(
+                f"/aclinesegments.{format}",
+                lambda request, format=format: self.get_all_aclinesegments(request, format),
+            )
+
+    def get_aclinesegments(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Returns records of ACLineSegments by MRID or AC-line name.
+        """
+        snapshot = self.snapshot_store.current
+        if snapshot is None:
+            return HTTPResponse(body="No data has been published yet.", status=503)
+
+        if "mrid" in request.query:
+            keys = _split_keys(request.query["mrid"])
+            get_records = snapshot.index.get_by_mrid
+        elif "line_emsname" in request.query:
+            keys = _split_keys(request.query["line_emsname"])
+            get_records = snapshot.index.get_by_line_emsname
+        else:
+            return HTTPResponse(body="Query parameter 'mrid' or 'line_emsname' is required.", status=400)
+
+        if not keys or len(keys) > MAX_LOOKUP_KEYS:
+            return HTTPResponse(body=f"Between 1 and {MAX_LOOKUP_KEYS} keys must be given.", status=400)
+
+        records = get_records(keys)
+        return HTTPResponse(
+            body=json.dumps({"generation": snapshot.generation, "records": records}),
+            status=200 if records else 404,
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+    def get_all_aclinesegments(self, request: HTTPRequest, format: str) -> HTTPResponse:
+        """
+        Returns all ACLineSegments in a format, or status 304 if the client has the current version.
+        """
+        snapshot = self.snapshot_store.current
+        if snapshot is None:
+            return HTTPResponse(body="No data has been published yet.", status=503)
+        if format not in snapshot.rendered:
+            return HTTPResponse(body=f"Format '{format}' is not rendered.", status=404)
+
+        rendered = snapshot.rendered[format]
+        headers = {"ETag": rendered.etag, "Cache-Control": "no-cache", "X-Generation": str(snapshot.generation)}
+        if _etag_matches(request.headers.get("if-none-match", ""), rendered.etag):
+            return HTTPResponse(status=304, headers=headers)
+
+        return HTTPResponse(body=rendered.body, content_type=rendered.content_type, headers=headers)
+
+    def get_aclinesegment_changes(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Returns ACLineSegments which were added, changed or removed since a generation.
+        """
+        try:
+            since = int(request.query["since"])
+        except (KeyError, ValueError):
+            return HTTPResponse(body="Query parameter 'since' must be a generation number.", status=400)
+
+        snapshot, diff = self.snapshot_store.changes_since(since)
+        if diff is None:
+            return HTTPResponse(
+                body=f"Changes since generation {since} are not available, all ACLineSegments must be read again.",
+                status=410,
+            )
+
+        return HTTPResponse(
+            body=json.dumps(
+                {
+                    "generation": snapshot.generation if snapshot is not None else 0,
+                    "since": since,
+                    "added": snapshot.index.get_by_mrid(diff.added) if diff.added else [],
+                    "changed": snapshot.index.get_by_mrid(diff.changed) if diff.changed else [],
+                    "removed": diff.removed,
+                }
+            ),
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+    def get_reconciliation_report(self, request: HTTPRequest) -> HTTPResponse:
+        """
+        Returns the reconciliation report of the current snapshot, see ReconciliationReport in combine_data.
+        """
+        snapshot = self.snapshot_store.current
+        if snapshot is None:
+            return HTTPResponse(body="No data has been published yet.", status=503)
+
+        report = snapshot.dataframe.attrs.get("reconciliation_report")
+        if report is None:
+            return HTTPResponse(body="No reconciliation report exists for the published data.", status=404)
+
+        return HTTPResponse(
+            body=json.dumps({"generation": snapshot.generation, "report": report}),
+            content_type=JSON_CONTENT_TYPE,
+        )
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Returns True if an entity tag in the If-None-Match header matches etag, ignoring weak validator prefixes.
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def _split_keys(value: str) -> list[str]:
+    """
+    Returns list of comma separated keys, without surrounding whitespace and empty keys.
+    """
+    return [key.strip() for key in value.split(",") if key.strip()]
@@ -0,0 +1,203 @@
+# Generic modules
+import logging
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from time import perf_counter
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+# Prefix of all metric names
+METRIC_PREFIX = "conductor_data"
+
+# Upper bounds of histogram buckets in seconds, spanning sub-millisecond lookups to minute long parses
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, float("inf"))
+
+
+class MetricsRegistry:
+    """
+    Class for collecting counters, gauges and histograms, and rendering them in Prometheus text format.
+
+    Metrics are identified by name and labels, and are created when first recorded.
+    All methods are thread safe.
+
+    Methods
+    -------
+    inc(name, value=1, labels=None, help="")
+        Increase counter.
+    set(name, value, labels=None, help="")
+        Set gauge.
+    observe(name, value, labels=None, help="")
+        Add observation to histogram.
+    time_stage(stage)
+        Context manager observing the duration of a stage.
+    snapshot()
+        Returns all recorded values, i.e. for transferring them from a worker process.
+    merge(snapshot)
+        Add recorded values from a snapshot.
+    reset()
+        Remove all recorded values.
+    render()
+        Returns all metrics in Prometheus text format.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.__lock = threading.Lock()
+        self.__types = {}
+        self.__help = {}
+        self.__values = {}
+
+    def __register(self, name: str, metric_type: str, help: str):
+        if self.__types.setdefault(name, metric_type) != metric_type:
+            raise ValueError(f"Metric '{name}' is a {self.__types[name]}, not a {metric_type}.")
+        if help:
+            self.__help[name] = help
+
+    def inc(self, name: str, value: float = 1, labels: dict = None, help: str = ""):
+        """
+        Increase counter.
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.__lock:
+            self.__register(name, "counter", help)
+            self.__values[key] = self.__values.get(key, 0) + value
+
+    def set(self, name: str, value: float, labels: dict = None, help: str = ""):
+        """
+        Set gauge.
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.__lock:
+            self.__register(name, "gauge", help)
+            self.__values[key] = value
+
+    def observe(self, name: str, value: float, labels: dict = None, help: str = ""):
+        """
+        Add observation to histogram.
+        """
+        key = (name, tuple(sorted((labels or {}).items())))
+        with self.__lock:
+            self.__register(name, "histogram", help)
+            bucket_counts, total, count = self.__values.get(key, ([0] * len(self.buckets), 0, 0))
+            bucket_counts = list(bucket_counts)
+            bucket_counts[bisect_left(self.buckets, value)] += 1
+            self.__values[key] = (bucket_counts, total + value, count + 1)
+
+    @contextmanager
+    def time_stage(self, stage: str):
+        """
+        Context manager observing the duration of a stage of the refresh pipeline in seconds.
+        The duration is also observed if the stage fails.
+        """
+        time_begin = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(
+                f"{METRIC_PREFIX}_stage_duration_seconds",
+                perf_counter() - time_begin,
+                labels={"stage": stage},
+                help="Duration of stages of the refresh pipeline.",
+            )
+
+    def snapshot(self) -> dict:
+        """
+        Returns all recorded values, i.e. for transferring them from a worker process.
+        """
+        with self.__lock:
+            return {"types": dict(self.__types), "help": dict(self.__help), "values": dict(self.__values)}
+
+    def merge(self, snapshot: dict):
+        """
+        Add recorded values from a snapshot. Counters and histograms are added, gauges are replaced.
+        """
+        with self.__lock:
+            for (name, labels), value in snapshot["values"].items():
+                metric_type = snapshot["types"][name]
+                self.__register(name, metric_type, snapshot["help"].get(name, ""))
+                key = (name, labels)
+                if metric_type == "counter":
+                    self.__values[key] = self.__values.get(key, 0) + value
+                elif metric_type == "gauge":
+                    self.__values[key] = value
+                else:
+                    bucket_counts, total, count = self.__values.get(key, ([0] * len(self.buckets), 0, 0))
+                    self.__values[key] = (
+                        [a + b for a, b in zip(bucket_counts, value[0])],
+                        total + value[1],
+                        count + value[2],
+                    )
+
+    def reset(self):
+        """
+        Remove all recorded values.
+        """
+        with self.__lock:
+            self.__types.clear()
+            self.__help.clear()
+            self.__values.clear()
+
+    def render(self) -> str:
+        """
+        Returns all metrics in Prometheus text format.
+        """
+        with self.__lock:
+            lines = []
+            for name in sorted(self.__types):
+                if name in self.__help:
+                    lines.append(f"# HELP {name} {self.__help[name]}")
+                lines.append(f"# TYPE {name} {self.__types[name]}")
+
+                for (value_name, labels), value in sorted(self.__values.items(), key=lambda item: item[0]):
+                    if value_name != name:
+                        continue
+                    if self.__types[name] != "histogram":
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+                        continue
+
+                    bucket_counts, total, count = value
+                    cumulative_count = 0
+                    for bucket, bucket_count in zip(self.buckets, bucket_counts):
+                        cumulative_count += bucket_count
+                        bucket_labels = labels + (("le", "+Inf" if bucket == float("inf") else _format_value(bucket)),)
+                        lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative_count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(total)}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {count}")
+
+            return "\n".join(lines) + "\n"
+
+
+def _format_labels(labels: tuple) -> str:
+    """
+    Returns labels in Prometheus format, i.e. '{stage="join"}'.
+    """
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label_value(value)}"' for name, value in labels) + "}"
+
+
+def _escape_label_value(value) -> str:
+    """
+    Returns label value with backslash, double quote and newline escaped.
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """
+    Returns value in Prometheus format, where whole numbers are written without decimals.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Registry used by the application
+registry = MetricsRegistry()
+
+
+def time_stage(stage: str):
+    """
+    Context manager observing the duration of a stage of the refresh pipeline in the application registry.
+    """
+    return registry.time_stage(stage)
@@ -0,0 +1,145 @@
+# Generic modules
+import logging
+import os
+import glob
+import hashlib
+import importlib.util
+import sys
+
+# Modules
+import pandas as pd
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+# Version of the cache file format, which must be bumped if the way dataframes are stored changes
+PARSE_CACHE_VERSION = 1
+
+
+class ParsedDataframeCache:
+    """
+    Class for caching parsed dataframes on disk in Parquet format.
+
+    A dataframe is cached under a key which is calculated from the hash of the content of the parsed file,
+    the parser function, the version of the parser module and the arguments given to the parser.
+    A cached dataframe is therefore only used if the same file content is parsed the same way.
+    Only the newest dataframe is kept for each parser function.
+
+    The cache requires pyarrow. If pyarrow is not installed, the cache is disabled and nothing is loaded or stored.
+
+    Attributes
+    ----------
+    cache_dir : str
+        Directory in which cached dataframes are stored.
+    enabled : bool
+        True if dataframes can be loaded from and stored to cache.
+
+    Methods
+    -------
+    get_key(file_hash, parser, parser_kwargs)
+        Returns key for a dataframe parsed from a file by a parser function.
+    load(parser, key)
+        Returns cached dataframe for key, or None if it is not cached.
+    store(parser, key, dataframe)
+        Stores dataframe in cache under key.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Parameters
+        ----------
+        cache_dir : str
+            Directory in which cached dataframes are stored. It is created if it does not exist.
+        """
+        self.cache_dir = cache_dir
+        self.enabled = importlib.util.find_spec("pyarrow") is not None
+
+        if not self.enabled:
+            log.warning("Cache of parsed dataframes is disabled, since pyarrow is not installed.")
+        else:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def get_key(self, file_hash: str, parser: callable, parser_kwargs: dict) -> str:
+        """
+        Returns key for a dataframe parsed from a file by a parser function.
+
+        Parameters
+        ----------
+        file_hash : str
+            Hash value of the content of the parsed file.
+        parser : callable
+            Function used to parse the file. Parser version is read from 'PARSER_VERSION' of its module.
+        parser_kwargs : dict
+            Arguments given to the parser function, besides the file path.
+
+        Returns
+        -------
+        str
+            Key for the cached dataframe.
+        """
+        parser_version = getattr(sys.modules.get(parser.__module__), "PARSER_VERSION", None)
+        key_source = repr(
+            (
+                PARSE_CACHE_VERSION,
+                file_hash,
+                parser.__module__,
+                parser.__qualname__,
+                parser_version,
+                sorted(parser_kwargs.items()),
+            )
+        )
+        return hashlib.blake2b(key_source.encode(), digest_size=16).hexdigest()
+
+    def load(self, parser: callable, key: str) -> pd.DataFrame:
+        """
+        Returns cached dataframe for key, or None if it is not cached or can not be read.
+        """
+        if not self.enabled:
+            return None
+
+        cache_file_path = self.__get_cache_file_path(parser=parser, key=key)
+        if not os.path.exists(cache_file_path):
+            return None
+
+        try:
+            dataframe = pd.read_parquet(cache_file_path)
+            log.info(f"Parsed dataframe was loaded from cache file '{cache_file_path}'.")
+            return dataframe
+        except Exception as e:
+            log.warning(f"Loading cache file '{cache_file_path}' failed with message: '{e}'.")
+            return None
+
+    def store(self, parser: callable, key: str, dataframe: pd.DataFrame):
+        """
+        Stores dataframe in cache under key and removes older cached dataframes of the same parser.
+
+        The dataframe is only stored if it is identical when read back, since not all dataframes
+        (i.e. columns with mixed types) can be stored in Parquet format without changes.
+        """
+        if not self.enabled:
+            return
+
+        cache_file_path = self.__get_cache_file_path(parser=parser, key=key)
+        temporary_file_path = f"{cache_file_path}.tmp"
+        try:
+            dataframe.to_parquet(temporary_file_path)
+            pd.testing.assert_frame_equal(pd.read_parquet(temporary_file_path), dataframe)
+
+            # Replace atomically, so a partially written file is never loaded
+            os.replace(temporary_file_path, cache_file_path)
+            log.debug(f"Parsed dataframe was stored in cache file '{cache_file_path}'.")
+        except Exception as e:
+            log.warning(f"Storing parsed dataframe in cache failed with message: '{e}'.")
+            if os.path.exists(temporary_file_path):
+                os.remove(temporary_file_path)
+            return
+
+        for old_cache_file_path in glob.glob(self.__get_cache_file_path(parser=parser, key="*")):
+            if old_cache_file_path != cache_file_path:
+                os.remove(old_cache_file_path)
+
+    def __get_cache_file_path(self, parser: callable, key: str) -> str:
+        """
+        Returns path of cache file for key.
+        """
+        return os.path.join(self.cache_dir, f"{parser.__qualname__}-{key}.parquet")
@@ -1,17 +1,61 @@
 # Generic modules
 import logging
-from dataclasses import dataclass
-from typing import Union
+from dataclasses import dataclass, fields
 
 # Modules
 import re
+import numpy as np
 import pandas as pd
 from singupy.conversion import kv_to_letter as convert_kv_to_letter
 import helpers.dd20_format_validation as dd20_format_validation
+from helpers.excel_reader import read_excelsheets_streaming
+from helpers.metrics import time_stage, registry as metrics_registry, METRIC_PREFIX
+from helpers.translation_memo import TranslationMemo
 
 # Initialize log
 log = logging.getLogger(__name__)
 
+"""
+Pattern of AC-line names in DD20, which does the following:
+(?P<STN1>\\w{3,4}?) makes a group 'STN1' and input a word between 3-4 chars
+(?P<STN2>\\w{3,4}?) makes a group 'STN2' and input a word between 3-4 chars
+(?P<id>\\w)? makes a group 'id' and if there is a word in the end of the name it stores it
+"""
+ACLINE_NAME_PATTERN = re.compile(r"^(?P<STN1>\w{3,4})-(?P<STN2>\w{3,4})-?(?P<id>\w)?$")
+
+# Version of the rules for translating AC-line names, which must be bumped (together with PARSER_VERSION)
+# when ACLINE_NAME_PATTERN or the translated format changes, so remembered translations are discarded
+TRANSLATION_RULES_VERSION = 1
+
+# Translations of AC-line names remembered across refreshes, keyed by DD20 name and voltage level
+TRANSLATION_MEMO = TranslationMemo(max_size=100000, rules_version=TRANSLATION_RULES_VERSION)
+
+# Version of the parser, which must be bumped when a change in parsing gives a different dataframe
+PARSER_VERSION = 1
+
+# Columns of DD20 sheets used by the parsers (with default column names), which are the only columns streamed
+DD20_STATION_DATA_COLUMNS = [
+    "Linjenavn",
+    "Spændingsniveau",
+    "Antal fasetråde",
+    "Antal systemer",
+    "Ledningstype",
+    "Temperatur",
+    "Kontinuer",
+    "15 min",
+    "1 time",
+    "40 timer",
+]
+DD20_LINE_DATA_COLUMN_RANGES = {
+    "complim_continuous_col_rng": range(41, 55),
+    "complim_15m_col_rng": range(55, 69),
+    "complim_1h_col_rng": range(69, 83),
+    "complim_40h_col_rng": range(83, 97),
+}
+DD20_LINE_DATA_COLUMNS = ["System", "Spændingsniveau", "I-kontinuert", "Antal sys."] + [
+    position for column_range in DD20_LINE_DATA_COLUMN_RANGES.values() for position in column_range
+]
+
 
 @dataclass
 class ACLineProperties:
@@ -111,6 +155,8 @@ class DD20StationDataframeParser:
         Returns dictionary with mapping from AC-line name to allowed 1 hour ampere load of cabling along the AC-line.
     get_cablelim_40h_dict()
         Returns dictionary with mapping from AC-line name to allowed 40 hour ampere load of cabling along the AC-line.
+    get_acline_properties_dataframe()
+        Returns dataframe with one row per AC-line name holding all of the above properties.
     """
 
     def __init__(
@@ -173,77 +219,85 @@ class DD20StationDataframeParser:
         # Get unique list of acline names present in dataframe
         self.acline_name_list = self.__get_acline_name_list()
 
+        # Dataframe with all properties per AC-line, created on first request
+        self.__df_station_acline_properties = None
+
+    def get_acline_properties_dataframe(self) -> pd.DataFrame:
+        """
+        Returns dataframe with one row per AC-line name (as index, in order of acline_name_list) and the columns
+        'kv_level', 'conductor_count', 'system_count', 'conductor_type', 'conductor_max_temp', 'cablelim_continuous',
+        'cablelim_15m', 'cablelim_1h' and 'cablelim_40h' holding the same values which can be fetched via the
+        dictionary methods.
+        """
+        if self.__df_station_acline_properties is None:
+            self.__df_station_acline_properties = self.__create_acline_name_to_columns_dataframe(
+                column_names={
+                    "kv_level": self.__kv_col_nm,
+                    "conductor_count": self.__conductor_count_col_nm,
+                    "system_count": self.__system_count_col_nm,
+                    "conductor_type": self.__conductor_type_col_nm,
+                    "conductor_max_temp": self.__conductor_max_temp_col_nm,
+                    "cablelim_continuous": self.__cablelim_continuous_col_nm,
+                    "cablelim_15m": self.__cablelim_15m_col_nm,
+                    "cablelim_1h": self.__cablelim_1h_col_nm,
+                    "cablelim_40h": self.__cablelim_40h_col_nm,
+                }
+            )
+        return self.__df_station_acline_properties
+
     def get_conductor_kv_level_dict(self) -> dict[str, str]:
         """
         Returns dictionary with mapping from AC-line name to voltagelevel in kV.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__kv_col_nm
-        )
+        return self.get_acline_properties_dataframe()["kv_level"].to_dict()
 
     def get_conductor_count_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to amount of conductors.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__conductor_count_col_nm
-        )
+        return self.get_acline_properties_dataframe()["conductor_count"].to_dict()
 
     def get_system_count_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to amount of parallel systems.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__system_count_col_nm
-        )
+        return self.get_acline_properties_dataframe()["system_count"].to_dict()
 
     def get_conductor_type_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to conductor type.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__conductor_type_col_nm
-        )
+        return self.get_acline_properties_dataframe()["conductor_type"].to_dict()
 
     def get_conductor_max_temp_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to max temperature.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__conductor_max_temp_col_nm
-        )
+        return self.get_acline_properties_dataframe()["conductor_max_temp"].to_dict()
 
     def get_cablelim_continuous_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to allowed continuous ampere load of cabling along the AC-line.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__cablelim_continuous_col_nm
-        )
+        return self.get_acline_properties_dataframe()["cablelim_continuous"].to_dict()
 
     def get_cablelim_15m_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to allowed 15 minutes ampere load of cabling along the AC-line.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__cablelim_15m_col_nm
-        )
+        return self.get_acline_properties_dataframe()["cablelim_15m"].to_dict()
 
     def get_cablelim_1h_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to allowed 1 hour ampere load of cabling along the AC-line.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__cablelim_1h_col_nm
-        )
+        return self.get_acline_properties_dataframe()["cablelim_1h"].to_dict()
 
     def get_cablelim_40h_dict(self) -> dict:
         """
         Returns dictionary with mapping from AC-line name to allowed 40 hour ampere load of cabling along the AC-line.
         """
-        return self.__create_acline_name_to_column_single_value_dict(
-            column_name=self.__cablelim_40h_col_nm
-        )
+        return self.get_acline_properties_dataframe()["cablelim_40h"].to_dict()
 
     def __prepare_df_station(self) -> pd.DataFrame:
         """
@@ -361,38 +415,37 @@ class DD20StationDataframeParser:
             )
             raise e
 
-    def __create_acline_name_to_column_single_value_dict(
-        self, column_name: str
-    ) -> dict[str, Union[str, float]]:
+    def __create_acline_name_to_columns_dataframe(self, column_names: dict[str, str]) -> pd.DataFrame:
         """
-        Returns dictionary with mapping from AC-line names in DD20 to corresponding value from column name.
+        Returns dataframe with mapping from AC-line names in DD20 to corresponding values from column names.
+        All columns are extracted in a single pass over the cleaned dataframe.
 
         Parameters
         ----------
-        column_name : str
-            Name of column for which value must be extracted.
+        column_names : dict[str, str]
+            Mapping from name of resulting column to name of column for which values must be extracted.
 
         Returns
         -------
-        dict[str, union(str, float)]
-            Mapping from each AC-line name to value in choosen column.
+        pd.DataFrame
+            Dataframe indexed by AC-line name (in order of acline_name_list) with a column per column name.
         """
         try:
             """
-            For each AC-line in DD20:
-            - filter dataframe so it only contains rows which have the AC-line name
-            - pick only value for column
+            For all AC-lines in DD20 at once:
+            - keep only the first row for each AC-line name
+            - pick rows in order of AC-line name list, which fails if an AC-line has no row in cleaned dataframe
             """
-            return {
-                acline_dd20name: self.__df_station_clean[
-                    self.__df_station_clean[self.__acline_name_col_nm]
-                    == acline_dd20name
-                ][column_name].values[0]
-                for acline_dd20name in self.acline_name_list
-            }
+            df_acline_first_row = self.__df_station_clean.drop_duplicates(
+                subset=self.__acline_name_col_nm, keep="first"
+            ).set_index(self.__acline_name_col_nm)
+
+            return df_acline_first_row.loc[self.acline_name_list, list(column_names.values())].set_axis(
+                list(column_names.keys()), axis="columns"
+            )
         except Exception as e:
             log.exception(
-                f"Getting data column: {column_name} in Station-data sheet failed with message: '{e}'."
+                f"Getting data columns: {column_names} in Station-data sheet failed with message: '{e}'."
             )
             raise e
 
@@ -429,6 +482,8 @@ class DD20LineDataframeParser:
         Returns dictionary with mapping from AC-line name to allowed 1 hour ampere load of components along the AC-line.
     complim_40h_dict()
         Returns dictionary with mapping from AC-line name to allowed 40 hour ampere load of components along the AC-line.
+    get_acline_min_values_dataframe()
+        Returns dataframe with one row per AC-line name holding all of the above minimum values.
     """
 
     def __init__(
@@ -483,58 +538,59 @@ class DD20LineDataframeParser:
         # Get unique list of acline names present in dataframe
         self.acline_name_list = self.__get_acline_name_list()
 
+        # Dataframe with all minimum values per AC-line, created on first request
+        self.__df_line_acline_min_values = None
+
+    def get_acline_min_values_dataframe(self) -> pd.DataFrame:
+        """
+        Returns dataframe with one row per AC-line name (as index, in order of acline_name_list) and the columns
+        'kv_level', 'acline_lim_continuous', 'complim_continuous', 'complim_15m', 'complim_1h' and 'complim_40h'
+        holding the same minimum values which can be fetched via the dictionary methods.
+        """
+        if self.__df_line_acline_min_values is None:
+            self.__df_line_acline_min_values = self.__create_acline_name_to_min_values_dataframe()
+        return self.__df_line_acline_min_values
+
     def get_conductor_kv_level_dict(self):
         """
         Returns dictionary with mapping from AC-line name to voltagelevel in kV.
         """
-        return self.__create_acline_name_to_column_min_value_dict(
-            column_name=self.__kv_col_nm
-        )
+        return self.get_acline_min_values_dataframe()["kv_level"].to_dict()
 
     def get_acline_lim_continuous_dict(self):
         """
         Returns dictionary with mapping from AC-line name to allowed
         continuous ampere load of conductor.
         """
-        return self.__create_acline_name_to_column_min_value_dict(
-            column_name=self.__acline_lim_continuous_col_nm
-        )
+        return self.get_acline_min_values_dataframe()["acline_lim_continuous"].to_dict()
 
     def get_complim_continuous_dict(self):
         """
         Returns dictionary with mapping from AC-line name to allowed
         continuous ampere load of components along the AC-line.
         """
-        return self.__create_acline_name_to_column_range_min_value_dict(
-            column_range=self.__complim_continuous_col_rng
-        )
+        return self.get_acline_min_values_dataframe()["complim_continuous"].to_dict()
 
     def get_complim_15m_dict(self):
         """
         Returns dictionary with mapping from AC-line name to
         allowed 15 minutes ampere load of components along the AC-line.
         """
-        return self.__create_acline_name_to_column_range_min_value_dict(
-            column_range=self.__complim_15m_col_rng
-        )
+        return self.get_acline_min_values_dataframe()["complim_15m"].to_dict()
 
     def get_complim_1h_dict(self):
         """
         Returns dictionary with mapping from AC-line name to allowed
         1 hour ampere load of components along the AC-line.
         """
-        return self.__create_acline_name_to_column_range_min_value_dict(
-            column_range=self.__complim_1h_col_rng
-        )
+        return self.get_acline_min_values_dataframe()["complim_1h"].to_dict()
 
     def get_complim_40h_dict(self):
         """
         Returns dictionary with mapping from AC-line name to allowed
         40 hour ampere load of components along the AC-line.
         """
-        return self.__create_acline_name_to_column_range_min_value_dict(
-            column_range=self.__complim_40h_col_rng
-        )
+        return self.get_acline_min_values_dataframe()["complim_40h"].to_dict()
 
     def __prepare_df_line(self):
         """
@@ -608,6 +664,135 @@ class DD20LineDataframeParser:
             )
             raise e
 
+    def __create_acline_name_to_min_values_dataframe(self) -> pd.DataFrame:
+        """
+        Returns dataframe with mapping from AC-line names in DD20 to the minimum value of
+        the kV column, the conductor limit column and each of the component limit column ranges.
+
+        All columns are converted to one float matrix and minimums for all AC-lines are found in one grouped
+        reduction. If the columns contain non-numeric values, the values are found per AC-line instead.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe indexed by AC-line name (in order of acline_name_list) with a column per minimum value.
+        """
+        # Positions of columns in cleaned dataframe for each of the minimum values
+        column_positions = {
+            "kv_level": [self.__df_line_clean.columns.get_loc(self.__kv_col_nm)],
+            "acline_lim_continuous": [
+                self.__df_line_clean.columns.get_loc(self.__acline_lim_continuous_col_nm)
+            ],
+            "complim_continuous": list(self.__complim_continuous_col_rng),
+            "complim_15m": list(self.__complim_15m_col_rng),
+            "complim_1h": list(self.__complim_1h_col_rng),
+            "complim_40h": list(self.__complim_40h_col_rng),
+        }
+
+        try:
+            try:
+                return self.__create_min_values_dataframe_vectorized(column_positions=column_positions)
+            except (ValueError, TypeError) as e:
+                log.warning(
+                    f"Line-data sheet contains non-numeric values ('{e}'), "
+                    + "minimum values are found per AC-line instead."
+                )
+
+            return pd.DataFrame(
+                {
+                    "kv_level": self.__create_acline_name_to_column_min_value_dict(column_name=self.__kv_col_nm),
+                    "acline_lim_continuous": self.__create_acline_name_to_column_min_value_dict(
+                        column_name=self.__acline_lim_continuous_col_nm
+                    ),
+                    "complim_continuous": self.__create_acline_name_to_column_range_min_value_dict(
+                        column_range=self.__complim_continuous_col_rng
+                    ),
+                    "complim_15m": self.__create_acline_name_to_column_range_min_value_dict(
+                        column_range=self.__complim_15m_col_rng
+                    ),
+                    "complim_1h": self.__create_acline_name_to_column_range_min_value_dict(
+                        column_range=self.__complim_1h_col_rng
+                    ),
+                    "complim_40h": self.__create_acline_name_to_column_range_min_value_dict(
+                        column_range=self.__complim_40h_col_rng
+                    ),
+                },
+                index=self.acline_name_list,
+                dtype=object,
+            )
+        except Exception as e:
+            log.exception(
+                f"Getting minimum values of columns: {column_positions} in line-data sheet failed with message: '{e}'."
+            )
+            raise e
+
+    def __create_min_values_dataframe_vectorized(self, column_positions: dict[str, list[int]]) -> pd.DataFrame:
+        """
+        Returns dataframe with mapping from AC-line names in DD20 to minimum value of each group of columns,
+        using a single grouped reduction over a float matrix of all columns.
+
+        Parameters
+        ----------
+        column_positions : dict[str, list[int]]
+            Mapping from name of resulting column to positions of the columns it is the minimum of.
+
+        Returns
+        -------
+        pd.DataFrame
+            Dataframe indexed by AC-line name (in order of acline_name_list) with a column per minimum value.
+
+        Raises
+        ------
+        ValueError
+            If the columns contain values which can not be converted to float.
+        """
+        all_positions = [position for positions in column_positions.values() for position in positions]
+        df_columns = self.__df_line_clean.iloc[:, all_positions]
+
+        # Raises ValueError if a column contains values which are not numbers
+        values = df_columns.to_numpy(dtype=float)
+
+        """
+        Reduce all rows of each AC-line to one row of minimum values by:
+        - Giving each AC-line name an integer code and sorting rows by it
+        - Using fmin, which ignores NaN unless all values are NaN, like min(skipna=True)
+        """
+        codes, acline_names = pd.factorize(self.__df_line_clean[self.__acline_name_col_nm])
+        if len(codes) > 0:
+            order = np.argsort(codes, kind="stable")
+            sorted_codes = codes[order]
+            group_starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+            group_min = np.fmin.reduceat(values[order], group_starts, axis=0)
+        else:
+            group_min = np.empty((0, len(all_positions)))
+
+        # Reduce the columns of each group to one minimum value
+        min_values = {}
+        first_column = 0
+        for column_name, positions in column_positions.items():
+            last_column = first_column + len(positions)
+            if positions:
+                column_min = np.fmin.reduce(group_min[:, first_column:last_column], axis=1)
+            else:
+                column_min = np.full(len(acline_names), np.nan)
+
+            # Excel numbers are integers if possible, so keep integers unless all source columns are float
+            keep_float = all(
+                pd.api.types.is_float_dtype(dtype) for dtype in df_columns.dtypes.iloc[first_column:last_column]
+            )
+            min_values[column_name] = pd.Series(
+                [
+                    int(value) if not keep_float and np.isfinite(value) and value.is_integer() else value
+                    for value in column_min.tolist()
+                ],
+                index=acline_names,
+                dtype=object,
+            )
+            first_column = last_column
+
+        # AC-lines without any rows get NaN, like the minimum of an empty selection
+        return pd.DataFrame(min_values, index=acline_names).reindex(self.acline_name_list)
+
     def __create_acline_name_to_column_min_value_dict(self, column_name: str):
         """
         Returns dictionary with mapping from AC-line names in DD20
@@ -687,6 +872,7 @@ def DD20_to_acline_properties_mapper(
     The data is combined per AC-line present in the objects and returned as a list of objects with one object per AC-line.
     Both objects need to contain the same AC-lines, since else a format error has occurred and properties can't be mapped.
 
+    The objects are a view of the dataframe created by DD20_to_acline_properties_dataframe.
 
     Parameters
     ----------
@@ -703,6 +889,51 @@ def DD20_to_acline_properties_mapper(
         List of objects containing combined data from station and line.
         One object will exist per AC-line.
     """
+    try:
+        acline_properties_dataframe = DD20_to_acline_properties_dataframe(
+            data_station=data_station, data_line=data_line
+        )
+
+        # Map each row of dataframe to an object of the type "ACLineProperties" dataclass.
+        acline_objects = [
+            ACLineProperties(**acline_properties)
+            for acline_properties in acline_properties_dataframe.to_dict(orient="records")
+        ]
+        return acline_objects
+
+    except Exception as e:
+        log.exception(
+            f"Mapping DD20 data from station and line data to common object failed with message: '{e}'."
+        )
+        raise e
+
+
+def DD20_to_acline_properties_dataframe(
+    data_station: DD20StationDataframeParser, data_line: DD20LineDataframeParser
+) -> pd.DataFrame:
+    """
+    DD20 station and line data is extracted from parsed objects.
+    The data is combined per AC-line present in the objects and returned as a dataframe with one row per AC-line.
+    Both objects need to contain the same AC-lines, since else a format error has occurred and properties can't be mapped.
+
+    The dataframe is assembled column by column from the per AC-line dataframes of the parsed objects,
+    and has a column for each attribute of the "ACLineProperties" dataclass (in the same order).
+
+    Parameters
+    ----------
+    data_station : class
+        Object containing station data from DD20.
+        Must be instantiated with D20StationDataframeParser.
+    data_line : class
+        Object containing line data from DD20.
+        Must be instantiated with D20LineDataframeParser.
+
+    Returns
+    -------
+    pd.DataFrame
+        Dataframe containing combined data from station and line.
+        One row will exist per AC-line.
+    """
     try:
         # Create lists with AC-Line names present in object from station and line
         station_acline_names = data_station.acline_name_list
@@ -727,58 +958,44 @@ def DD20_to_acline_properties_mapper(
                 + f"but not station sheet of DD20: {names_in_line_but_not_station}."
             )
 
-        # Initialize AC-Line properties mapping dictionaries via methods on objects
-        acline_name_to_conductor_count = data_station.get_conductor_count_dict()
-        acline_name_to_system_count = data_station.get_system_count_dict()
-        acline_name_to_conductor_type = data_station.get_conductor_type_dict()
-        acline_name_to_conductor_max_temp = data_station.get_conductor_max_temp_dict()
-        acline_name_to_cablelim_continuous = data_station.get_cablelim_continuous_dict()
-        acline_name_to_cablelim_15m = data_station.get_cablelim_15m_dict()
-        acline_name_to_cablelim_1h = data_station.get_cablelim_1h_dict()
-        acline_name_to_cablelim_40h = data_station.get_cablelim_40h_dict()
-        acline_name_to_lim_continuous = data_line.get_acline_lim_continuous_dict()
-        acline_name_to_complim_continuous = data_line.get_complim_continuous_dict()
-        acline_name_to_complim_15m = data_line.get_complim_15m_dict()
-        acline_name_to_complim_1h = data_line.get_complim_1h_dict()
-        acline_name_to_complim_40h = data_line.get_complim_40h_dict()
-
-        # Init kV mapping dict (name list verified identical, so okay to just use one of them)
+        # Dataframes with AC-Line properties, both indexed by AC-line name (name list verified identical)
+        df_station_properties = data_station.get_acline_properties_dataframe()
+        df_line_min_values = data_line.get_acline_min_values_dataframe().reindex(station_acline_names)
+
+        # Init kV mapping dict
         st_acline_name_to_conductor_kv_level = (
             data_station.get_conductor_kv_level_dict()
         )
 
         """
-        Translation of AC-line names from DD20 datasource to desired format using Regex.
+        Translation of AC-line names from DD20 datasource to desired format using Regex (see ACLINE_NAME_PATTERN).
         I.e 132 kV line with data source name "EEE-FFF-2" is translated to "E_EEE-FFF_2"
 
-        Regex expression does the following:
-        (?P<STN1>\\w{3,4}?) makes a group 'STN1' and input a word between 3-4 chars
-        (?P<STN2>\\w{3,4}?) makes a group 'STN2' and input a word between 3-4 chars
-        (?P<id>\\w)? makes a group 'id' and if there is a word in the end of the name it stores it
+        Translations are remembered across refreshes, so only new names (or names with a new voltage level)
+        are translated.
         """
-        acline_name_to_translated_name = {}
-        untranslated_acline_names = []
-        REGEX = r"^(?P<STN1>\w{3,4})-(?P<STN2>\w{3,4})-?(?P<id>\w)?$"
-
-        for acline_dd20name in station_acline_names:
-            match = re.match(REGEX, acline_dd20name)
-            if match:
-                # Converting the extracted voltage to a letter
-                volt_letter = f"{convert_kv_to_letter(st_acline_name_to_conductor_kv_level[acline_dd20name])}"
-
-                # Restructuring name to agreed upon standard
-                translated_ac_line_name = (
-                    f"{volt_letter}_{match.group('STN1')}-{match.group('STN2')}"
+        with time_stage("dd20_name_translation"):
+            acline_dd20names = pd.Series(station_acline_names, dtype=object)
+            kv_levels = acline_dd20names.map(st_acline_name_to_conductor_kv_level)
+            memo_keys = list(zip(acline_dd20names, kv_levels))
+
+            TRANSLATION_MEMO.use_rules_version(TRANSLATION_RULES_VERSION)
+            translated_acline_names = pd.Series(TRANSLATION_MEMO.get_many(memo_keys), dtype=object)
+            missing_mask = translated_acline_names.isna()
+            _count_translation_memo_lookups(hits=int((~missing_mask).sum()), misses=int(missing_mask.sum()))
+
+            if missing_mask.any():
+                translated_acline_names[missing_mask] = _translate_acline_names(
+                    acline_dd20names=acline_dd20names[missing_mask], kv_levels=kv_levels[missing_mask]
+                )
+                TRANSLATION_MEMO.put_many(
+                    {
+                        memo_keys[position]: translated_acline_names[position]
+                        for position in np.flatnonzero(missing_mask & translated_acline_names.notna())
+                    }
                 )
 
-                # Add index of line to name, if it is present
-                if match.group("id") is not None:
-                    translated_ac_line_name += f"_{match.group('id')}"
-                acline_name_to_translated_name[
-                    acline_dd20name
-                ] = translated_ac_line_name
-            else:
-                untranslated_acline_names.append(acline_dd20name)
+            untranslated_acline_names = acline_dd20names[translated_acline_names.isna()].tolist()
 
         # Throw an error if there are untranslated names, as it indicates a format error
         if untranslated_acline_names:
@@ -788,39 +1005,42 @@ def DD20_to_acline_properties_mapper(
         else:
             log.info("All names from the acline_dd20name column have been translated.")
 
-        # Map station and line data to list with objects of the type "ACLineProperties" dataclass.
-        acline_objects = [
-            ACLineProperties(
-                acline_name_translated=acline_name_to_translated_name[acline_dd20name],
-                acline_name_datasource=acline_dd20name,
-                datasource="DD20",
-                conductor_type=acline_name_to_conductor_type[acline_dd20name],
-                conductor_count=acline_name_to_conductor_count[acline_dd20name],
-                system_count=acline_name_to_system_count[acline_dd20name],
-                max_temperature=acline_name_to_conductor_max_temp[acline_dd20name],
-                restrict_cable_lim_continuous=acline_name_to_cablelim_continuous[
-                    acline_dd20name
-                ],
-                restrict_cable_lim_15m=acline_name_to_cablelim_15m[acline_dd20name],
-                restrict_cable_lim_1h=acline_name_to_cablelim_1h[acline_dd20name],
-                restrict_cable_lim_40h=acline_name_to_cablelim_40h[acline_dd20name],
-                restrict_conductor_lim_continuous=acline_name_to_lim_continuous[
-                    acline_dd20name
-                ],
-                restrict_component_lim_continuous=acline_name_to_complim_continuous[
-                    acline_dd20name
-                ],
-                restrict_component_lim_15m=acline_name_to_complim_15m[acline_dd20name],
-                restrict_component_lim_1h=acline_name_to_complim_1h[acline_dd20name],
-                restrict_component_lim_40h=acline_name_to_complim_40h[acline_dd20name],
-            )
-            for acline_dd20name in station_acline_names
-        ]
-        return acline_objects
+        """
+        Assemble dataframe from columns aligned on the AC-line name list:
+        - Name and datasource columns are strings, so they are created with object dtype
+        - Property columns keep the values parsed from DD20 and get the dtype inferred from them,
+          i.e. int64 for whole numbers, float64 if values are missing and object for text
+        """
+        acline_properties_columns = {
+            "acline_name_translated": translated_acline_names.to_numpy(),
+            "acline_name_datasource": station_acline_names,
+            "datasource": ["DD20"] * len(station_acline_names),
+            "conductor_type": df_station_properties["conductor_type"],
+            "conductor_count": df_station_properties["conductor_count"],
+            "system_count": df_station_properties["system_count"],
+            "max_temperature": df_station_properties["conductor_max_temp"],
+            "restrict_conductor_lim_continuous": df_line_min_values["acline_lim_continuous"],
+            "restrict_component_lim_continuous": df_line_min_values["complim_continuous"],
+            "restrict_component_lim_15m": df_line_min_values["complim_15m"],
+            "restrict_component_lim_1h": df_line_min_values["complim_1h"],
+            "restrict_component_lim_40h": df_line_min_values["complim_40h"],
+            "restrict_cable_lim_continuous": df_station_properties["cablelim_continuous"],
+            "restrict_cable_lim_15m": df_station_properties["cablelim_15m"],
+            "restrict_cable_lim_1h": df_station_properties["cablelim_1h"],
+            "restrict_cable_lim_40h": df_station_properties["cablelim_40h"],
+        }
+
+        # Columns are ordered as the attributes of the "ACLineProperties" dataclass
+        return pd.DataFrame(
+            {
+                field.name: np.asarray(acline_properties_columns[field.name], dtype=object)
+                for field in fields(ACLineProperties)
+            }
+        ).infer_objects()
 
     except Exception as e:
         log.exception(
-            f"Mapping DD20 data from station and line data to common object failed with message: '{e}'."
+            f"Mapping DD20 data from station and line data to common dataframe failed with message: '{e}'."
         )
         raise e
 
@@ -831,8 +1051,9 @@ def parse_dd20_excelsheets_to_dataframe(
     line_data_valid_hash: str,
     header_index: int = 1,
     sheetname_linedata: str = "Linjedata - Sommer",
-    sheetname_stationsdata: str = "Stationsdata"
-    
+    sheetname_stationsdata: str = "Stationsdata",
+    streaming: bool = False,
+    engine: str = None,
 ) -> pd.DataFrame:
     """
     Extract conductor data from DD20 excel-sheets and return it to one combined dataframe.
@@ -854,39 +1075,133 @@ def parse_dd20_excelsheets_to_dataframe(
     station_data_valid_hash : str
         Hash value of the header rows in the dd20 station sheet,
         used to detect a change in file format.
+    streaming : bool, Default = False
+        (optional) If True, rows of the two sheets are streamed from a read-only workbook,
+        keeping only the columns used by the parsers. Result is identical to reading the sheets in full.
+        Streaming always uses openpyxl, so engine is not used when streaming.
+    engine : str, Default = None
+        (optional) Engine used by pd.read_excel, i.e. "openpyxl" or "calamine". If None pandas picks the engine.
     Returns
     -------
     pd.Dataframe
         Dataframe containg selected data from DD20, where each row represents an AC-line.
     """
-    # Parsing data from DD20 to dataframe dictionary, with mapping from sheet to dataframe
-    dd20_dataframe_dict = pd.read_excel(
-        io=file_path,
-        sheet_name=[sheetname_linedata, sheetname_stationsdata],
-        header=header_index,
-    )
+    with time_stage("dd20_read"):
+        if streaming:
+            # Streaming data from DD20 to dataframe dictionary, with only the columns used by the parsers
+            dd20_sheets = read_excelsheets_streaming(
+                file_path=file_path,
+                sheet_columns={
+                    sheetname_linedata: DD20_LINE_DATA_COLUMNS,
+                    sheetname_stationsdata: DD20_STATION_DATA_COLUMNS,
+                },
+                header_index=header_index,
+            )
+            dd20_dataframe_dict = {sheetname: dd20_sheet.dataframe for sheetname, dd20_sheet in dd20_sheets.items()}
+            dd20_header_columns = {sheetname: dd20_sheet.header_columns for sheetname, dd20_sheet in dd20_sheets.items()}
 
-    if not dd20_format_validation.validate_dd20_format(dd20_dataframe_dict[sheetname_stationsdata], station_data_valid_hash):
+            # Column ranges of line data must point to the same columns in the dataframe with fewer columns
+            line_data_column_ranges = {
+                column_range_parameter: _remap_column_range(
+                    column_range=column_range, column_positions=dd20_sheets[sheetname_linedata].column_positions
+                )
+                for column_range_parameter, column_range in DD20_LINE_DATA_COLUMN_RANGES.items()
+            }
+        else:
+            # Parsing data from DD20 to dataframe dictionary, with mapping from sheet to dataframe
+            dd20_dataframe_dict = pd.read_excel(
+                io=file_path,
+                sheet_name=[sheetname_linedata, sheetname_stationsdata],
+                header=header_index,
+                engine=engine,
+            )
+            dd20_header_columns = {
+                sheetname: list(dd20_dataframe.columns) for sheetname, dd20_dataframe in dd20_dataframe_dict.items()
+            }
+            line_data_column_ranges = {}
+
+    with time_stage("dd20_header_validation"):
+        station_header_valid = dd20_format_validation.validate_dd20_header_format(
+            dd20_header_columns[sheetname_stationsdata], station_data_valid_hash
+        )
+    if not station_header_valid:
         error_message = f"Invalid dd20 file format detected for {sheetname_stationsdata}"
         raise dd20_format_validation.DD20FormatError(error_message)
 
     # Instantiation of objects for parsing data from station and line sheets of DD20
-    data_station = DD20StationDataframeParser(
-        df_station=dd20_dataframe_dict[sheetname_stationsdata]
-    )
+    with time_stage("dd20_station_cleaning"):
+        data_station = DD20StationDataframeParser(
+            df_station=dd20_dataframe_dict[sheetname_stationsdata]
+        )
 
-    if not dd20_format_validation.validate_dd20_format(dd20_dataframe_dict[sheetname_linedata], line_data_valid_hash):
+    with time_stage("dd20_header_validation"):
+        line_header_valid = dd20_format_validation.validate_dd20_header_format(
+            dd20_header_columns[sheetname_linedata], line_data_valid_hash
+        )
+    if not line_header_valid:
         error_message = f"Invalid dd20 file format detected for {sheetname_linedata}"
         raise dd20_format_validation.DD20FormatError(error_message)
 
-    data_line = DD20LineDataframeParser(df_line=dd20_dataframe_dict[sheetname_linedata])
+    with time_stage("dd20_line_cleaning"):
+        data_line = DD20LineDataframeParser(df_line=dd20_dataframe_dict[sheetname_linedata], **line_data_column_ranges)
+
+    # Combining station and line data into a dataframe, where each row represents an AC-line
+    with time_stage("dd20_mapper"):
+        dd20_dataframe = DD20_to_acline_properties_dataframe(
+            data_station=data_station, data_line=data_line
+        )
+
+    return dd20_dataframe
+
+
+def _translate_acline_names(acline_dd20names: pd.Series, kv_levels: pd.Series) -> pd.Series:
+    """
+    Returns AC-line names translated from DD20 datasource names to the agreed upon standard.
+    I.e 132 kV line with data source name "EEE-FFF-2" is translated to "E_EEE-FFF_2"
+
+    All names are matched at once, and voltage levels are converted to letters once per unique voltage level.
+    Names which do not match ACLINE_NAME_PATTERN are NaN.
+    """
+    name_parts = acline_dd20names.str.extract(ACLINE_NAME_PATTERN)
+    untranslated_mask = name_parts["STN1"].isna()
+
+    # Converting the extracted voltage to a letter
+    matched_kv_levels = kv_levels[~untranslated_mask]
+    kv_level_to_letter = {kv_level: f"{convert_kv_to_letter(kv_level)}" for kv_level in matched_kv_levels.unique()}
+    volt_letters = matched_kv_levels.map(kv_level_to_letter).astype(object)
+
+    # Restructuring name to agreed upon standard, with index of line added if it is present
+    return (
+        volt_letters
+        + "_"
+        + name_parts["STN1"]
+        + "-"
+        + name_parts["STN2"]
+        + ("_" + name_parts["id"]).fillna("")
+    )
+
 
-    # Combining station and line data into a list of objects, where each object represents an AC-line
-    acline_objects = DD20_to_acline_properties_mapper(
-        data_station=data_station, data_line=data_line
+def _count_translation_memo_lookups(hits: int, misses: int):
+    """
+    Count lookups of AC-line names in the translation memo.
+    """
+    metrics_registry.inc(
+        f"{METRIC_PREFIX}_translation_memo_hits_total",
+        hits,
+        help="AC-line names found in the translation memo.",
+    )
+    metrics_registry.inc(
+        f"{METRIC_PREFIX}_translation_memo_misses_total",
+        misses,
+        help="AC-line names not found in the translation memo, which were translated.",
     )
 
-    # Creating dataframe from list of objects
-    dd20_dataframe = pd.DataFrame(data=[acline.__dict__ for acline in acline_objects])
 
-    return dd20_dataframe
+def _remap_column_range(column_range: range, column_positions: list[int]) -> range:
+    """
+    Returns range of columns in a dataframe holding only some columns of a sheet,
+    where column_positions holds the position in the sheet of each column in the dataframe.
+    """
+    if not column_range:
+        return range(0)
+    return range(column_positions.index(column_range[0]), column_positions.index(column_range[-1]) + 1)
@@ -1,19 +1,94 @@
 # Generic modules
 import logging
+import re
+import warnings
+import importlib.util
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Iterator
 
 # Modules
 from singupy.verification import dataframe_columns as verify_df_columns
+import numpy as np
 import pandas as pd
+from pandas.errors import ParserWarning
+
+# App modules
+from helpers.metrics import time_stage, registry as metrics_registry, METRIC_PREFIX
 
 # Initialize log
 log = logging.getLogger(__name__)
 
+# Version of the parser, which must be bumped when a change in parsing gives a different dataframe
+PARSER_VERSION = 2
+
+# Values read as missing, which are the default missing values of pandas.read_csv
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+CSV_ENGINES = ["auto", "pyarrow", "c"]
+
+
+# Approximate size in bytes of a row in the CSV-file, for reading chunks of a size in bytes with pandas
+CSV_ROW_SIZE = 64
+
+# Minimum size in bytes of chunks, so a chunk holds the header and many whole rows
+MIN_CHUNK_SIZE = 1 << 16
+
+# Maximum amount of skipped rows and unexpected values kept as samples in parse statistics
+MAX_PARSE_STATS_SAMPLES = 5
+
+# Pattern of a skipped row in warnings from pandas, i.e. "Skipping line 4: expected 3 fields, saw 4"
+PANDAS_SKIPPED_ROW_PATTERN = re.compile(r"Skipping line (\d+): expected (\d+) fields, saw (\d+)")
+
+
+@dataclass
+class CSVParseStats:
+    """
+    Class for representing the quality of parsed CSV-data, which is stored in 'parse_stats' of the dataframe attrs.
+
+    Attributes
+    ----------
+    skipped_row_count : int
+        Amount of rows skipped since they have too many values.
+    skipped_row_samples : list[str]
+        Descriptions of the first skipped rows, i.e. "line 4: expected 3 fields, saw 4".
+        Rows skipped by pyarrow are described with their text, i.e. "line 4: expected 3 fields, saw 4: 'a,b,c,d'".
+        When pyarrow reads the whole file at once it is read multithreaded, so line numbers are unknown
+        (i.e. "line: expected 3 fields, saw 4: 'a,b,c,d'"), and the samples are the first skipped rows found,
+        which are not necessarily the first in the file.
+    unexpected_dlr_enabled_count : int
+        Amount of rows with a DLR enabled value which is neither "YES" nor "NO" (these are DLR enabled).
+    unexpected_dlr_enabled_samples : list[str]
+        The first unique unexpected DLR enabled values.
+    """
+
+    skipped_row_count: int = 0
+    skipped_row_samples: list = field(default_factory=list)
+    unexpected_dlr_enabled_count: int = 0
+    unexpected_dlr_enabled_samples: list = field(default_factory=list)
+
+    def add_skipped_row(self, description: str):
+        self.skipped_row_count += 1
+        if len(self.skipped_row_samples) < MAX_PARSE_STATS_SAMPLES:
+            self.skipped_row_samples.append(description)
+
+    def add_unexpected_dlr_enabled(self, values: pd.Series):
+        self.unexpected_dlr_enabled_count += len(values)
+        for value in values.unique()[:MAX_PARSE_STATS_SAMPLES]:
+            if len(self.unexpected_dlr_enabled_samples) < MAX_PARSE_STATS_SAMPLES:
+                self.unexpected_dlr_enabled_samples.append(str(value))
+
 
 def parse_aclineseg_scada_csvdata_to_dataframe(
     file_path: str,
     aclinesegment_mrid_col_nm: str = "ACLINESEGMENT_MRID",
     acline_name_col_nm: str = "LINE_EMSNAME",
     dlr_enabled_col_nm: str = "DLR_ENABLED",
+    engine: str = "auto",
+    chunk_size: int = 0,
 ) -> pd.DataFrame:
     """
     Parse data from non-standard CSV-file format to dataframe.
@@ -21,6 +96,12 @@ def parse_aclineseg_scada_csvdata_to_dataframe(
     An example of the file can be seen in the repo subfolder:
     "/tests/valid-testdata/seg_line_mrid.csv"
 
+    The row after the header only contains hyphens and is skipped, and rows with too many values are skipped.
+    MRID, name and DLR enabled columns are read as strings, and DLR enabled is False for "NO" and otherwise True.
+
+    If chunk_size is given the file is read in chunks, and only the MRID, name and DLR enabled columns
+    are kept of each chunk, so memory used while reading is bounded by the chunk size and not the file size.
+
     Parameters
     ----------
     file_path : str
@@ -31,44 +112,53 @@ def parse_aclineseg_scada_csvdata_to_dataframe(
         (optional) Name of column which contains Line Name.
     dlr_enabled_col_nm : str, Default = "DLR_ENABLED"
         (optional) Name of column which contains DLR enabled flag.
+    engine : str, Default = "auto"
+        (optional) CSV reader, "pyarrow", "c" (pandas) or "auto" (pyarrow if it is installed).
+        The pandas reader is used if the file has rows with too few values, since pyarrow can not read them,
+        and if the file is read in chunks and a column is missing, so the error is the same for both readers.
+    chunk_size : int, Default = 0
+        (optional) Size in bytes of chunks the file is read in, at least 64 KiB. If 0 the whole file is read at once.
 
     Returns
     -------
     pd.Dataframe
-        Dataframe containg data from CSV-file.
+        Dataframe containg data from CSV-file, with statistics of skipped rows and unexpected DLR enabled values
+        in attrs["parse_stats"] (see CSVParseStats).
     """
     try:
-        # Read data from CSV to dataframe and drop row with index 1 as it contains only hyphens
-        aclineseg_scada_dataframe = pd.read_csv(
-            file_path, delimiter=",", on_bad_lines="skip", encoding="cp1252"
-        )
-        aclineseg_scada_dataframe.drop(
-            aclineseg_scada_dataframe.head(1).index, inplace=True
-        )
+        if engine not in CSV_ENGINES:
+            raise ValueError(f"CSV engine '{engine}' is not one of {CSV_ENGINES}.")
 
-        # Resetting index to start from 0
-        aclineseg_scada_dataframe.reset_index(drop=True, inplace=True)
-
-        # Replace yes/no with True/False and set datatype to boolean
-        aclineseg_scada_dataframe.loc[aclineseg_scada_dataframe[dlr_enabled_col_nm] == "YES", dlr_enabled_col_nm] = True
-        aclineseg_scada_dataframe.loc[aclineseg_scada_dataframe[dlr_enabled_col_nm] == "NO", dlr_enabled_col_nm] = False
-        aclineseg_scada_dataframe = aclineseg_scada_dataframe.astype({dlr_enabled_col_nm: bool})
-
-        # verify that expected columns are present
-        verify_df_columns(
-            dataframe=aclineseg_scada_dataframe,
-            expected_columns=[
-                aclinesegment_mrid_col_nm,
-                acline_name_col_nm,
-                dlr_enabled_col_nm,
-            ],
-            allow_extra_columns=True,
-        )
+        string_columns = [aclinesegment_mrid_col_nm, acline_name_col_nm, dlr_enabled_col_nm]
+        with time_stage("mrid_read"):
+            chunks = None
+            if engine == "pyarrow" or (engine == "auto" and importlib.util.find_spec("pyarrow") is not None):
+                try:
+                    parse_stats = CSVParseStats()
+                    chunks = _prepare_csv_chunks(
+                        _read_csv_chunks_pyarrow(file_path, string_columns, chunk_size, parse_stats),
+                        string_columns,
+                        chunk_size,
+                        parse_stats,
+                    )
+                except _PyarrowCannotRead as e:
+                    log.debug(f"CSV-file {file_path} can not be read with pyarrow ({e}), and is read with pandas.")
+            if chunks is None:
+                parse_stats = CSVParseStats()
+                chunks = _prepare_csv_chunks(
+                    _read_csv_chunks_pandas(file_path, string_columns, chunk_size, parse_stats),
+                    string_columns,
+                    chunk_size,
+                    parse_stats,
+                )
+            aclineseg_scada_dataframe = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+        _report_parse_stats(file_path=file_path, parse_stats=parse_stats)
+        aclineseg_scada_dataframe.attrs["parse_stats"] = asdict(parse_stats)
 
         log.info(f'ACLineSegment csv-data from "{file_path}" was parsed to dataframe.')
-        log.debug(
-            f"Data from csv-file {file_path} is: {aclineseg_scada_dataframe.to_string()}"
-        )
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Data from csv-file {file_path} is: {aclineseg_scada_dataframe.to_string()}")
 
         return aclineseg_scada_dataframe
 
@@ -77,3 +167,194 @@ def parse_aclineseg_scada_csvdata_to_dataframe(
             f'Parsing ACLineSegment csv-data from: "{file_path}" failed with message: {e}.'
         )
         raise e
+
+
+class _PyarrowCannotRead(Exception):
+    """
+    Raised by the pyarrow reader, when the file must be read with pandas to give the same result.
+    """
+
+
+def _report_parse_stats(file_path: str, parse_stats: CSVParseStats):
+    """
+    Count skipped rows and unexpected DLR enabled values in metrics, and log a warning if there are any.
+    """
+    metrics_registry.inc(
+        f"{METRIC_PREFIX}_mrid_skipped_rows_total",
+        parse_stats.skipped_row_count,
+        help="Rows of MRID mapping csv-file skipped since they have too many values.",
+    )
+    metrics_registry.inc(
+        f"{METRIC_PREFIX}_mrid_unexpected_dlr_enabled_total",
+        parse_stats.unexpected_dlr_enabled_count,
+        help="Rows of MRID mapping csv-file with a DLR enabled value which is neither YES nor NO.",
+    )
+
+    if parse_stats.skipped_row_count:
+        log.warning(
+            f'{parse_stats.skipped_row_count} rows of csv-file "{file_path}" were skipped since they have too many '
+            + f"values, i.e. {parse_stats.skipped_row_samples}."
+        )
+    if parse_stats.unexpected_dlr_enabled_count:
+        log.warning(
+            f'{parse_stats.unexpected_dlr_enabled_count} rows of csv-file "{file_path}" have a DLR enabled value '
+            + f"which is neither YES nor NO and are DLR enabled, i.e. {parse_stats.unexpected_dlr_enabled_samples}."
+        )
+
+
+def _prepare_csv_chunks(
+    chunks: Iterator[pd.DataFrame], string_columns: list[str], chunk_size: int, parse_stats: CSVParseStats
+) -> list:
+    """
+    Verify columns of the first chunk and convert DLR enabled to boolean in each chunk.
+    If the file is read in chunks, only the MRID, name and DLR enabled columns are kept.
+    DLR enabled values which are neither "YES" nor "NO" are counted in parse_stats.
+    """
+    prepared_chunks = []
+    for chunk in chunks:
+        if not prepared_chunks:
+            # verify that expected columns are present
+            verify_df_columns(dataframe=chunk, expected_columns=string_columns, allow_extra_columns=True)
+
+        if chunk_size:
+            chunk = chunk[string_columns].copy()
+
+        # Replace yes/no with True/False, where any value but "NO" is True
+        dlr_enabled_col_nm = string_columns[-1]
+        is_dlr_enabled = chunk[dlr_enabled_col_nm].ne("NO")
+        is_unexpected = is_dlr_enabled & chunk[dlr_enabled_col_nm].ne("YES")
+        if is_unexpected.any():
+            parse_stats.add_unexpected_dlr_enabled(chunk.loc[is_unexpected, dlr_enabled_col_nm])
+        chunk[dlr_enabled_col_nm] = is_dlr_enabled
+        prepared_chunks.append(chunk)
+
+    return prepared_chunks
+
+
+def _read_csv_chunks_pyarrow(
+    file_path: str, string_columns: list[str], chunk_size: int, parse_stats: CSVParseStats
+) -> Iterator[pd.DataFrame]:
+    """
+    Read CSV-file with pyarrow, skipping the row after the header and rows with too many values.
+    The whole file is a single chunk if chunk_size is 0, otherwise only the MRID, name and DLR enabled columns are read.
+    Raises _PyarrowCannotRead if the file has rows with too few values, which pandas fills with missing values,
+    or if a column is missing when reading chunks.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+
+    short_row_count = 0
+
+    def handle_invalid_row(row) -> str:
+        nonlocal short_row_count
+        if row.actual_columns < row.expected_columns:
+            short_row_count += 1
+        else:
+            # Line numbers are only known when reading in chunks, since the whole file is read multithreaded,
+            # as described in CSVParseStats
+            line = f"line {row.number}" if row.number is not None else "line"
+            parse_stats.add_skipped_row(
+                f"{line}: expected {row.expected_columns} fields, saw {row.actual_columns}: {row.text!r}"
+            )
+        return "skip"
+
+    read_options = pa_csv.ReadOptions(encoding="cp1252", skip_rows_after_names=1)
+    parse_options = pa_csv.ParseOptions(delimiter=",", invalid_row_handler=handle_invalid_row)
+    convert_options = pa_csv.ConvertOptions(
+        column_types={column_name: pa.string() for column_name in string_columns},
+        null_values=NA_VALUES,
+        strings_can_be_null=True,
+    )
+
+    if chunk_size:
+        # Only columns used are read, so types of other columns are not inferred from the first chunk
+        read_options.block_size = max(chunk_size, MIN_CHUNK_SIZE)
+        convert_options.include_columns = string_columns
+        try:
+            reader = pa_csv.open_csv(
+                file_path, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+            )
+        except KeyError as e:
+            raise _PyarrowCannotRead(f"column is missing: {e}")
+        tables = (pa.Table.from_batches([batch]) for batch in reader)
+        empty_table = reader.schema.empty_table()
+    else:
+        table = pa_csv.read_csv(
+            file_path, read_options=read_options, parse_options=parse_options, convert_options=convert_options
+        )
+        tables = [table]
+        empty_table = None
+
+    chunk_count = 0
+    for table in tables:
+        if short_row_count:
+            break
+        chunk_count += 1
+        yield _table_to_dataframe(table)
+
+    if short_row_count:
+        raise _PyarrowCannotRead(f"{short_row_count} or more rows have too few values")
+    if chunk_count == 0:
+        yield _table_to_dataframe(empty_table)
+
+
+def _table_to_dataframe(table) -> pd.DataFrame:
+    """
+    Returns pyarrow table as dataframe, with missing strings as NaN (they are None in pyarrow) as in pandas.
+    """
+    dataframe = table.to_pandas()
+    for column_name in table.column_names:
+        if table.column(column_name).null_count and dataframe[column_name].dtype == object:
+            dataframe[column_name] = dataframe[column_name].fillna(np.nan)
+    return dataframe
+
+
+def _read_csv_chunks_pandas(
+    file_path: str, string_columns: list[str], chunk_size: int, parse_stats: CSVParseStats
+) -> Iterator[pd.DataFrame]:
+    """
+    Read CSV-file with pandas, skipping the row after the header and rows with too many values.
+    The whole file is a single chunk if chunk_size is 0.
+
+    Skipped rows are counted from the warnings pandas gives for them, so the fast C reader can be used
+    (a callable bad line handler requires the python reader).
+    """
+    csv_options = dict(
+        delimiter=",",
+        on_bad_lines="warn",
+        encoding="cp1252",
+        skiprows=[1],
+        dtype={column_name: str for column_name in string_columns},
+    )
+    if not chunk_size:
+        with _count_skipped_rows(parse_stats):
+            chunk = pd.read_csv(file_path, **csv_options)
+        yield chunk
+        return
+
+    with pd.read_csv(file_path, chunksize=max(chunk_size, MIN_CHUNK_SIZE) // CSV_ROW_SIZE, **csv_options) as reader:
+        while True:
+            with _count_skipped_rows(parse_stats):
+                chunk = next(reader, None)
+            if chunk is None:
+                return
+            yield chunk
+
+
+@contextmanager
+def _count_skipped_rows(parse_stats: CSVParseStats):
+    """
+    Context manager counting rows skipped by pandas in parse_stats, instead of showing the warnings.
+    """
+    with warnings.catch_warnings(record=True) as caught_warnings:
+        warnings.simplefilter("always", ParserWarning)
+        yield
+
+    for caught_warning in caught_warnings:
+        if not issubclass(caught_warning.category, ParserWarning):
+            warnings.warn_explicit(
+                caught_warning.message, caught_warning.category, caught_warning.filename, caught_warning.lineno
+            )
+            continue
+        for match in PANDAS_SKIPPED_ROW_PATTERN.finditer(str(caught_warning.message)):
+            parse_stats.add_skipped_row(f"line {match[1]}: expected {match[2]} fields, saw {match[3]}")
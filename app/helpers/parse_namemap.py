@@ -5,15 +5,22 @@ import logging
 from singupy.verification import dataframe_columns as verify_df_columns
 import pandas as pd
 
+# App modules
+from helpers.metrics import time_stage
+
 # Initialize log
 log = logging.getLogger(__name__)
 
+# Version of the parser, which must be bumped when a change in parsing gives a different dataframe
+PARSER_VERSION = 1
+
 
 def parse_acline_namemap_excelsheet_to_dataframe(
     file_path: str,
     excel_sheet_name: str = "DD20Mapping",
     dd20_name_col_nm: str = "DD20 Name",
     scada_name_col_nm: str = "ETS Name",
+    engine: str = None,
 ) -> pd.DataFrame:
     """
     Extract manual name mapping from excel-sheet and return it to dataframe.
@@ -33,6 +40,8 @@ def parse_acline_namemap_excelsheet_to_dataframe(
         (optional) Name of column which contains DD20 name.
     scada_name_col_nm : str, Default = "ETS Name"
         (optional) Name of column which contains SCADA name.
+    engine : str, Default = None
+        (optional) Engine used by pd.read_excel, i.e. "openpyxl" or "calamine". If None pandas picks the engine.
 
     Returns
     -------
@@ -41,10 +50,10 @@ def parse_acline_namemap_excelsheet_to_dataframe(
     """
     try:
         # parse data from excel to dataframe
-        acline_namemap_dataframe = pd.read_excel(file_path, sheet_name=excel_sheet_name)
-        log.debug(
-            f"Data from excel-file {file_path} is: {acline_namemap_dataframe.to_string()}"
-        )
+        with time_stage("namemap_read"):
+            acline_namemap_dataframe = pd.read_excel(file_path, sheet_name=excel_sheet_name, engine=engine)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Data from excel-file {file_path} is: {acline_namemap_dataframe.to_string()}")
 
         # verify that expected columns are present
         verify_df_columns(
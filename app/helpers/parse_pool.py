@@ -0,0 +1,113 @@
+# Generic modules
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# App modules
+from helpers import metrics
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+LOGFORMAT = "%(levelname)s:%(asctime)s:%(processName)s:%(name)s - %(message)s"
+
+
+class ParsePool:
+    """
+    Class for parsing input files in parallel, in a pool of worker processes.
+
+    Worker processes are started with 'spawn', since the application runs threads (API and refresh worker)
+    which must not be forked. They are started on first use and kept, so the cost of starting
+    them and importing pandas is only paid once.
+    Metrics recorded while parsing in a worker process are added to the metrics registry of this process.
+
+    Methods
+    -------
+    parse(parse_tasks)
+        Parse files in parallel and return a dataframe or an exception for each task.
+    close()
+        Shut down worker processes.
+    """
+
+    def __init__(self, max_workers: int):
+        """
+        Parameters
+        ----------
+        max_workers : int
+            Maximum number of worker processes.
+        """
+        self.max_workers = max_workers
+        self.__executor = None
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_initialize_worker,
+                initargs=(logging.getLogger().getEffectiveLevel(),),
+            )
+        return self.__executor
+
+    def parse(self, parse_tasks: dict) -> dict:
+        """
+        Parse files in parallel.
+
+        Errors are isolated to each task, so a failing parse does not affect the others.
+
+        Parameters
+        ----------
+        parse_tasks : dict
+            Mapping from name of task to a tuple of parser function, file path and keyword arguments for parser.
+            Parser functions must be importable module level functions.
+
+        Returns
+        -------
+        dict
+            Mapping from name of task to either the parsed dataframe, or the exception raised while parsing.
+        """
+        executor = self.__get_executor()
+        futures = {
+            name: executor.submit(_parse_with_metrics, func, file_path, func_kwargs)
+            for name, (func, file_path, func_kwargs) in parse_tasks.items()
+        }
+
+        results = {}
+        for name, future in futures.items():
+            try:
+                results[name], metrics_snapshot = future.result()
+                metrics.registry.merge(metrics_snapshot)
+            except BrokenProcessPool as e:
+                # A worker process died (i.e. killed by OOM), so the pool is started again on next use
+                log.error(f"Worker process parsing {name} died.")
+                results[name] = e
+                self.close()
+            except Exception as e:
+                results[name] = e
+
+        return results
+
+    def close(self):
+        """
+        Shut down worker processes.
+        """
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+
+def _initialize_worker(log_level: int):
+    """
+    Set up logging in worker process with the same level as the parent process.
+    """
+    logging.basicConfig(format=LOGFORMAT, level=log_level)
+
+
+def _parse_with_metrics(func: callable, file_path: str, func_kwargs: dict) -> tuple:
+    """
+    Parse file in worker process, and return the dataframe together with the metrics recorded while parsing.
+    """
+    metrics.registry.reset()
+    dataframe = func(file_path=file_path, **func_kwargs)
+    return dataframe, metrics.registry.snapshot()
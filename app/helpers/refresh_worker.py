@@ -0,0 +1,119 @@
+# Generic modules
+import logging
+import threading
+from time import perf_counter
+
+# Modules
+import pandas as pd
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+
+class RefreshWorker:
+    """
+    Class for refreshing data in a background thread and publishing each new dataframe.
+
+    The worker repeatedly waits, refreshes and publishes the resulting dataframe if it is a new dataframe object.
+    Parsing and joining thereby happens off the thread serving the API, and a new dataframe is only published
+    once it is complete, so readers either see the previous or the new dataframe.
+
+    Attributes
+    ----------
+    dataframe : pd.DataFrame
+        The dataframe which was published last.
+
+    Methods
+    -------
+    start()
+        Start refreshing data in a background thread.
+    stop(timeout=None)
+        Stop refreshing data after the current wait, and wait for the thread to finish.
+    join(timeout=None)
+        Wait for the background thread to finish.
+    refresh()
+        Refresh data and publish the dataframe if it is new.
+    """
+
+    def __init__(
+        self,
+        refresh_func: callable,
+        publish_func: callable,
+        wait_func: callable,
+        dataframe: pd.DataFrame = None,
+        name: str = "refresh-worker",
+    ):
+        """
+        Create new RefreshWorker instance.
+
+        Parameters
+        ----------
+        refresh_func : callable
+            Function which refreshes data and returns the current dataframe,
+            i.e. ACLineSegmentProperties.refresh_data.
+        publish_func : callable
+            Function which is called with a new dataframe, when it is returned by refresh_func.
+        wait_func : callable
+            Function which blocks until data should be refreshed, i.e. FileWatcher.wait.
+        dataframe : pd.DataFrame, default: None
+            The dataframe which is already published, if any.
+        name : str, default: "refresh-worker"
+            Name of the background thread.
+        """
+        self.dataframe = dataframe
+        self.__refresh_func = refresh_func
+        self.__publish_func = publish_func
+        self.__wait_func = wait_func
+        self.__stop_event = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, name=name, daemon=True)
+
+    def start(self):
+        """
+        Start refreshing data in a background thread, beginning with an immediate refresh.
+        """
+        self.__thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        Stop refreshing data after the current wait, and wait for the thread to finish.
+        """
+        self.__stop_event.set()
+        if threading.current_thread() is not self.__thread:
+            self.join(timeout=timeout)
+
+    def join(self, timeout: float = None):
+        """
+        Wait for the background thread to finish.
+        """
+        self.__thread.join(timeout=timeout)
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            self.refresh()
+            self.__wait_func()
+
+    def refresh(self) -> bool:
+        """
+        Refresh data and publish the dataframe if it is new.
+
+        Returns
+        -------
+        bool
+            True if a new dataframe was published, otherwise False.
+        """
+        try:
+            time_begin = perf_counter()
+            dataframe = self.__refresh_func()
+
+            if dataframe is None or dataframe is self.dataframe:
+                return False
+
+            self.__publish_func(dataframe)
+            self.dataframe = dataframe
+            log.debug(f"New dataframe was published after {round(perf_counter() - time_begin, 3)} seconds.")
+            return True
+
+        except Exception as e:
+            # The worker must keep running, so the previous dataframe stays published until a refresh succeeds
+            log.exception(f"Refreshing data failed with message: '{e}'.")
+            return False
@@ -0,0 +1,107 @@
+# Generic modules
+import logging
+from dataclasses import dataclass, field
+
+# Modules
+import pandas as pd
+from pandas.api.types import is_float_dtype
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+KEY_COLUMN = "ACLINESEGMENT_MRID"
+
+
+@dataclass(frozen=True)
+class SnapshotDiff:
+    """
+    Class for representing the row-level difference between two ACLineSegment dataframes.
+
+    Attributes
+    ----------
+    added : list[str]
+        MRIDs of ACLineSegments which only exist in the new dataframe.
+    removed : list[str]
+        MRIDs of ACLineSegments which only exist in the old dataframe.
+    changed : list[str]
+        MRIDs of ACLineSegments which exist in both dataframes, with one or more different values.
+    """
+
+    added: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    changed: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+
+def diff_aclinesegment_dataframes(old_dataframe: pd.DataFrame, new_dataframe: pd.DataFrame) -> SnapshotDiff:
+    """
+    Compare two ACLineSegment dataframes row by row, keyed on ACLINESEGMENT_MRID.
+
+    Values are compared column-wise for all rows at once. Missing values are equal to each other,
+    and values are compared regardless of dtype, so i.e. casting to compact dtypes is not a change.
+    Float columns with different precision are compared at the narrower precision,
+    since i.e. 0.1 as float64 differs from 0.1 cast to float32.
+    If the columns differ, all ACLineSegments in both dataframes are changed.
+
+    Parameters
+    ----------
+    old_dataframe : pd.DataFrame
+        Dataframe containing a record for each ACLineSegment, i.e. the previously published dataframe.
+    new_dataframe : pd.DataFrame
+        Dataframe containing a record for each ACLineSegment.
+
+    Returns
+    -------
+    SnapshotDiff
+        MRIDs of added, removed and changed ACLineSegments.
+    """
+    try:
+        old_data, new_data = _match_float_precision(old_dataframe, new_dataframe)
+        old_data = _index_by_key(old_data)
+        new_data = _index_by_key(new_data)
+
+        common_keys = old_data.index.intersection(new_data.index)
+        if list(old_data.columns) == list(new_data.columns):
+            old_common = old_data.loc[common_keys]
+            new_common = new_data.loc[common_keys]
+            is_changed = ((old_common != new_common) & ~(old_common.isna() & new_common.isna())).any(axis=1)
+            changed_keys = common_keys[is_changed.to_numpy()]
+        else:
+            changed_keys = common_keys
+
+        return SnapshotDiff(
+            added=new_data.index.difference(old_data.index, sort=False).tolist(),
+            removed=old_data.index.difference(new_data.index, sort=False).tolist(),
+            changed=changed_keys.tolist(),
+        )
+
+    except Exception as e:
+        log.exception(f"Comparing ACLineSegment dataframes failed with message: '{e}'.")
+        raise e
+
+
+def _match_float_precision(old_dataframe: pd.DataFrame, new_dataframe: pd.DataFrame) -> tuple:
+    """
+    Returns both dataframes with float columns of different precision cast to the narrower float dtype of them.
+    """
+    float_dtypes = {}
+    for column in old_dataframe.columns.intersection(new_dataframe.columns):
+        old_dtype, new_dtype = old_dataframe[column].dtype, new_dataframe[column].dtype
+        if is_float_dtype(old_dtype) and is_float_dtype(new_dtype) and old_dtype != new_dtype:
+            float_dtypes[column] = min(old_dtype, new_dtype, key=lambda dtype: dtype.itemsize)
+
+    return old_dataframe.astype(float_dtypes), new_dataframe.astype(float_dtypes)
+
+
+def _index_by_key(dataframe: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns dataframe indexed by MRID with values as objects, so columns with different dtypes can be compared.
+    A dataframe without MRID column (i.e. before data was loaded) has no rows.
+    """
+    if KEY_COLUMN not in dataframe.columns:
+        return pd.DataFrame(index=pd.Index([], name=KEY_COLUMN))
+
+    indexed_data = dataframe.set_index(KEY_COLUMN).astype(object)
+    return indexed_data[~indexed_data.index.duplicated(keep="last")]
@@ -0,0 +1,363 @@
+# Generic modules
+import logging
+import threading
+import importlib.util
+from collections import deque
+from hashlib import blake2b
+from time import time
+from dataclasses import dataclass, field
+
+# Modules
+import numpy as np
+import pandas as pd
+
+# App modules
+from helpers.snapshot_diff import SnapshotDiff, diff_aclinesegment_dataframes
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+
+def _render_arrow(dataframe: pd.DataFrame) -> bytes:
+    """
+    Returns dataframe in Arrow IPC stream format.
+    """
+    import pyarrow as pa
+
+    table = pa.Table.from_pandas(dataframe, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Functions rendering the whole dataframe in each format, and the content type of the result
+RENDERERS = {
+    "json": ("application/json", lambda dataframe: dataframe.to_json(orient="records").encode("utf-8")),
+    "csv": ("text/csv; charset=utf-8", lambda dataframe: dataframe.to_csv(index=False).encode("utf-8")),
+}
+
+# Binary columnar formats require pyarrow, and are only rendered if it is installed
+if importlib.util.find_spec("pyarrow") is not None:
+    RENDERERS["arrow"] = ("application/vnd.apache.arrow.stream", _render_arrow)
+    RENDERERS["parquet"] = ("application/vnd.apache.parquet", lambda dataframe: dataframe.to_parquet(index=False))
+
+
+class ACLineSegmentIndex:
+    """
+    Class for looking up records of the ACLineSegment dataframe by key.
+
+    Keys are indexed to row positions in the dataframe, so the index only costs a hash table of keys next to
+    the dataframe. Records are converted to dictionaries with plain python values (missing values are None)
+    when a lookup asks for them, which is cheap since a lookup only asks for a few rows.
+
+    Methods
+    -------
+    get_by_mrid(mrids)
+        Returns records of ACLineSegments with the given MRIDs.
+    get_by_line_emsname(line_emsnames)
+        Returns records of ACLineSegments of the AC-lines with the given names.
+    """
+
+    def __init__(self, dataframe: pd.DataFrame):
+        """
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Dataframe containing a record for each ACLineSegment, with columns ACLINESEGMENT_MRID and LINE_EMSNAME.
+        """
+        self.__dataframe = dataframe
+        self.__mrid_positions = np.array([], dtype=np.intp)
+        self.__mrid_index = pd.Index([], dtype=object)
+        self.__line_emsname_positions = {}
+        if dataframe.empty:
+            return
+
+        # The last ACLineSegment with a MRID is found, if it exists more than once
+        mrids = dataframe["ACLINESEGMENT_MRID"]
+        is_duplicated = mrids.duplicated(keep="last").to_numpy()
+        for mrid in mrids[is_duplicated].unique():
+            log.warning(f"ACLineSegment with MRID '{mrid}' exists more than once.")
+        self.__mrid_positions = np.flatnonzero(~is_duplicated)
+        self.__mrid_index = pd.Index(mrids.to_numpy()[self.__mrid_positions])
+        # Checking uniqueness builds the hash table of the index now, instead of on the first lookup
+        if not self.__mrid_index.is_unique:
+            raise ValueError("MRIDs of the index are not unique.")
+
+        self.__line_emsname_positions = (
+            dataframe.reset_index(drop=True).groupby("LINE_EMSNAME", sort=False, observed=True).indices
+        )
+
+    def __len__(self) -> int:
+        return len(self.__mrid_index)
+
+    def __contains__(self, mrid: str) -> bool:
+        return mrid in self.__mrid_index
+
+    def get_by_mrid(self, mrids: list[str]) -> list[dict]:
+        """
+        Returns records of ACLineSegments with the given MRIDs, in the same order. Unknown MRIDs are skipped.
+        """
+        positions = self.__mrid_index.get_indexer(pd.Index(mrids, dtype=object))
+        return self.__get_records(self.__mrid_positions[positions[positions != -1]])
+
+    def get_by_line_emsname(self, line_emsnames: list[str]) -> list[dict]:
+        """
+        Returns records of ACLineSegments of the AC-lines with the given names. Unknown names are skipped.
+        """
+        positions = [self.__line_emsname_positions.get(line_emsname, []) for line_emsname in line_emsnames]
+        return self.__get_records(np.concatenate(positions).astype(np.intp) if positions else [])
+
+    def __get_records(self, positions) -> list[dict]:
+        """
+        Returns records of the rows at positions, with plain python values and None for missing values.
+        """
+        if len(positions) == 0:
+            return []
+        rows = self.__dataframe.iloc[positions]
+        return rows.astype(object).where(rows.notna(), None).to_dict("records")
+
+
+@dataclass(frozen=True)
+class RenderedDataframe:
+    """
+    Class for representing a dataframe rendered in a format, for serving it without rendering it again.
+
+    Attributes
+    ----------
+    body : bytes
+        The rendered dataframe.
+    content_type : str
+        Content type of the body.
+    etag : str
+        Entity tag of the body, i.e. '"9f8e..."', which is derived from the content.
+    """
+
+    body: bytes
+    content_type: str
+    etag: str
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    """
+    Class for representing a published version of the ACLineSegment dataframe.
+
+    Attributes
+    ----------
+    generation : int
+        Number of the snapshot, which is increased by one for each published dataframe.
+    dataframe : pd.DataFrame
+        The published dataframe, which must not be modified.
+    index : ACLineSegmentIndex
+        Index for looking up records of the dataframe.
+    published : float
+        Time of publishing as seconds since the epoch.
+    rendered : dict[str, RenderedDataframe]
+        The dataframe rendered in each format, i.e. "json".
+    diff : SnapshotDiff
+        Difference to the dataframe of the previous snapshot.
+    """
+
+    generation: int
+    dataframe: pd.DataFrame
+    index: ACLineSegmentIndex
+    published: float
+    rendered: dict = field(default_factory=dict)
+    diff: SnapshotDiff = field(default_factory=SnapshotDiff)
+
+
+class SnapshotStore:
+    """
+    Class for holding the latest published snapshot of the ACLineSegment dataframe.
+
+    Everything derived from a dataframe (i.e. the lookup index and the dataframe rendered in each format)
+    is built when it is published, before the snapshot replaces the current one. Readers get the current snapshot
+    once and use it for the whole request, so they never see a mix of two dataframes.
+
+    Attributes
+    ----------
+    current : Snapshot
+        The latest published snapshot, or None if no dataframe has been published.
+
+    Methods
+    -------
+    publish(dataframe)
+        Publish dataframe as a new snapshot.
+    build(dataframe)
+        Build snapshot of dataframe, without making it the current snapshot.
+    activate(snapshot)
+        Make a built snapshot the current snapshot.
+    changes_since(generation)
+        Returns the current snapshot and the difference to the dataframe of an earlier generation.
+    """
+
+    def __init__(self, formats: tuple = tuple(RENDERERS), max_history: int = 100):
+        """
+        Parameters
+        ----------
+        formats : tuple[str], Default = all formats in RENDERERS
+            (optional) Formats which the whole dataframe is rendered in when published.
+        max_history : int, Default = 100
+            (optional) Amount of generations for which differences are kept, for serving changes since them.
+        """
+        self.formats = formats
+        self.current: Snapshot = None
+        self.__publish_lock = threading.Lock()
+        self.__diffs = deque(maxlen=max_history)
+
+    def publish(self, dataframe: pd.DataFrame) -> Snapshot:
+        """
+        Publish dataframe as a new snapshot, with the next generation number.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Dataframe containing a record for each ACLineSegment. It must not be modified after publishing.
+
+        Returns
+        -------
+        Snapshot
+            The new current snapshot.
+        """
+        return self.activate(self.build(dataframe))
+
+    def build(self, dataframe: pd.DataFrame) -> Snapshot:
+        """
+        Build snapshot of dataframe with the next generation number, without making it the current snapshot.
+
+        Everything derived from the dataframe is built here, so other publishers of the same dataframe (i.e. the SQL
+        API) can be updated right before the snapshot is activated, and readers see both change at the same time.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Dataframe containing a record for each ACLineSegment. It must not be modified after publishing.
+
+        Returns
+        -------
+        Snapshot
+            The new snapshot, which must be activated before another snapshot is built.
+        """
+        try:
+            current = self.current
+            if current is None:
+                generation = 1
+                diff = diff_aclinesegment_dataframes(pd.DataFrame(), dataframe)
+            else:
+                generation = current.generation + 1
+                diff = diff_aclinesegment_dataframes(current.dataframe, dataframe)
+
+            return Snapshot(
+                generation=generation,
+                dataframe=dataframe,
+                index=ACLineSegmentIndex(dataframe),
+                published=time(),
+                rendered={format: render_dataframe(dataframe, format) for format in self.formats},
+                diff=diff,
+            )
+
+        except Exception as e:
+            log.exception(f"Building snapshot failed with message: '{e}'.")
+            raise e
+
+    def activate(self, snapshot: Snapshot) -> Snapshot:
+        """
+        Make a snapshot returned by build the current snapshot.
+
+        Parameters
+        ----------
+        snapshot : Snapshot
+            Snapshot built from the current snapshot, see build.
+
+        Returns
+        -------
+        Snapshot
+            The new current snapshot.
+        """
+        with self.__publish_lock:
+            current_generation = self.current.generation if self.current is not None else 0
+            if snapshot.generation != current_generation + 1:
+                raise ValueError(
+                    f"Snapshot with generation {snapshot.generation} was not built from the current snapshot "
+                    + f"with generation {current_generation}."
+                )
+            self.__diffs.append((snapshot.generation, snapshot.diff))
+            self.current = snapshot
+
+        log.debug(
+            f"Snapshot with generation {snapshot.generation} and {len(snapshot.index)} ACLineSegments was published, "
+            + f"{len(snapshot.diff.added)} were added, {len(snapshot.diff.removed)} removed "
+            + f"and {len(snapshot.diff.changed)} changed."
+        )
+        return snapshot
+
+    def changes_since(self, generation: int) -> tuple[Snapshot, SnapshotDiff]:
+        """
+        Returns the current snapshot and the difference between the dataframe of generation and its dataframe.
+
+        Differences of the generations in between are combined, so an ACLineSegment which was added and removed again
+        is not included, and one which was changed several times is only included once.
+        Generation 0 is before the first snapshot, where no ACLineSegments exist.
+
+        Parameters
+        ----------
+        generation : int
+            Generation which the client has.
+
+        Returns
+        -------
+        tuple[Snapshot, SnapshotDiff]
+            The current snapshot, and the difference or None if generation is unknown or too old to be kept.
+        """
+        with self.__publish_lock:
+            snapshot = self.current
+            diffs = [diff for diff_generation, diff in self.__diffs if diff_generation > generation]
+
+        current_generation = snapshot.generation if snapshot is not None else 0
+        oldest_generation = current_generation - len(diffs)
+        if generation < 0 or generation > current_generation or generation != oldest_generation:
+            return snapshot, None
+
+        # The first difference an ACLineSegment is part of tells whether it existed at generation
+        existed = {}
+        for diff in diffs:
+            for mrid in diff.added:
+                existed.setdefault(mrid, False)
+            for mrid in diff.removed + diff.changed:
+                existed.setdefault(mrid, True)
+
+        added, removed, changed = [], [], []
+        for mrid, existed_at_generation in existed.items():
+            exists = mrid in snapshot.index
+            if exists and existed_at_generation:
+                changed.append(mrid)
+            elif exists:
+                added.append(mrid)
+            elif existed_at_generation:
+                removed.append(mrid)
+
+        return snapshot, SnapshotDiff(added=added, removed=removed, changed=changed)
+
+
+def render_dataframe(dataframe: pd.DataFrame, format: str) -> RenderedDataframe:
+    """
+    Render whole dataframe in a format of RENDERERS, with an entity tag derived from the content.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        Dataframe to render.
+    format : str
+        Format to render dataframe in, i.e. "json", "csv", "arrow" or "parquet".
+
+    Returns
+    -------
+    RenderedDataframe
+        The rendered dataframe.
+    """
+    content_type, render = RENDERERS[format]
+    body = render(dataframe)
+    return RenderedDataframe(
+        body=body, content_type=content_type, etag=f'"{blake2b(body, digest_size=16).hexdigest()}"'
+    )
@@ -0,0 +1,94 @@
+# Generic modules
+import logging
+import threading
+from collections import OrderedDict
+
+# Initialize log
+log = logging.getLogger(__name__)
+
+
+class TranslationMemo:
+    """
+    Class for remembering translated names across refreshes, in a bounded least recently used (LRU) memo.
+
+    Translations are only valid for the rules they were made by, so the memo is cleared if the version
+    of the translation rules changes.
+
+    Attributes
+    ----------
+    max_size : int
+        Maximum amount of translations remembered. The least recently used translation is forgotten first.
+    rules_version : int
+        Version of the translation rules, which the remembered translations were made by.
+    hits : int
+        Amount of keys found in the memo.
+    misses : int
+        Amount of keys not found in the memo.
+
+    Methods
+    -------
+    use_rules_version(rules_version)
+        Clear the memo if the translation rules version has changed.
+    get_many(keys)
+        Returns the remembered translation of each key, or None if it is not remembered.
+    put_many(translations)
+        Remember translations.
+    clear()
+        Forget all translations.
+    """
+
+    def __init__(self, max_size: int, rules_version: int = None):
+        self.max_size = max_size
+        self.rules_version = rules_version
+        self.hits = 0
+        self.misses = 0
+        self.__translations = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__translations)
+
+    def use_rules_version(self, rules_version: int):
+        """
+        Clear the memo if the translation rules version differs from the version of the remembered translations.
+        """
+        if rules_version != self.rules_version:
+            if self.__translations:
+                log.info(f"Translation rules version changed to {rules_version}, remembered translations are cleared.")
+            self.clear()
+            self.rules_version = rules_version
+
+    def get_many(self, keys: list) -> list:
+        """
+        Returns the remembered translation of each key (in the same order), or None if it is not remembered.
+        """
+        with self.__lock:
+            translations = []
+            for key in keys:
+                translation = self.__translations.get(key)
+                if translation is not None:
+                    self.__translations.move_to_end(key)
+                translations.append(translation)
+
+            hits = sum(translation is not None for translation in translations)
+            self.hits += hits
+            self.misses += len(translations) - hits
+            return translations
+
+    def put_many(self, translations: dict):
+        """
+        Remember translations, given as a mapping from key to translation.
+        """
+        with self.__lock:
+            for key, translation in translations.items():
+                self.__translations[key] = translation
+                self.__translations.move_to_end(key)
+            while len(self.__translations) > self.max_size:
+                self.__translations.popitem(last=False)
+
+    def clear(self):
+        """
+        Forget all translations.
+        """
+        with self.__lock:
+            self.__translations.clear()
@@ -1,8 +1,8 @@
 # Generic modules
-import os
 import logging
-from time import sleep, time
-from dataclasses import dataclass
+import threading
+from time import time
+from dataclasses import dataclass, field
 from typing import Union
 
 # Modules
@@ -15,7 +15,22 @@ from configuration import DD20Settings
 from helpers.parse_dd20 import parse_dd20_excelsheets_to_dataframe
 from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
 from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
-from helpers.combine_data import create_aclinesegment_dataframe
+from helpers.combine_data import (
+    create_acline_namemap_dict,
+    create_mapped_dd20_dataframe,
+    join_aclinesegment_dataframe,
+    enforce_aclinesegment_schema,
+)
+from helpers.excel_reader import resolve_excel_engine
+from helpers.file_hash import FileSignature, get_file_signature
+from helpers.parse_cache import ParsedDataframeCache
+from helpers.file_watcher import FileWatcher
+from helpers.refresh_worker import RefreshWorker
+from helpers.parse_pool import ParsePool
+from helpers.metrics import registry as metrics_registry, time_stage, METRIC_PREFIX
+from helpers.http_server import HTTPServer, HTTPResponse
+from helpers.snapshot_store import SnapshotStore
+from helpers.lookup_api import LookupAPI
 
 # Initialize log
 log = logging.getLogger(__name__)
@@ -40,7 +55,10 @@ class ACLineSegmentProperties:
     Attributes
     ----------
     dataframe : pd.DataFrame
-        The ACLineSegment properties in DataFrame format
+        The ACLineSegment properties in DataFrame format.
+        A new dataframe is assigned when data is refreshed, the dataframe itself is never modified.
+    metadata : dict
+        Size, modification time, content hash and parse statistics of each input file when it was last read
 
     Methods
     -------
@@ -53,10 +71,9 @@ class ACLineSegmentProperties:
         name: str
         path: str
         func: callable
-        line_data_valid_hash: str
-        station_data_valid_hash: str
+        func_kwargs: dict = field(default_factory=dict)
         dataframe: pd.DataFrame = None
-        mtime: float = None
+        signature: FileSignature = None
 
     def __init__(
         self,
@@ -65,6 +82,12 @@ class ACLineSegmentProperties:
         mrid_mapping_filepath: str,
         dd20_line_data_valid_hash: str,
         dd20_station_data_valid_hash: str,
+        dd20_streaming_read: bool = False,
+        excel_engine: str = "openpyxl",
+        parse_cache_dir: str = None,
+        parallel_parse: bool = False,
+        compact_dtypes: bool = False,
+        mrid_csv_chunk_size: int = 0,
         refresh_data: bool = True,
     ):
         """
@@ -84,24 +107,60 @@ class ACLineSegmentProperties:
         station_data_valid_hash : str
             Hash value of the header rows in the dd20 station sheet,
             used to detect a change in file format.
+        dd20_streaming_read : bool, default: False
+            If True the DD20 excel-file is read by streaming only the used columns
+        excel_engine : str, default: "openpyxl"
+            Engine for reading excel-files, "openpyxl", "calamine" or "auto" (calamine if it is available).
+            Calamine is faster, but must be selected explicitly, so the parser only changes when it is chosen.
+        parse_cache_dir : str, default: None
+            Directory for caching parsed dataframes in Parquet format, keyed by hash of file content.
+            If None parsed dataframes are not cached.
+        parallel_parse : bool, default: False
+            If True changed input files are parsed in parallel in worker processes
+        compact_dtypes : bool, default: False
+            If True columns of the combined dataframe are cast to compact dtypes, i.e. categoricals and Int32
+        mrid_csv_chunk_size : int, default: 0
+            Size in bytes of chunks the MRID mapping csv-file is read in, to bound memory used.
+            If 0 the whole file is read at once.
         refresh_data : bool, default: True
             If True data will automatically be loaded at instantiation
         """
+        engine = resolve_excel_engine(excel_engine)
+        log.info(f"Excel-files are read with engine '{engine}'.")
+
         self.__DD20 = self.__Metadata(
-            name = "DD20", path = dd20_filepath, func = parse_dd20_excelsheets_to_dataframe, line_data_valid_hash = dd20_line_data_valid_hash, station_data_valid_hash = dd20_station_data_valid_hash
+            "DD20",
+            dd20_filepath,
+            parse_dd20_excelsheets_to_dataframe,
+            func_kwargs={
+                "line_data_valid_hash": dd20_line_data_valid_hash,
+                "station_data_valid_hash": dd20_station_data_valid_hash,
+                "streaming": dd20_streaming_read,
+                "engine": engine,
+            },
         )
         self.__DD20_MAP = self.__Metadata(
             "DD20 name mapping",
             dd20_mapping_filepath,
-            parse_acline_namemap_excelsheet_to_dataframe, line_data_valid_hash = "", station_data_valid_hash = ""
+            parse_acline_namemap_excelsheet_to_dataframe,
+            func_kwargs={"engine": engine},
         )
         self.__MRID_MAP = self.__Metadata(
             "MRID mapping",
             mrid_mapping_filepath,
-            parse_aclineseg_scada_csvdata_to_dataframe, line_data_valid_hash = "", station_data_valid_hash = ""
+            parse_aclineseg_scada_csvdata_to_dataframe,
+            func_kwargs={"chunk_size": mrid_csv_chunk_size},
         )
         self.dataframe: pd.DataFrame = pd.DataFrame()
         self.__data_updated: bool = False
+        self.__refresh_lock = threading.Lock()
+
+        # Intermediate results of joining dataframes, which are None when they must be recalculated
+        self.__acline_namemap_dict: dict = None
+        self.__mapped_dd20_dataframe: pd.DataFrame = None
+        self.__parse_cache = ParsedDataframeCache(parse_cache_dir) if parse_cache_dir else None
+        self.__parse_pool = ParsePool(max_workers=3) if parallel_parse else None
+        self.__compact_dtypes = compact_dtypes
 
         if refresh_data:
             self.refresh_data()
@@ -134,48 +193,212 @@ class ACLineSegmentProperties:
         """
         # Deprecation warning: The "refresh_data" method should not
         # invoke update or return a dataframe. Change this later!
-        try:
-            for input in [self.__DD20, self.__DD20_MAP, self.__MRID_MAP]:
-                file_update_time = os.path.getmtime(input.path)
 
-                if file_update_time != input.mtime:
-                    log.info(f"Updating {input.name} file")
-                    if input.name == "DD20":
-                        input.dataframe = input.func(file_path=input.path, line_data_valid_hash=input.line_data_valid_hash, station_data_valid_hash=input.station_data_valid_hash)
-                    else:
-                        input.dataframe = input.func(file_path=input.path)
-                    input.mtime = file_update_time
+        # Only one refresh at a time, since inputs and intermediate results are shared
+        with self.__refresh_lock, time_stage("refresh"):
+            metrics_registry.inc(f"{METRIC_PREFIX}_refreshes_total", help="Checks of input files for changes.")
+            changed_inputs = self.__find_changed_inputs()
+
+            # Inputs which fail to parse keep their previous dataframe and signature, so parsing is retried
+            parsed_dataframes = self.__parse_inputs(changed_inputs)
+            for (input, file_signature), dataframe in zip(changed_inputs, parsed_dataframes):
+                if dataframe is not None:
+                    input.dataframe = dataframe
+                    input.signature = file_signature
+                    self.__invalidate_join_stages(input)
                     self.__data_updated = True
-        except Exception as e:
-            log.error("Parsing of input file failed.")
-            log.exception(e)
 
-        # This try should propably be removed at next major version bump
-        try:
-            if self.__data_updated:
-                self.__data_updated = False
-                self.join_dataframes()
-                log.info("Conductor data was refreshed.")
-        except Exception as e:
-            log.error("Parsing of input file failed.")
-            log.exception(e)
+            # This try should propably be removed at next major version bump
+            try:
+                if self.__data_updated:
+                    self.__data_updated = False
+                    self.join_dataframes()
+                    log.info("Conductor data was refreshed.")
+            except Exception as e:
+                log.error("Parsing of input file failed.")
+                log.exception(e)
 
         # Return should probably be removed at next major version bump
         return self.dataframe
 
+    @property
+    def metadata(self) -> dict:
+        """
+        Size, modification time and content hash of each input file when it was last read,
+        and statistics of the parse (i.e. skipped rows) if the parser gives them.
+        """
+        return {
+            input.name: {
+                "path": input.path,
+                "size": input.signature.size if input.signature else None,
+                "mtime": input.signature.mtime if input.signature else None,
+                "hash": input.signature.hash if input.signature else None,
+                "parse_stats": input.dataframe.attrs.get("parse_stats") if input.dataframe is not None else None,
+            }
+            for input in [self.__DD20, self.__DD20_MAP, self.__MRID_MAP]
+        }
+
+    def __find_changed_inputs(self) -> list[tuple[__Metadata, FileSignature]]:
+        """
+        Check the input files for changes of content, and return each changed input with its new file signature.
+
+        The signature of a file which was modified, but has unchanged content, is updated,
+        so its content is not hashed again. Errors reading a file are logged, and the file is not changed.
+        """
+        changed_inputs = []
+        for input in [self.__DD20, self.__DD20_MAP, self.__MRID_MAP]:
+            try:
+                # Content is only hashed if size or modification time of file has changed
+                file_signature = get_file_signature(input.path, previous_signature=input.signature)
+
+                if input.signature is None or file_signature.hash != input.signature.hash:
+                    log.info(f"Updating {input.name} file")
+                    changed_inputs.append((input, file_signature))
+                elif file_signature != input.signature:
+                    log.debug(f"{input.name} file was modified, but content is unchanged.")
+                    input.signature = file_signature
+            except Exception as e:
+                log.error(f"Reading of {input.name} file failed.")
+                log.exception(e)
+
+        return changed_inputs
+
+    def __parse_inputs(self, changed_inputs: list[tuple[__Metadata, FileSignature]]) -> list[pd.DataFrame]:
+        """
+        Parse changed input files to dataframes, or load the dataframes from cache
+        if the same file content has been parsed before.
+
+        Files are parsed in parallel if a parse pool is used. Errors are logged for each input,
+        and the dataframe of an input which failed to parse is None.
+        """
+        cache_keys, dataframes = self.__load_cached_dataframes(changed_inputs)
+
+        unparsed_inputs = {index: input for index, (input, _) in enumerate(changed_inputs) if dataframes[index] is None}
+        for index, result in self.__parse_files(unparsed_inputs).items():
+            dataframes[index] = self.__record_parse_result(*changed_inputs[index], result)
+            if dataframes[index] is not None and self.__parse_cache is not None:
+                self.__parse_cache.store(parser=changed_inputs[index][0].func, key=cache_keys[index], dataframe=result)
+
+        return dataframes
+
+    def __load_cached_dataframes(self, changed_inputs: list[tuple[__Metadata, FileSignature]]) -> tuple[list, list]:
+        """
+        Return cache keys of the changed inputs, and their dataframes loaded from the parse cache.
+        The dataframe of an input which is not in cache is None, as are all keys and dataframes if no cache is used.
+        """
+        cache_keys = [None] * len(changed_inputs)
+        dataframes = [None] * len(changed_inputs)
+        if self.__parse_cache is None:
+            return cache_keys, dataframes
+
+        for index, (input, file_signature) in enumerate(changed_inputs):
+            cache_keys[index] = self.__parse_cache.get_key(
+                file_hash=file_signature.hash, parser=input.func, parser_kwargs=input.func_kwargs
+            )
+            dataframes[index] = self.__parse_cache.load(parser=input.func, key=cache_keys[index])
+            if dataframes[index] is not None:
+                metrics_registry.inc(
+                    f"{METRIC_PREFIX}_parse_cache_hits_total",
+                    labels={"input": input.name},
+                    help="Parsed dataframes loaded from cache.",
+                )
+
+        return cache_keys, dataframes
+
+    def __parse_files(self, inputs: dict[int, __Metadata]) -> dict:
+        """
+        Parse the input files, in parallel if a parse pool is used and more than one file is parsed.
+        Returns the dataframe of each input, or the exception raised when parsing it.
+        """
+        if self.__parse_pool is not None and len(inputs) > 1:
+            return self.__parse_pool.parse(
+                {index: (input.func, input.path, input.func_kwargs) for index, input in inputs.items()}
+            )
+
+        results = {}
+        for index, input in inputs.items():
+            try:
+                results[index] = input.func(file_path=input.path, **input.func_kwargs)
+            except Exception as e:
+                results[index] = e
+
+        return results
+
+    def __record_parse_result(self, input: __Metadata, file_signature: FileSignature, result) -> pd.DataFrame:
+        """
+        Log the error or update the metrics of parsing an input file.
+        Returns the parsed dataframe, or None if parsing failed.
+        """
+        if isinstance(result, Exception):
+            log.error(f"Parsing of {input.name} file failed.", exc_info=result)
+            metrics_registry.inc(
+                f"{METRIC_PREFIX}_parse_errors_total",
+                labels={"input": input.name},
+                help="Failed parses of input files.",
+            )
+            return None
+
+        metrics_registry.inc(
+            f"{METRIC_PREFIX}_bytes_read_total",
+            file_signature.size,
+            labels={"input": input.name},
+            help="Bytes of input files parsed.",
+        )
+        metrics_registry.inc(
+            f"{METRIC_PREFIX}_rows_parsed_total",
+            len(result),
+            labels={"input": input.name},
+            help="Rows of parsed dataframes.",
+        )
+        return result
+
+    def __invalidate_join_stages(self, input: __Metadata):
+        """
+        Discard intermediate results of joining dataframes which depend on the input.
+        """
+        if input is self.__DD20_MAP:
+            self.__acline_namemap_dict = None
+        if input is self.__DD20_MAP or input is self.__DD20:
+            self.__mapped_dd20_dataframe = None
+
     def join_dataframes(self):
+        """
+        Join the input dataframes into the combined dataframe.
+
+        Intermediate results are kept between calls, so only stages depending on updated inputs are recalculated,
+        i.e. an update of the MRID mapping only redoes the final join.
+        """
         try:
             obj_list = [self.__DD20, self.__DD20_MAP, self.__MRID_MAP]
-            if any(obj.dataframe.empty for obj in obj_list):
+            if any(obj.dataframe is None or obj.dataframe.empty for obj in obj_list):
                 raise ValueError(
                     "Cannot calculate common dataframe, as "
                     + "one or more underlying dataframes are missing"
                 )
             else:
-                self.dataframe = create_aclinesegment_dataframe(
-                    dd20_data=self.__DD20.dataframe,
-                    dd20_to_scada_name_map=self.__DD20_MAP.dataframe,
-                    scada_aclinesegment_map=self.__MRID_MAP.dataframe,
+                if self.__acline_namemap_dict is None:
+                    with time_stage("join_namemap"):
+                        self.__acline_namemap_dict = create_acline_namemap_dict(
+                            dd20_to_scada_name_map=self.__DD20_MAP.dataframe
+                        )
+                if self.__mapped_dd20_dataframe is None:
+                    with time_stage("join_mapped_dd20"):
+                        self.__mapped_dd20_dataframe = create_mapped_dd20_dataframe(
+                            dd20_data=self.__DD20.dataframe,
+                            acline_namemap_dict=self.__acline_namemap_dict,
+                        )
+                with time_stage("join"):
+                    self.dataframe = join_aclinesegment_dataframe(
+                        mapped_dd20_data=self.__mapped_dd20_dataframe,
+                        scada_aclinesegment_map=self.__MRID_MAP.dataframe,
+                    )
+                if self.__compact_dtypes:
+                    with time_stage("schema"):
+                        self.dataframe = enforce_aclinesegment_schema(dlr_dataframe=self.dataframe)
+                metrics_registry.set(
+                    f"{METRIC_PREFIX}_aclinesegments",
+                    len(self.dataframe),
+                    help="ACLineSegments in the combined dataframe.",
                 )
         except Exception as e:
             log.error("Create dataframe with AC-linesegment properties failed")
@@ -225,7 +448,13 @@ if __name__ == "__main__":
         dd20_mapping_filepath=settings.dd20_mapping_filepath,
         mrid_mapping_filepath=settings.mrid_mapping_filepath,
         dd20_line_data_valid_hash=settings.line_data_valid_hash,
-        dd20_station_data_valid_hash=settings.station_data_valid_hash
+        dd20_station_data_valid_hash=settings.station_data_valid_hash,
+        dd20_streaming_read=settings.dd20_streaming_read,
+        excel_engine=settings.excel_engine,
+        parse_cache_dir=settings.parse_cache_dir,
+        parallel_parse=settings.parallel_parse,
+        compact_dtypes=settings.compact_dtypes,
+        mrid_csv_chunk_size=settings.mrid_csv_chunk_size,
     )
 
     log.info("Starting conductor data provider API.")
@@ -238,9 +467,52 @@ if __name__ == "__main__":
         f"API initialized on port '{conductor_api.web.port}' "
         + f"with dbname '{settings.api_dbname}'."
     )
+
+    # Endpoints which are not part of the API from singupy are served on a separate port.
+    # Lookups are served from snapshots, which are published together with the API, so they are only built if served.
+    snapshot_store = None
+    if settings.http_port:
+        snapshot_store = SnapshotStore()
+        snapshot_store.publish(conductor_data.dataframe)
+
+        http_server = HTTPServer(port=settings.http_port)
+        LookupAPI(snapshot_store).add_routes(http_server)
+        http_server.add_route(
+            "/metrics",
+            lambda request: HTTPResponse(
+                body=metrics_registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8"
+            ),
+        )
+        http_server.start()
+
     log.debug(f"Started up in {round(time()-time_begin,3)} seconds")
 
-    # Loop eternally and refresh data if files change
-    while True:
-        sleep(settings.api_refresh_rate)
-        conductor_api[settings.api_dbname] = conductor_data.refresh_data()
+    # Refresh data in the background when files change, and publish each new dataframe to the API.
+    # Data is refreshed once the watch has started, to catch changes made during start-up.
+    # Files are checked at least every API_REFRESH_RATE seconds, also in inotify mode, since changes on network
+    # volumes and in replaced directories give no events, and a failed refresh must be retried.
+    with FileWatcher(
+        [settings.dd20_filepath, settings.dd20_mapping_filepath, settings.mrid_mapping_filepath],
+        mode=settings.file_watch_mode,
+        debounce=settings.file_watch_debounce,
+        poll_interval=settings.api_refresh_rate,
+    ) as file_watcher:
+
+        def publish_dataframe(dataframe: pd.DataFrame):
+            # The snapshot is built before anything is published, so the SQL API and the snapshot change together
+            with time_stage("api_publish"):
+                if snapshot_store is None:
+                    conductor_api[settings.api_dbname] = dataframe
+                    return
+                snapshot = snapshot_store.build(dataframe)
+                conductor_api[settings.api_dbname] = dataframe
+                snapshot_store.activate(snapshot)
+
+        refresh_worker = RefreshWorker(
+            refresh_func=conductor_data.refresh_data,
+            publish_func=publish_dataframe,
+            wait_func=lambda: file_watcher.wait(timeout=settings.api_refresh_rate),
+            dataframe=conductor_data.dataframe,
+        )
+        refresh_worker.start()
+        refresh_worker.join()
@@ -0,0 +1,247 @@
+# Generic modules
+import os
+import csv
+import random
+import string
+from dataclasses import dataclass
+from sys import path
+
+# Modules
+from openpyxl import Workbook, load_workbook
+
+# Allow import of app modules, as the app is not an installable package
+path.append(os.path.join(os.path.split(os.path.split(os.path.abspath(__file__))[0])[0], "app"))
+
+from singupy.conversion import kv_to_letter as convert_kv_to_letter  # noqa: E402
+
+# Files from the tests, used as templates so header rows (and thereby header hashes) are identical
+TESTDATA_PATH = os.path.join(os.path.split(os.path.split(os.path.abspath(__file__))[0])[0], "tests", "valid-testdata")
+TEMPLATE_DD20_FILEPATH = os.path.join(TESTDATA_PATH, "DD20.XLSM")
+
+# Header hashes of the template DD20 file, which the generated DD20 files also have
+STATION_DATA_VALID_HASH = "94d5d5019d83350980b49e884159b215"
+LINE_DATA_VALID_HASH = "86e61101fa327e1b4f769c26300be01f"
+
+SHEETNAME_STATIONSDATA = "Stationsdata"
+SHEETNAME_LINEDATA = "Linjedata - Sommer"
+HEADER_ROW_COUNT = 3
+
+# Template AC-lines in the template DD20 file, for a single line and for a parallel line
+TEMPLATE_SINGLE_ACLINE = "EEE-FFF-1"
+TEMPLATE_PARALLEL_ACLINE = "GGG-HHH"
+
+# Columns in DD20 sheets of AC-line name and voltage level, and columns with component limits in line sheet
+STATION_NAME_COLUMN, STATION_KV_COLUMN = 0, 1
+LINE_NAME_COLUMN, LINE_KV_COLUMN = 0, 2
+LINE_COMPONENT_LIMIT_COLUMNS = range(41, 97)
+
+KV_LEVELS = [132, 150, 220, 400]
+
+
+@dataclass
+class GeneratedTestdata:
+    """
+    Class for representing paths of generated input files.
+
+    Attributes
+    ----------
+    dd20_filepath : str
+        Path of generated "DD20" excel-file.
+    dd20_mapping_filepath : str
+        Path of generated "DD20 name to SCADA AC-line name mapping" excel-file.
+    mrid_mapping_filepath : str
+        Path of generated "AC-line name to AC-linesegment MRID mapping" csv-file.
+    acline_count : int
+        Amount of AC-lines in DD20.
+    """
+
+    dd20_filepath: str
+    dd20_mapping_filepath: str
+    mrid_mapping_filepath: str
+    acline_count: int
+
+
+def generate_testdata(
+    output_dir: str,
+    acline_count: int,
+    parallel_fraction: float = 0.1,
+    sparse_fraction: float = 0.2,
+    mapped_fraction: float = 0.01,
+    seed: int = 0,
+) -> GeneratedTestdata:
+    """
+    Generate synthetic input files with the layout of the test data, at a configurable scale.
+
+    The header rows of both DD20 sheets are copied from the DD20 file in the tests,
+    so the header hashes are STATION_DATA_VALID_HASH and LINE_DATA_VALID_HASH.
+    Data rows are copied from template AC-lines in the same file, with new names and voltage levels.
+
+    Parameters
+    ----------
+    output_dir : str
+        Directory in which files are generated.
+    acline_count : int
+        Amount of AC-lines in DD20.
+    parallel_fraction : float, Default = 0.1
+        (optional) Fraction of AC-lines which are parallel lines, i.e. have single parts and a "(N)" representation.
+    sparse_fraction : float, Default = 0.2
+        (optional) Fraction of component limit cells in line sheet which are left empty.
+    mapped_fraction : float, Default = 0.01
+        (optional) Fraction of AC-lines which have a manual name mapping to SCADA name.
+    seed : int, Default = 0
+        (optional) Seed of random generator, so the same files are generated each time.
+
+    Returns
+    -------
+    GeneratedTestdata
+        Paths of generated files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    random_generator = random.Random(seed)
+
+    # AC-lines as tuples of name, voltage level and whether it is parallel
+    aclines = [
+        (
+            f"{_station_code(index)}-{_station_code(index * 7 + 1)}",
+            random_generator.choice(KV_LEVELS),
+            random_generator.random() < parallel_fraction,
+        )
+        for index in range(acline_count)
+    ]
+    aclines.sort(key=lambda acline: acline[1])
+
+    testdata = GeneratedTestdata(
+        dd20_filepath=os.path.join(output_dir, "DD20.XLSM"),
+        dd20_mapping_filepath=os.path.join(output_dir, "Limits_other.xlsx"),
+        mrid_mapping_filepath=os.path.join(output_dir, "seg_line_mrid_PROD.csv"),
+        acline_count=acline_count,
+    )
+
+    scada_names = _write_dd20(
+        file_path=testdata.dd20_filepath,
+        aclines=aclines,
+        sparse_fraction=sparse_fraction,
+        mapped_fraction=mapped_fraction,
+        random_generator=random_generator,
+    )
+    _write_namemap(file_path=testdata.dd20_mapping_filepath, scada_names=scada_names)
+    _write_mrid_map(
+        file_path=testdata.mrid_mapping_filepath, scada_names=scada_names, random_generator=random_generator
+    )
+
+    return testdata
+
+
+def _station_code(index: int) -> str:
+    """
+    Returns unique four letter station code for index.
+    """
+    letters = string.ascii_uppercase
+    return "".join(letters[(index // 26 ** power) % 26] for power in (3, 2, 1, 0))
+
+
+def _read_template_rows(worksheet) -> tuple[list, dict]:
+    """
+    Returns header rows and data rows grouped by AC-line name of a template sheet.
+    """
+    header_rows = []
+    rows_by_name = {}
+    for row_number, row in enumerate(worksheet.iter_rows(values_only=True)):
+        if row_number < HEADER_ROW_COUNT:
+            header_rows.append(list(row))
+        elif row[0] is not None:
+            rows_by_name.setdefault(row[0], []).append(list(row))
+    return header_rows, rows_by_name
+
+
+def _write_dd20(
+    file_path: str, aclines: list, sparse_fraction: float, mapped_fraction: float, random_generator: random.Random
+) -> dict:
+    """
+    Write DD20 excel-file with a station and line sheet for the AC-lines.
+    Returns mapping from translated AC-line name to SCADA AC-line name.
+    """
+    template_workbook = load_workbook(TEMPLATE_DD20_FILEPATH, read_only=True)
+    station_header_rows, station_rows = _read_template_rows(template_workbook[SHEETNAME_STATIONSDATA])
+    line_header_rows, line_rows = _read_template_rows(template_workbook[SHEETNAME_LINEDATA])
+    template_workbook.close()
+
+    workbook = Workbook(write_only=True)
+    station_sheet = workbook.create_sheet(SHEETNAME_STATIONSDATA)
+    line_sheet = workbook.create_sheet(SHEETNAME_LINEDATA)
+    for header_row in station_header_rows:
+        station_sheet.append(header_row)
+    for header_row in line_header_rows:
+        line_sheet.append(header_row)
+
+    scada_names = {}
+    current_kv_level = None
+    for acline_name, kv_level, is_parallel in aclines:
+        # Each voltage level starts with a section row, i.e. "132 kV"
+        if kv_level != current_kv_level:
+            current_kv_level = kv_level
+            station_sheet.append([f"{kv_level} kV"])
+            line_sheet.append([f"{kv_level} kV", None, None, None, None, 0])
+
+        template_name = TEMPLATE_PARALLEL_ACLINE if is_parallel else TEMPLATE_SINGLE_ACLINE
+        for name_suffix in ["", " (N)"] if is_parallel else [""]:
+            station_row = list(station_rows[template_name + name_suffix][0])
+            station_row[STATION_NAME_COLUMN] = acline_name + name_suffix
+            station_row[STATION_KV_COLUMN] = kv_level
+            station_sheet.append(station_row)
+
+            for template_line_row in line_rows[template_name + name_suffix]:
+                line_row = list(template_line_row)
+                line_row[LINE_NAME_COLUMN] = acline_name + name_suffix
+                line_row[LINE_KV_COLUMN] = kv_level
+                for column in LINE_COMPONENT_LIMIT_COLUMNS:
+                    if random_generator.random() < sparse_fraction:
+                        line_row[column] = None
+                line_sheet.append(line_row)
+
+        # Names of generated AC-lines have no index, so translation only adds the voltage letter
+        translated_name = f"{convert_kv_to_letter(kv_level)}_{acline_name}"
+        if random_generator.random() < mapped_fraction:
+            scada_names[translated_name] = f"{translated_name}_M"
+        else:
+            scada_names[translated_name] = translated_name
+
+    workbook.save(file_path)
+    return scada_names
+
+
+def _write_namemap(file_path: str, scada_names: dict):
+    """
+    Write name mapping excel-file, with AC-lines which have a SCADA name differing from translated name.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet("DD20Mapping")
+    sheet.append(["DD20 Name", "ETS Name", "Comment", "User"])
+    for translated_name, scada_name in scada_names.items():
+        if translated_name != scada_name:
+            sheet.append([translated_name, scada_name, "Generated mapping", "BENCH"])
+    workbook.save(file_path)
+
+
+def _write_mrid_map(file_path: str, scada_names: dict, random_generator: random.Random):
+    """
+    Write MRID mapping csv-file with one to three ACLineSegments for each AC-line,
+    and a few AC-lines which only exist in SCADA.
+    """
+    scada_only_names = [f"X_SCADA-ONLY_{index}" for index in range(max(1, len(scada_names) // 100))]
+
+    with open(file_path, "w", newline="", encoding="cp1252") as file:
+        writer = csv.writer(file)
+        writer.writerow(["ACLINESEGMENT_MRID", "LINE_EMSNAME", "DLR_ENABLED"])
+        writer.writerow(["------------------", "------------", "-----------"])
+        segment_index = 0
+        for scada_name in list(scada_names.values()) + scada_only_names:
+            for _ in range(random_generator.randint(1, 3)):
+                writer.writerow(
+                    [
+                        f"66b4596e-0000-0000-0000-{segment_index:012d}",
+                        scada_name,
+                        "YES" if random_generator.random() < 0.8 else "NO",
+                    ]
+                )
+                segment_index += 1
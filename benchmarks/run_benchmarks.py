@@ -0,0 +1,154 @@
+"""
+Benchmarks of parsing and combining input files, on synthetic input files at configurable scale.
+
+Example:
+    python benchmarks/run_benchmarks.py --aclines 1000 10000 --repeat 3
+
+For each scale the input files are generated (see generate_testdata.py), and time and peak memory
+of each parser, the combination of data and a full refresh of ACLineSegmentProperties are reported.
+Peak memory is measured with tracemalloc, i.e. memory allocated by Python and numpy, in a separate run
+since tracing slows down code with many small allocations considerably.
+"""
+# Generic modules
+import os
+import gc
+import json
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from time import perf_counter
+from sys import path
+
+# Allow import of app modules, as the app is not an installable package
+path.append(os.path.join(os.path.split(os.path.split(os.path.abspath(__file__))[0])[0], "app"))
+
+from generate_testdata import generate_testdata, STATION_DATA_VALID_HASH, LINE_DATA_VALID_HASH  # noqa: E402
+from helpers.parse_dd20 import parse_dd20_excelsheets_to_dataframe  # noqa: E402
+from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe  # noqa: E402
+from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe  # noqa: E402
+from helpers.combine_data import create_aclinesegment_dataframe  # noqa: E402
+from helpers.excel_reader import resolve_excel_engine  # noqa: E402
+from main import ACLineSegmentProperties  # noqa: E402
+
+
+def measure(func: callable, repeat: int = 1) -> dict:
+    """
+    Call function repeatedly and return the fastest time in seconds,
+    and the peak memory in MiB of an additional traced call. The result of the last call is returned as 'result'.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        time_begin = perf_counter()
+        func()
+        times.append(perf_counter() - time_begin)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": min(times), "peak_mib": peak_memory / 2 ** 20, "result": result}
+
+
+def run_benchmarks(acline_count: int, output_dir: str, repeat: int = 1, streaming: bool = False, engine: str = "auto"):
+    """
+    Generate input files with acline_count AC-lines in output_dir and benchmark parsing and combining them.
+    Returns list of results with name of benchmark, time in seconds and peak memory in MiB.
+    """
+    engine = resolve_excel_engine(engine)
+    testdata = generate_testdata(output_dir=output_dir, acline_count=acline_count)
+
+    benchmarks = {
+        "parse_dd20_excelsheets_to_dataframe": lambda: parse_dd20_excelsheets_to_dataframe(
+            file_path=testdata.dd20_filepath,
+            station_data_valid_hash=STATION_DATA_VALID_HASH,
+            line_data_valid_hash=LINE_DATA_VALID_HASH,
+            streaming=streaming,
+            engine=engine,
+        ),
+        "parse_acline_namemap_excelsheet_to_dataframe": lambda: parse_acline_namemap_excelsheet_to_dataframe(
+            file_path=testdata.dd20_mapping_filepath, engine=engine
+        ),
+        "parse_aclineseg_scada_csvdata_to_dataframe": lambda: parse_aclineseg_scada_csvdata_to_dataframe(
+            file_path=testdata.mrid_mapping_filepath
+        ),
+    }
+    results = {name: measure(func, repeat=repeat) for name, func in benchmarks.items()}
+
+    results["create_aclinesegment_dataframe"] = measure(
+        lambda: create_aclinesegment_dataframe(
+            dd20_data=results["parse_dd20_excelsheets_to_dataframe"]["result"],
+            dd20_to_scada_name_map=results["parse_acline_namemap_excelsheet_to_dataframe"]["result"],
+            scada_aclinesegment_map=results["parse_aclineseg_scada_csvdata_to_dataframe"]["result"],
+        ),
+        repeat=repeat,
+    )
+    results["ACLineSegmentProperties.refresh_data"] = measure(
+        lambda: ACLineSegmentProperties(
+            dd20_filepath=testdata.dd20_filepath,
+            dd20_mapping_filepath=testdata.dd20_mapping_filepath,
+            mrid_mapping_filepath=testdata.mrid_mapping_filepath,
+            dd20_line_data_valid_hash=LINE_DATA_VALID_HASH,
+            dd20_station_data_valid_hash=STATION_DATA_VALID_HASH,
+            dd20_streaming_read=streaming,
+            excel_engine=engine,
+        ),
+        repeat=repeat,
+    )
+
+    return [
+        {
+            "aclines": acline_count,
+            "benchmark": name,
+            "seconds": round(result["seconds"], 4),
+            "peak_mib": round(result["peak_mib"], 1),
+            "rows": len(result["result"].dataframe if name.startswith("ACLineSegmentProperties") else result["result"]),
+        }
+        for name, result in results.items()
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing and combining of synthetic input files.")
+    parser.add_argument("--aclines", type=int, nargs="+", default=[1000, 10000], help="Amounts of AC-lines in DD20.")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetitions of each benchmark, fastest is reported.")
+    parser.add_argument("--streaming", action="store_true", help="Read DD20 by streaming only the used columns.")
+    parser.add_argument(
+        "--engine", choices=["auto", "openpyxl", "calamine"], default="auto", help="Engine for reading excel-files."
+    )
+    parser.add_argument("--output-dir", help="Directory for generated files, a temporary directory if not given.")
+    parser.add_argument("--json", help="Path of file to write results to in JSON format.")
+    args = parser.parse_args()
+
+    # Logging from the app is suppressed, since it would otherwise dominate the output
+    logging.basicConfig(level=logging.CRITICAL)
+
+    results = []
+    with tempfile.TemporaryDirectory() as temporary_dir:
+        for acline_count in args.aclines:
+            output_dir = os.path.join(args.output_dir or temporary_dir, f"aclines-{acline_count}")
+            for result in run_benchmarks(
+                acline_count=acline_count,
+                output_dir=output_dir,
+                repeat=args.repeat,
+                streaming=args.streaming,
+                engine=args.engine,
+            ):
+                results.append(result)
+                print(
+                    f"{result['aclines']:>8} {result['benchmark']:<46} {result['seconds']:>10.4f} s "
+                    + f"{result['peak_mib']:>10.1f} MiB {result['rows']:>8} rows"
+                )
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
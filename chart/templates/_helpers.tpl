@@ -60,3 +60,10 @@ Create the name of the service account to use
 {{- default "default" .Values.serviceAccount.name }}
 {{- end }}
 {{- end }}
+
+{{/*
+Port of the lookup and metrics endpoints, from the HTTP_PORT environment variable (0 if they are disabled)
+*/}}
+{{- define "chart.httpPort" -}}
+{{- .Values.EnvVars.HTTP_PORT | default 0 | int }}
+{{- end }}
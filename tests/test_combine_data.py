@@ -1,6 +1,7 @@
 import pandas as pd
 from numpy import nan
 import os
+import logging
 
 from sys import path
 # Ugly hack to allow absolute import from the root folder
@@ -10,7 +11,13 @@ path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
 from helpers.parse_dd20 import parse_dd20_excelsheets_to_dataframe
 from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
 from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
-from helpers.combine_data import create_aclinesegment_dataframe
+from helpers.combine_data import (
+    create_aclinesegment_dataframe,
+    create_acline_namemap_dict,
+    create_mapped_dd20_dataframe,
+    join_aclinesegment_dataframe,
+    enforce_aclinesegment_schema,
+)
 
 
 
@@ -116,3 +123,156 @@ def test_create_aclinesegment_dataframe():
         )
         is None
     )
+
+
+def test_create_aclinesegment_dataframe_in_stages():
+    """
+    Verifies that combining data in separate stages gives the same dataframe, and that DD20 data is not modified
+    """
+    STATION_DATA_VALID_HASH = "94d5d5019d83350980b49e884159b215"
+    LINE_DATA_VALID_HASH = "86e61101fa327e1b4f769c26300be01f"
+    testdata_path = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata"
+
+    dd20_dataframe = parse_dd20_excelsheets_to_dataframe(
+        file_path=f"{testdata_path}/DD20.XLSM",
+        line_data_valid_hash=LINE_DATA_VALID_HASH,
+        station_data_valid_hash=STATION_DATA_VALID_HASH
+    )
+    acline_namemap_dataframe = parse_acline_namemap_excelsheet_to_dataframe(
+        file_path=f"{testdata_path}/Limits_other.xlsx"
+    )
+    acline_to_mrid_dataframe = parse_aclineseg_scada_csvdata_to_dataframe(
+        file_path=f"{testdata_path}/seg_line_mrid_PROD.csv"
+    )
+    original_dd20_dataframe = dd20_dataframe.copy()
+
+    # act
+    acline_namemap_dict = create_acline_namemap_dict(dd20_to_scada_name_map=acline_namemap_dataframe)
+    mapped_dd20_dataframe = create_mapped_dd20_dataframe(
+        dd20_data=dd20_dataframe, acline_namemap_dict=acline_namemap_dict
+    )
+    staged_dataframe = join_aclinesegment_dataframe(
+        mapped_dd20_data=mapped_dd20_dataframe, scada_aclinesegment_map=acline_to_mrid_dataframe
+    )
+
+    # assert
+    pd.testing.assert_frame_equal(dd20_dataframe, original_dd20_dataframe)
+    assert mapped_dd20_dataframe.index.name == "LINE_EMSNAME"
+    assert "acline_name_translated" not in mapped_dd20_dataframe.columns
+    pd.testing.assert_frame_equal(
+        staged_dataframe,
+        create_aclinesegment_dataframe(
+            dd20_data=dd20_dataframe,
+            dd20_to_scada_name_map=acline_namemap_dataframe,
+            scada_aclinesegment_map=acline_to_mrid_dataframe,
+        ),
+    )
+
+
+def test_join_aclinesegment_dataframe_keeps_pandas_join_order(caplog):
+    """
+    Verifies that the join on name codes gives the same rows in the same order as a pandas join,
+    with AC-lines mapped to several DD20 rows and missing names, and that AC-lines only in one dataframe are reported
+    and logged once
+    """
+    # arrange
+    mapped_dd20_dataframe = pd.DataFrame(
+        {"CONDUCTOR_COUNT": [1, 2, 3, 4, 5]},
+        index=pd.Index(["E_AAA-BBB", "E_CCC-DDD", "E_AAA-BBB", nan, "E_EEE-FFF"], name="LINE_EMSNAME"),
+    )
+    scada_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3", "mrid-4", "mrid-5"],
+            "LINE_EMSNAME": ["E_CCC-DDD", "E_GGG-HHH", "E_AAA-BBB", None, "E_CCC-DDD"],
+            "DLR_ENABLED": [False, True, True, False, True],
+        },
+        index=[4, 3, 2, 1, 0],
+    )
+    expected_dataframe = scada_dataframe.join(mapped_dd20_dataframe, on="LINE_EMSNAME", how="inner")
+
+    # act
+    with caplog.at_level(logging.INFO):
+        resulting_dataframe = join_aclinesegment_dataframe(
+            mapped_dd20_data=mapped_dd20_dataframe, scada_aclinesegment_map=scada_dataframe
+        )
+
+    # assert
+    pd.testing.assert_frame_equal(resulting_dataframe, expected_dataframe)
+    assert resulting_dataframe["ACLINESEGMENT_MRID"].to_list() == ["mrid-1", "mrid-3", "mrid-3", "mrid-4", "mrid-5"]
+    assert resulting_dataframe.attrs["reconciliation_report"] == {
+        "aclinesegment_count": 5,
+        "dd20_only_count": 1,
+        "dd20_only_samples": ["E_EEE-FFF"],
+        "scada_only_count": 1,
+        "scada_only_samples": ["E_GGG-HHH"],
+        "dlr_enabled_without_conductor_data_count": 1,
+        "dlr_enabled_without_conductor_data_samples": ["E_GGG-HHH"],
+    }
+    assert len(caplog.records) == 2
+
+
+def test_enforce_aclinesegment_schema():
+    """
+    Verifies that columns are cast to compact dtypes without changing values
+    """
+    # arrange
+    dlr_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3"],
+            "LINE_EMSNAME": ["E_AAA-BBB", "E_AAA-BBB", "C_CCC-DDD"],
+            "DLR_ENABLED": [True, False, True],
+            "DATASOURCE": ["DD20", "DD20", "DD20"],
+            "CONDUCTOR_COUNT": [1, 2, 1],
+            "RESTRICT_CONDUCTOR_LIM_CONTINUOUS": [1168.0, 1372.5, nan],
+            "RESTRICT_COMPONENT_LIM_15M": [1000.0, nan, 800.0],
+            "RESTRICT_CABLE_LIM_15M": [nan, nan, 800.0],
+        }
+    )
+
+    # act
+    compact_dataframe = enforce_aclinesegment_schema(dlr_dataframe=dlr_dataframe)
+
+    # assert
+    assert compact_dataframe["ACLINESEGMENT_MRID"].dtype == object
+    assert compact_dataframe["LINE_EMSNAME"].dtype == "category"
+    assert compact_dataframe["DLR_ENABLED"].dtype == bool
+    assert compact_dataframe["DATASOURCE"].dtype == "category"
+    assert compact_dataframe["CONDUCTOR_COUNT"].dtype == "Int32"
+    assert compact_dataframe["RESTRICT_COMPONENT_LIM_15M"].dtype == "Int32"
+    assert compact_dataframe["RESTRICT_CABLE_LIM_15M"].dtype == "float32"
+    # Values which are not whole numbers are kept by casting to float32 instead of Int32
+    assert compact_dataframe["RESTRICT_CONDUCTOR_LIM_CONTINUOUS"].dtype == "float32"
+    pd.testing.assert_frame_equal(
+        compact_dataframe.astype(dlr_dataframe.dtypes.to_dict()), dlr_dataframe
+    )
+
+
+def test_enforce_aclinesegment_schema_numeric_strings():
+    """
+    Verifies that numeric columns with values as strings are cast to compact dtypes
+    """
+    # arrange
+    dlr_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2"],
+            "CONDUCTOR_COUNT": ["1.0", "2"],
+            "RESTRICT_CONDUCTOR_LIM_CONTINUOUS": ["1168.5", None],
+            "RESTRICT_CABLE_LIM_15M": ["800", None],
+        }
+    )
+
+    # act
+    compact_dataframe = enforce_aclinesegment_schema(dlr_dataframe=dlr_dataframe)
+
+    # assert
+    pd.testing.assert_frame_equal(
+        compact_dataframe,
+        pd.DataFrame(
+            {
+                "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2"],
+                "CONDUCTOR_COUNT": pd.array([1, 2], dtype="Int32"),
+                "RESTRICT_CONDUCTOR_LIM_CONTINUOUS": pd.array([1168.5, nan], dtype="float32"),
+                "RESTRICT_CABLE_LIM_15M": pd.array([800.0, nan], dtype="float32"),
+            }
+        ),
+    )
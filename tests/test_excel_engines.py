@@ -0,0 +1,122 @@
+"""
+Tests for verifying that results are identical for all excel engines
+"""
+import pandas as pd
+import os
+import pytest
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "benchmarks"))
+
+import generate_testdata
+from helpers.excel_reader import resolve_excel_engine, is_calamine_available
+from helpers.parse_dd20 import parse_dd20_excelsheets_to_dataframe
+from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
+
+TESTDATA_PATH = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata"
+STATION_DATA_VALID_HASH = "94d5d5019d83350980b49e884159b215"
+LINE_DATA_VALID_HASH = "86e61101fa327e1b4f769c26300be01f"
+
+ENGINES = [
+    "openpyxl",
+    pytest.param(
+        "calamine", marks=pytest.mark.skipif(not is_calamine_available(), reason="calamine engine not available")
+    ),
+]
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+@pytest.mark.parametrize("sheetname", ["Stationsdata", "Linjedata - Sommer"])
+def test_dd20_sheets_are_identical_for_engine(engine, sheetname):
+    """
+    Verifies that DD20 sheets are read identically to the openpyxl engine, including header names used for hash
+    """
+    pd.testing.assert_frame_equal(
+        pd.read_excel(f"{TESTDATA_PATH}/DD20.XLSM", sheet_name=sheetname, header=1, engine=engine),
+        pd.read_excel(f"{TESTDATA_PATH}/DD20.XLSM", sheet_name=sheetname, header=1, engine="openpyxl"),
+    )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parse_dd20_excelsheets_to_dataframe_is_identical_for_engine(engine):
+    """
+    Verifies that parsed DD20 dataframe is identical to the openpyxl engine
+    """
+    pd.testing.assert_frame_equal(
+        parse_dd20_excelsheets_to_dataframe(
+            file_path=f"{TESTDATA_PATH}/DD20.XLSM",
+            line_data_valid_hash=LINE_DATA_VALID_HASH,
+            station_data_valid_hash=STATION_DATA_VALID_HASH,
+            engine=engine,
+        ),
+        parse_dd20_excelsheets_to_dataframe(
+            file_path=f"{TESTDATA_PATH}/DD20.XLSM",
+            line_data_valid_hash=LINE_DATA_VALID_HASH,
+            station_data_valid_hash=STATION_DATA_VALID_HASH,
+            engine="openpyxl",
+        ),
+    )
+
+
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parse_acline_namemap_excelsheet_to_dataframe_is_identical_for_engine(engine):
+    """
+    Verifies that parsed name mapping dataframe is identical to the openpyxl engine
+    """
+    pd.testing.assert_frame_equal(
+        parse_acline_namemap_excelsheet_to_dataframe(file_path=f"{TESTDATA_PATH}/Limits_other.xlsx", engine=engine),
+        parse_acline_namemap_excelsheet_to_dataframe(file_path=f"{TESTDATA_PATH}/Limits_other.xlsx", engine="openpyxl"),
+    )
+
+
+def parse_generated_dd20(testdata: generate_testdata.GeneratedTestdata, engine: str, streaming: bool):
+    return parse_dd20_excelsheets_to_dataframe(
+        file_path=testdata.dd20_filepath,
+        line_data_valid_hash=generate_testdata.LINE_DATA_VALID_HASH,
+        station_data_valid_hash=generate_testdata.STATION_DATA_VALID_HASH,
+        streaming=streaming,
+        engine=engine,
+    )
+
+
+@pytest.fixture(scope="module")
+def generated_testdata(tmp_path_factory) -> tuple[generate_testdata.GeneratedTestdata, pd.DataFrame]:
+    """
+    Generated DD20 with 800 AC-lines, including parallel lines and empty limit cells,
+    and the dataframe parsed from it with the openpyxl engine without streaming.
+    """
+    testdata = generate_testdata.generate_testdata(
+        output_dir=str(tmp_path_factory.mktemp("generated")), acline_count=800
+    )
+    return testdata, parse_generated_dd20(testdata, engine="openpyxl", streaming=False)
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+@pytest.mark.parametrize("engine", ENGINES)
+def test_parse_generated_dd20_is_identical_for_engine(generated_testdata, engine, streaming):
+    """
+    Verifies that a generated DD20 with 800 AC-lines is parsed identically by each engine and by streaming
+    """
+    testdata, expected_dataframe = generated_testdata
+
+    dataframe = parse_generated_dd20(testdata, engine=engine, streaming=streaming)
+
+    assert len(dataframe) == 800
+    pd.testing.assert_frame_equal(dataframe, expected_dataframe)
+
+
+def test_resolve_excel_engine():
+    """
+    Verifies that calamine is only picked when available and that openpyxl is used as fallback
+    """
+    expected_engine = "calamine" if is_calamine_available() else "openpyxl"
+
+    assert resolve_excel_engine("openpyxl") == "openpyxl"
+    assert resolve_excel_engine("calamine") == expected_engine
+    assert resolve_excel_engine("auto") == expected_engine
+
+    with pytest.raises(ValueError):
+        resolve_excel_engine("xlrd")
@@ -0,0 +1,50 @@
+import pandas as pd
+import os
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.excel_reader import read_excelsheets_streaming
+
+DD20_FILE_PATH = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata/DD20.XLSM"
+DD20_SHEETNAME_STATIONSDATA = "Stationsdata"
+DD20_SHEETNAME_LINJEDATA = "Linjedata - Sommer"
+
+
+def test_read_excelsheets_streaming():
+    """
+    Verifies that streamed columns are identical to the same columns read with pandas
+    """
+    # arrange dataframes read in full with pandas
+    expected_dataframes = pd.read_excel(
+        io=DD20_FILE_PATH,
+        sheet_name=[DD20_SHEETNAME_STATIONSDATA, DD20_SHEETNAME_LINJEDATA],
+        header=1,
+    )
+
+    # Streaming columns by name and position
+    streamed_sheets = read_excelsheets_streaming(
+        file_path=DD20_FILE_PATH,
+        sheet_columns={
+            DD20_SHEETNAME_STATIONSDATA: ["Linjenavn", "Kommentar.1", "Unnamed: 5"],
+            DD20_SHEETNAME_LINJEDATA: ["I-kontinuert", "System", *range(41, 97)],
+        },
+        header_index=1,
+    )
+
+    # Test all column names are as pandas names them
+    for sheetname, streamed_sheet in streamed_sheets.items():
+        assert streamed_sheet.header_columns == expected_dataframes[sheetname].columns.to_list()
+
+    # Test selected columns are kept in order of sheet
+    assert streamed_sheets[DD20_SHEETNAME_STATIONSDATA].column_positions == [0, 5, 31]
+    assert streamed_sheets[DD20_SHEETNAME_LINJEDATA].column_positions == [0, 8, *range(41, 97)]
+
+    # Test values and dtypes are identical to pandas
+    for sheetname, streamed_sheet in streamed_sheets.items():
+        pd.testing.assert_frame_equal(
+            streamed_sheet.dataframe,
+            expected_dataframes[sheetname].iloc[:, streamed_sheet.column_positions],
+        )
@@ -0,0 +1,43 @@
+import os
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.file_hash import calculate_file_hash, get_file_signature
+
+
+def test_calculate_file_hash(tmp_path):
+    """
+    Verifies that file hash only depends on file content
+    """
+    file_a = tmp_path / "a.csv"
+    file_b = tmp_path / "b.csv"
+    file_a.write_bytes(b"ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED\n")
+    file_b.write_bytes(b"ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED\n")
+
+    assert calculate_file_hash(str(file_a)) == calculate_file_hash(str(file_b), chunk_size=7)
+
+    file_b.write_bytes(b"ACLINESEGMENT_MRID,LINE_EMSNAME\n")
+    assert calculate_file_hash(str(file_a)) != calculate_file_hash(str(file_b))
+
+
+def test_get_file_signature(tmp_path):
+    """
+    Verifies that file is only hashed again when modified, and that hash only changes with content
+    """
+    file_path = tmp_path / "a.csv"
+    file_path.write_bytes(b"ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED\n")
+    signature = get_file_signature(str(file_path))
+
+    assert get_file_signature(str(file_path), previous_signature=signature) is signature
+
+    # Touching the file gives a new signature with the same hash
+    os.utime(file_path, (signature.mtime + 10, signature.mtime + 10))
+    touched_signature = get_file_signature(str(file_path), previous_signature=signature)
+    assert touched_signature != signature
+    assert touched_signature.hash == signature.hash
+
+    file_path.write_bytes(b"ACLINESEGMENT_MRID,LINE_EMSNAME\n")
+    assert get_file_signature(str(file_path), previous_signature=touched_signature).hash != signature.hash
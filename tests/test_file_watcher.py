@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+import pytest
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.file_watcher import FileWatcher, is_inotify_available
+
+requires_inotify = pytest.mark.skipif(not is_inotify_available(), reason="inotify is not available")
+
+
+def write_later(file_path, content: bytes, delay: float = 0.1):
+    """Write content to file from a separate thread after a delay"""
+    timer = threading.Timer(delay, lambda: file_path.write_bytes(content))
+    timer.start()
+    return timer
+
+
+def test_file_watcher_poll_mode(tmp_path):
+    """
+    Verifies that poll mode wakes up after the poll interval
+    """
+    file_path = tmp_path / "a.csv"
+    file_path.write_bytes(b"a")
+
+    with FileWatcher([str(file_path)], mode="poll", poll_interval=0.05) as watcher:
+        assert watcher.mode == "poll"
+        assert watcher.wait() is True
+        assert watcher.wait(timeout=0.01) is False
+
+
+def test_file_watcher_invalid_mode(tmp_path):
+    """
+    Verifies that an invalid mode raises an error
+    """
+    with pytest.raises(ValueError):
+        FileWatcher([str(tmp_path / "a.csv")], mode="sleep")
+
+
+@requires_inotify
+def test_file_watcher_inotify_write(tmp_path):
+    """
+    Verifies that writing a watched file wakes up the watcher, while other files in the directory are ignored
+    """
+    file_path = tmp_path / "a.csv"
+    file_path.write_bytes(b"a")
+
+    with FileWatcher([str(file_path)], mode="inotify", debounce=0.05) as watcher:
+        assert watcher.mode == "inotify"
+        assert watcher.wait(timeout=0.05) is False
+
+        write_later(tmp_path / "other.csv", b"b").join()
+        assert watcher.wait(timeout=0.2) is False
+
+        timer = write_later(file_path, b"b")
+        assert watcher.wait(timeout=5) is True
+        timer.join()
+
+
+@requires_inotify
+def test_file_watcher_inotify_atomic_rename(tmp_path):
+    """
+    Verifies that a burst of events from writing a temporary file and renaming it gives a single wakeup
+    """
+    file_path = tmp_path / "a.csv"
+    file_path.write_bytes(b"a")
+
+    def replace_file():
+        temporary_path = tmp_path / "a.csv.tmp"
+        temporary_path.write_bytes(b"b")
+        os.replace(temporary_path, file_path)
+
+    with FileWatcher([str(file_path)], mode="inotify", debounce=0.1) as watcher:
+        timer = threading.Timer(0.1, replace_file)
+        timer.start()
+        assert watcher.wait(timeout=5) is True
+        timer.join()
+
+        assert watcher.wait(timeout=0.2) is False
+        assert file_path.read_bytes() == b"b"
+
+
+@requires_inotify
+@pytest.mark.parametrize("existing_file", [True, False])
+def test_file_watcher_inotify_slow_writer(tmp_path, existing_file):
+    """
+    Verifies that a file written slowly in several writes only wakes up the watcher when it is closed,
+    both when an existing file is truncated and rewritten and when a new file is created
+    """
+    file_path = tmp_path / "a.csv"
+    if existing_file:
+        file_path.write_bytes(b"a\n")
+    closed = threading.Event()
+
+    def write_slowly():
+        with open(file_path, "wb") as file:
+            for row in range(5):
+                file.write(f"row-{row}\n".encode())
+                file.flush()
+                os.fsync(file.fileno())
+                time.sleep(0.1)
+        closed.set()
+
+    with FileWatcher([str(file_path)], mode="inotify", debounce=0.05) as watcher:
+        writer = threading.Thread(target=write_slowly)
+        writer.start()
+        assert watcher.wait(timeout=5) is True
+        assert closed.is_set()
+        writer.join()
+
+
+def test_file_watcher_missing_directory_falls_back_to_poll(tmp_path):
+    """
+    Verifies that polling is used if the directory of a file cannot be watched
+    """
+    with FileWatcher([str(tmp_path / "missing" / "a.csv")], mode="auto", poll_interval=0.01) as watcher:
+        assert watcher.mode == "poll"
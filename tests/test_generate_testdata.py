@@ -0,0 +1,39 @@
+import os
+import pandas as pd
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "benchmarks"))
+
+from generate_testdata import generate_testdata, STATION_DATA_VALID_HASH, LINE_DATA_VALID_HASH
+from helpers.parse_dd20 import parse_dd20_excelsheets_to_dataframe
+from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
+from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
+from helpers.combine_data import create_aclinesegment_dataframe
+
+
+def test_generate_testdata(tmp_path):
+    """
+    Verifies that generated benchmark files have valid header hashes and can be parsed and combined
+    """
+    testdata = generate_testdata(output_dir=str(tmp_path), acline_count=60, parallel_fraction=0.2, mapped_fraction=0.1)
+
+    dd20_dataframe = parse_dd20_excelsheets_to_dataframe(
+        file_path=testdata.dd20_filepath,
+        station_data_valid_hash=STATION_DATA_VALID_HASH,
+        line_data_valid_hash=LINE_DATA_VALID_HASH,
+    )
+    namemap_dataframe = parse_acline_namemap_excelsheet_to_dataframe(file_path=testdata.dd20_mapping_filepath)
+    mrid_dataframe = parse_aclineseg_scada_csvdata_to_dataframe(file_path=testdata.mrid_mapping_filepath)
+
+    assert len(dd20_dataframe) == 60
+    assert not namemap_dataframe.empty
+    assert dd20_dataframe["restrict_component_lim_continuous"].notna().all()
+
+    aclinesegment_dataframe = create_aclinesegment_dataframe(
+        dd20_data=dd20_dataframe, dd20_to_scada_name_map=namemap_dataframe, scada_aclinesegment_map=mrid_dataframe
+    )
+    assert set(aclinesegment_dataframe["ACLINE_NAME_DATASOURCE"]) == set(dd20_dataframe["acline_name_datasource"])
+    pd.testing.assert_index_equal(aclinesegment_dataframe.index, aclinesegment_dataframe.index.unique())
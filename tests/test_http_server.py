@@ -0,0 +1,41 @@
+import os
+import pytest
+from urllib.request import urlopen
+from urllib.error import HTTPError
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.http_server import HTTPServer, HTTPResponse
+
+
+def test_http_server_routes():
+    """
+    Verifies that requests are routed to handlers, and that unknown paths and failing handlers give errors
+    """
+    def fail(request):
+        raise ValueError("Handler failed")
+
+    http_server = HTTPServer(port=0, host="127.0.0.1")
+    http_server.add_route("/echo", lambda request: HTTPResponse(body=request.query.get("text", ""), headers={"X-Test": "1"}))
+    http_server.add_route("/fail", fail)
+    http_server.start()
+    url = f"http://127.0.0.1:{http_server.port}"
+
+    try:
+        with urlopen(f"{url}/echo?text=hello") as response:
+            assert response.status == 200
+            assert response.headers["X-Test"] == "1"
+            assert response.read() == b"hello"
+
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"{url}/missing")
+        assert error.value.code == 404
+
+        with pytest.raises(HTTPError) as error:
+            urlopen(f"{url}/fail")
+        assert error.value.code == 500
+    finally:
+        http_server.stop()
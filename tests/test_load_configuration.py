@@ -1,5 +1,11 @@
 from distutils.command.config import config
 import os
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
 from app.configuration import DD20Settings
 from pydantic import ValidationError
 
@@ -76,6 +82,14 @@ def arrange_dd20_settings() -> DD20Settings:
         debug=True,
         line_data_valid_hash="A",
         station_data_valid_hash="B",
+        dd20_streaming_read=True,
+        excel_engine="calamine",
+        parse_cache_dir="/zzzz/cache",
+        parallel_parse=True,
+        compact_dtypes=True,
+        mrid_csv_chunk_size=1048576,
+        file_watch_mode="poll",
+        file_watch_debounce=2.5,
         dd20_filepath="/xxxx/DD20.XLSM",
         dd20_mapping_filepath="/xxxx/Limits_other.xlsx",
         mrid_mapping_filepath="/xxxx/seg_line_mrid_PROD.csv",
@@ -85,6 +99,7 @@ def arrange_dd20_settings() -> DD20Settings:
         api_port=9999,
         api_dbname="SOME_DB_NAME",
         api_refresh_rate=100,
+        http_port=9998,
         use_mock_data=False,
     )
 
@@ -96,6 +111,14 @@ def arrange_default_dd20_settings() -> DD20Settings:
         debug=False,
         line_data_valid_hash="86e61101fa327e1b4f769c26300be01f",
         station_data_valid_hash="6ac10cff51c6dbc586e729e10b943854",
+        dd20_streaming_read=False,
+        excel_engine="openpyxl",
+        parse_cache_dir="",
+        parallel_parse=False,
+        compact_dtypes=False,
+        mrid_csv_chunk_size=0,
+        file_watch_mode="auto",
+        file_watch_debounce=0.5,
         dd20_filepath="/input/DD20.XLSM",
         dd20_mapping_filepath="/input/Limits_other.xlsx",
         mrid_mapping_filepath="/input/seg_line_mrid_PROD.csv",
@@ -105,6 +128,7 @@ def arrange_default_dd20_settings() -> DD20Settings:
         api_port=5000,
         api_dbname="CONDUCTOR_DATA",
         api_refresh_rate=60,
+        http_port=0,
         use_mock_data=False,
     )
 
@@ -114,6 +138,14 @@ def set_dd20_environment_variables(settings: DD20Settings):
     """write settings to environment variables"""
     os.environ["LINE_DATA_VALID_HASH"] = settings.line_data_valid_hash
     os.environ["STATION_DATA_VALID_HASH"] = settings.station_data_valid_hash
+    os.environ["DD20_STREAMING_READ"] = str(settings.dd20_streaming_read)
+    os.environ["EXCEL_ENGINE"] = settings.excel_engine
+    os.environ["PARSE_CACHE_DIR"] = settings.parse_cache_dir
+    os.environ["PARALLEL_PARSE"] = str(settings.parallel_parse)
+    os.environ["COMPACT_DTYPES"] = str(settings.compact_dtypes)
+    os.environ["MRID_CSV_CHUNK_SIZE"] = str(settings.mrid_csv_chunk_size)
+    os.environ["FILE_WATCH_MODE"] = settings.file_watch_mode
+    os.environ["FILE_WATCH_DEBOUNCE"] = str(settings.file_watch_debounce)
     os.environ["DD20_FILEPATH"] = settings.dd20_filepath
     os.environ["DD20_MAPPING_FILEPATH"] = settings.dd20_mapping_filepath
     os.environ["MRID_MAPPING_FILEPATH"] = settings.mrid_mapping_filepath
@@ -123,6 +155,7 @@ def set_dd20_environment_variables(settings: DD20Settings):
     os.environ["API_PORT"] = str(settings.api_port)
     os.environ["API_DBNAME"] = settings.api_dbname
     os.environ["API_REFRESH_RATE"] = str(settings.api_refresh_rate)
+    os.environ["HTTP_PORT"] = str(settings.http_port)
     os.environ["USE_MOCK_DATA"] = str(settings.use_mock_data)
     os.environ["DEBUG"] = str(settings.debug)   
 
@@ -130,6 +163,14 @@ def clear_dd20_environment_variables():
     """clear all dd20 related environamnet variables """
     os.environ.pop("LINE_DATA_VALID_HASH", None)
     os.environ.pop("STATION_DATA_VALID_HASH", None)
+    os.environ.pop("DD20_STREAMING_READ", None)
+    os.environ.pop("EXCEL_ENGINE", None)
+    os.environ.pop("PARSE_CACHE_DIR", None)
+    os.environ.pop("PARALLEL_PARSE", None)
+    os.environ.pop("COMPACT_DTYPES", None)
+    os.environ.pop("MRID_CSV_CHUNK_SIZE", None)
+    os.environ.pop("FILE_WATCH_MODE", None)
+    os.environ.pop("FILE_WATCH_DEBOUNCE", None)
     os.environ.pop("DD20_FILEPATH", None)
     os.environ.pop("DD20_MAPPING_FILEPATH", None)
     os.environ.pop("MRID_MAPPING_FILEPATH", None)
@@ -139,5 +180,6 @@ def clear_dd20_environment_variables():
     os.environ.pop("API_PORT", None)
     os.environ.pop("API_DBNAME", None)
     os.environ.pop("API_REFRESH_RATE", None)
+    os.environ.pop("HTTP_PORT", None)
     os.environ.pop("USE_MOCK_DATA", None)
     os.environ.pop("DEBUG", None)
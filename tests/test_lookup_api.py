@@ -0,0 +1,166 @@
+import os
+import json
+import pandas as pd
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.http_server import HTTPRequest
+from helpers.snapshot_store import SnapshotStore
+from helpers.lookup_api import LookupAPI, MAX_LOOKUP_KEYS
+
+
+def test_get_aclinesegments():
+    """
+    Verifies lookups by MRID and AC-line name, and responses for missing data and invalid requests
+    """
+    # arrange
+    snapshot_store = SnapshotStore()
+    lookup_api = LookupAPI(snapshot_store)
+    dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3"],
+            "LINE_EMSNAME": ["E_GGG-HHH", "E_GGG-HHH", "D_CCC-DDD"],
+            "DLR_ENABLED": [True, False, True],
+        }
+    )
+
+    # act / assert
+    assert lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": "mrid-1"})).status == 503
+
+    snapshot_store.publish(dataframe)
+
+    response = lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": "mrid-1"}))
+    assert response.status == 200
+    assert response.content_type == "application/json"
+    assert json.loads(response.body) == {
+        "generation": 1,
+        "records": [{"ACLINESEGMENT_MRID": "mrid-1", "LINE_EMSNAME": "E_GGG-HHH", "DLR_ENABLED": True}],
+    }
+
+    response = lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": "mrid-3, mrid-2"}))
+    assert [record["ACLINESEGMENT_MRID"] for record in json.loads(response.body)["records"]] == ["mrid-3", "mrid-2"]
+
+    response = lookup_api.get_aclinesegments(
+        HTTPRequest(path="/aclinesegments", query={"line_emsname": "E_GGG-HHH"})
+    )
+    assert len(json.loads(response.body)["records"]) == 2
+
+    assert lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": "unknown"})).status == 404
+    assert lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments")).status == 400
+    assert lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": ","})).status == 400
+    too_many_mrids = ",".join(f"mrid-{index}" for index in range(MAX_LOOKUP_KEYS + 1))
+    assert (
+        lookup_api.get_aclinesegments(HTTPRequest(path="/aclinesegments", query={"mrid": too_many_mrids})).status
+        == 400
+    )
+
+
+def test_get_all_aclinesegments():
+    """
+    Verifies that all ACLineSegments are served as rendered at publish, and that a matching ETag gives 304
+    """
+    # arrange
+    snapshot_store = SnapshotStore()
+    lookup_api = LookupAPI(snapshot_store)
+    dataframe = pd.DataFrame({"ACLINESEGMENT_MRID": ["mrid-1", "mrid-2"], "LINE_EMSNAME": ["E_GGG-HHH", "D_CCC-DDD"]})
+    snapshot_store.publish(dataframe)
+
+    # act
+    json_response = lookup_api.get_all_aclinesegments(HTTPRequest(path="/aclinesegments.json"), "json")
+    csv_response = lookup_api.get_all_aclinesegments(HTTPRequest(path="/aclinesegments.csv"), "csv")
+    not_modified_response = lookup_api.get_all_aclinesegments(
+        HTTPRequest(
+            path="/aclinesegments.json", headers={"if-none-match": f'"other", W/{json_response.headers["ETag"]}'}
+        ),
+        "json",
+    )
+    snapshot_store.publish(dataframe.iloc[:1])
+    modified_response = lookup_api.get_all_aclinesegments(
+        HTTPRequest(path="/aclinesegments.json", headers={"if-none-match": json_response.headers["ETag"]}), "json"
+    )
+
+    # assert
+    assert json_response.status == 200
+    assert json.loads(json_response.body) == dataframe.to_dict("records")
+    assert json_response.headers["X-Generation"] == "1"
+    assert csv_response.body == dataframe.to_csv(index=False).encode("utf-8")
+    assert csv_response.headers["ETag"] != json_response.headers["ETag"]
+    assert not_modified_response.status == 304
+    assert not_modified_response.body == b""
+    assert modified_response.status == 200
+    assert modified_response.headers["X-Generation"] == "2"
+    assert json.loads(modified_response.body) == dataframe.iloc[:1].to_dict("records")
+
+
+def test_get_aclinesegment_changes():
+    """
+    Verifies that changes since a generation are served, and that unavailable generations give 410
+    """
+    # arrange
+    snapshot_store = SnapshotStore(max_history=2)
+    lookup_api = LookupAPI(snapshot_store)
+    dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2"],
+            "LINE_EMSNAME": ["E_GGG-HHH", "E_GGG-HHH"],
+            "CONDUCTOR_COUNT": [1, 1],
+        }
+    )
+    changed_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-3"],
+            "LINE_EMSNAME": ["E_GGG-HHH", "E_GGG-HHH"],
+            "CONDUCTOR_COUNT": [2, 1],
+        }
+    )
+
+    # act
+    snapshot_store.publish(dataframe)
+    snapshot_store.publish(changed_dataframe)
+    response = lookup_api.get_aclinesegment_changes(HTTPRequest(path="/aclinesegments/changes", query={"since": "1"}))
+
+    # assert
+    assert response.status == 200
+    assert json.loads(response.body) == {
+        "generation": 2,
+        "since": 1,
+        "added": [{"ACLINESEGMENT_MRID": "mrid-3", "LINE_EMSNAME": "E_GGG-HHH", "CONDUCTOR_COUNT": 1}],
+        "changed": [{"ACLINESEGMENT_MRID": "mrid-1", "LINE_EMSNAME": "E_GGG-HHH", "CONDUCTOR_COUNT": 2}],
+        "removed": ["mrid-2"],
+    }
+    assert (
+        lookup_api.get_aclinesegment_changes(HTTPRequest(path="/aclinesegments/changes", query={"since": "3"})).status
+        == 410
+    )
+    assert (
+        lookup_api.get_aclinesegment_changes(HTTPRequest(path="/aclinesegments/changes", query={"since": "x"})).status
+        == 400
+    )
+
+
+def test_get_reconciliation_report():
+    """
+    Verifies that the reconciliation report of the current snapshot is served, and 404 if the data has no report
+    """
+    # arrange
+    snapshot_store = SnapshotStore()
+    lookup_api = LookupAPI(snapshot_store)
+    request = HTTPRequest(path="/aclinesegments/reconciliation")
+    dataframe = pd.DataFrame({"ACLINESEGMENT_MRID": ["mrid-1"], "LINE_EMSNAME": ["E_GGG-HHH"]})
+    report = {"aclinesegment_count": 1, "scada_only_count": 1, "scada_only_samples": ["D_CCC-DDD"]}
+
+    # act / assert
+    assert lookup_api.get_reconciliation_report(request).status == 503
+
+    snapshot_store.publish(dataframe)
+    assert lookup_api.get_reconciliation_report(request).status == 404
+
+    dataframe_with_report = dataframe.copy()
+    dataframe_with_report.attrs["reconciliation_report"] = report
+    snapshot_store.publish(dataframe_with_report)
+    response = lookup_api.get_reconciliation_report(request)
+    assert response.status == 200
+    assert json.loads(response.body) == {"generation": 2, "report": report}
@@ -0,0 +1,168 @@
+import os
+import shutil
+import functools
+import pytest
+import pandas as pd
+from unittest import mock
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "benchmarks"))
+
+import main
+from generate_testdata import generate_testdata, STATION_DATA_VALID_HASH, LINE_DATA_VALID_HASH
+
+
+def count_calls(func: callable) -> callable:
+    """
+    Returns function wrapping func, which counts calls of it in its 'calls' attribute.
+    The wrapper has the module and name of func, so parsed dataframes are cached under the same key.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        wrapper.calls += 1
+        return func(*args, **kwargs)
+
+    wrapper.calls = 0
+    return wrapper
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    """
+    Generated input files, and other versions of them with different content for replacing them.
+    Half of the AC-lines are in the name mapping, so it is not empty.
+    """
+    return (
+        generate_testdata(output_dir=str(tmp_path / "inputs"), acline_count=20, mapped_fraction=0.5),
+        generate_testdata(output_dir=str(tmp_path / "other"), acline_count=20, mapped_fraction=0.5, seed=1),
+    )
+
+
+@pytest.fixture
+def parsers():
+    """
+    Parser functions of ACLineSegmentProperties replaced by wrappers counting their calls.
+    """
+    parsers = {
+        "dd20": count_calls(main.parse_dd20_excelsheets_to_dataframe),
+        "namemap": count_calls(main.parse_acline_namemap_excelsheet_to_dataframe),
+        "mrid": count_calls(main.parse_aclineseg_scada_csvdata_to_dataframe),
+    }
+    with mock.patch("main.parse_dd20_excelsheets_to_dataframe", parsers["dd20"]), mock.patch(
+        "main.parse_acline_namemap_excelsheet_to_dataframe", parsers["namemap"]
+    ), mock.patch("main.parse_aclineseg_scada_csvdata_to_dataframe", parsers["mrid"]):
+        yield parsers
+
+
+def create_properties(testdata, **kwargs) -> main.ACLineSegmentProperties:
+    return main.ACLineSegmentProperties(
+        dd20_filepath=testdata.dd20_filepath,
+        dd20_mapping_filepath=testdata.dd20_mapping_filepath,
+        mrid_mapping_filepath=testdata.mrid_mapping_filepath,
+        dd20_line_data_valid_hash=LINE_DATA_VALID_HASH,
+        dd20_station_data_valid_hash=STATION_DATA_VALID_HASH,
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "changed_file, rebuilt_stages",
+    [
+        ("mrid_mapping_filepath", ["join"]),
+        ("dd20_mapping_filepath", ["namemap", "mapped_dd20", "join"]),
+        ("dd20_filepath", ["mapped_dd20", "join"]),
+    ],
+)
+def test_refresh_data_only_rebuilds_join_stages_depending_on_changed_input(inputs, parsers, changed_file, rebuilt_stages):
+    """
+    Verifies that a change of an input file only parses that file and rebuilds the join stages depending on it
+    """
+    # arrange
+    testdata, other_testdata = inputs
+    stages = {
+        "namemap": mock.patch("main.create_acline_namemap_dict", wraps=main.create_acline_namemap_dict),
+        "mapped_dd20": mock.patch("main.create_mapped_dd20_dataframe", wraps=main.create_mapped_dd20_dataframe),
+        "join": mock.patch("main.join_aclinesegment_dataframe", wraps=main.join_aclinesegment_dataframe),
+    }
+    stage_mocks = {name: patch.start() for name, patch in stages.items()}
+    try:
+        properties = create_properties(testdata)
+        initial_dataframe = properties.dataframe
+        assert all(stage_mock.call_count == 1 for stage_mock in stage_mocks.values())
+        for stage_mock in stage_mocks.values():
+            stage_mock.reset_mock()
+
+        # act
+        shutil.copyfile(getattr(other_testdata, changed_file), getattr(testdata, changed_file))
+        dataframe = properties.refresh_data()
+
+    finally:
+        for patch in stages.values():
+            patch.stop()
+
+    # assert
+    assert dataframe is not initial_dataframe
+    assert {name: stage_mock.call_count for name, stage_mock in stage_mocks.items()} == {
+        name: 1 if name in rebuilt_stages else 0 for name in stages
+    }
+    changed_parser = {"dd20_filepath": "dd20", "dd20_mapping_filepath": "namemap", "mrid_mapping_filepath": "mrid"}
+    assert {name: parser.calls for name, parser in parsers.items()} == {
+        name: 2 if name == changed_parser[changed_file] else 1 for name in parsers
+    }
+
+
+def test_refresh_data_skips_parse_of_touched_but_unchanged_inputs(inputs, parsers):
+    """
+    Verifies that an input file with a new modification time, but unchanged content, is not parsed again,
+    while a change of content is parsed and gives a new dataframe.
+    """
+    # arrange
+    testdata, other_testdata = inputs
+    properties = create_properties(testdata)
+    initial_dataframe = properties.dataframe
+    mtime = os.stat(testdata.mrid_mapping_filepath).st_mtime_ns + 10**9
+
+    # act
+    os.utime(testdata.mrid_mapping_filepath, ns=(mtime, mtime))
+    expected_mtime = os.stat(testdata.mrid_mapping_filepath).st_mtime
+    touched_dataframe = properties.refresh_data()
+    touched_parser_calls = {name: parser.calls for name, parser in parsers.items()}
+    touched_mtime = properties.metadata["MRID mapping"]["mtime"]
+    shutil.copyfile(other_testdata.mrid_mapping_filepath, testdata.mrid_mapping_filepath)
+    changed_dataframe = properties.refresh_data()
+
+    # assert
+    assert touched_dataframe is initial_dataframe
+    assert touched_parser_calls == {"dd20": 1, "namemap": 1, "mrid": 1}
+    assert touched_mtime == expected_mtime
+    assert changed_dataframe is not initial_dataframe
+    assert parsers["mrid"].calls == 2
+
+
+def test_parse_cache_is_reused_between_instances(inputs, parsers, tmp_path):
+    """
+    Verifies that a second instance with the same parse cache directory loads all parsed dataframes from cache,
+    and gives the same combined dataframe and parse statistics as the first instance.
+    """
+    # arrange
+    testdata, _ = inputs
+    parse_cache_dir = str(tmp_path / "parse-cache")
+    # A malformed row, so parse statistics of the MRID mapping are not empty
+    with open(testdata.mrid_mapping_filepath, "a") as file:
+        file.write("malformed-mrid,E_MALFORMED,YES,EXTRA\n")
+    first_properties = create_properties(testdata, parse_cache_dir=parse_cache_dir)
+    for parser in parsers.values():
+        parser.calls = 0
+
+    # act
+    second_properties = create_properties(testdata, parse_cache_dir=parse_cache_dir)
+
+    # assert
+    assert {name: parser.calls for name, parser in parsers.items()} == {"dd20": 0, "namemap": 0, "mrid": 0}
+    pd.testing.assert_frame_equal(second_properties.dataframe, first_properties.dataframe)
+    assert second_properties.dataframe.attrs == first_properties.dataframe.attrs
+    assert second_properties.metadata == first_properties.metadata
+    assert second_properties.metadata["MRID mapping"]["parse_stats"]["skipped_row_count"] == 1
@@ -0,0 +1,57 @@
+import os
+import pytest
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.metrics import MetricsRegistry
+
+
+def test_metrics_registry_render():
+    """
+    Verifies that counters, gauges and histograms are rendered in Prometheus text format
+    """
+    registry = MetricsRegistry(buckets=(0.1, 1, float("inf")))
+    registry.inc("rows_total", 5, labels={"input": "DD20"}, help="Rows parsed.")
+    registry.inc("rows_total", 2, labels={"input": "DD20"})
+    registry.set("aclinesegments", 6)
+    registry.observe("duration_seconds", 0.05, labels={"stage": "join"})
+    registry.observe("duration_seconds", 0.5, labels={"stage": "join"})
+
+    assert registry.render().splitlines() == [
+        "# TYPE aclinesegments gauge",
+        "aclinesegments 6",
+        "# TYPE duration_seconds histogram",
+        'duration_seconds_bucket{stage="join",le="0.1"} 1',
+        'duration_seconds_bucket{stage="join",le="1"} 2',
+        'duration_seconds_bucket{stage="join",le="+Inf"} 2',
+        'duration_seconds_sum{stage="join"} 0.55',
+        'duration_seconds_count{stage="join"} 2',
+        "# HELP rows_total Rows parsed.",
+        "# TYPE rows_total counter",
+        'rows_total{input="DD20"} 7',
+    ]
+
+    with pytest.raises(ValueError):
+        registry.set("rows_total", 1)
+
+
+def test_metrics_registry_merge_and_time_stage():
+    """
+    Verifies that a snapshot is added to another registry, and that stages are timed also when they fail
+    """
+    worker_registry = MetricsRegistry()
+    worker_registry.inc("rows_total", 3)
+    with pytest.raises(ValueError):
+        with worker_registry.time_stage("dd20_read"):
+            raise ValueError("Parsing failed")
+
+    registry = MetricsRegistry()
+    registry.inc("rows_total", 1)
+    registry.merge(worker_registry.snapshot())
+
+    rendered_lines = registry.render().splitlines()
+    assert "rows_total 4" in rendered_lines
+    assert 'conductor_data_stage_duration_seconds_count{stage="dd20_read"} 1' in rendered_lines
@@ -1,10 +1,18 @@
 import pandas as pd
 import os
+import pytest
+from numpy import nan
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
 
 from app.helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
 
 
-def test_parse_aclineseg_scada_csvdata_to_dataframe():
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_parse_aclineseg_scada_csvdata_to_dataframe(engine):
     """
     Verifies that CSV-file with ACLineSegment mapping is parsed correctly
     """
@@ -37,7 +45,7 @@ def test_parse_aclineseg_scada_csvdata_to_dataframe():
     # Creating resulting dataframe from valid testfile
     mrid_mapping_filepath = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata/seg_line_mrid_PROD.csv"
     resulting_aclinesegment_to_mrid_dataframe = parse_aclineseg_scada_csvdata_to_dataframe(
-        file_path=mrid_mapping_filepath
+        file_path=mrid_mapping_filepath, engine=engine
     )
 
     # assert
@@ -47,3 +55,124 @@ def test_parse_aclineseg_scada_csvdata_to_dataframe():
         )
         is None
     )
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_parse_aclineseg_scada_csvdata_to_dataframe_bad_lines(tmp_path, engine):
+    """
+    Verifies that rows with too many values are skipped, rows with too few values are kept,
+    and that any DLR enabled value but "NO" is True
+    """
+    # arrange
+    mrid_mapping_filepath = tmp_path / "seg_line_mrid_PROD.csv"
+    mrid_mapping_filepath.write_bytes(
+        (
+            "ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED\r\n"
+            + "------------------,------------,-----------\r\n"
+            + "mrid-1,C_III-ÆØÅ,YES\r\n"
+            + "mrid-2,E_GGG-HHH,NO,extra\r\n"
+            + "mrid-3,E_GGG-HHH,NO\r\n"
+            + "mrid-4,D_CCC-DDD\r\n"
+            + "mrid-5,,MAYBE\r\n"
+        ).encode("cp1252")
+    )
+
+    # act
+    resulting_dataframe = parse_aclineseg_scada_csvdata_to_dataframe(
+        file_path=str(mrid_mapping_filepath), engine=engine
+    )
+
+    # assert
+    pd.testing.assert_frame_equal(
+        resulting_dataframe,
+        pd.DataFrame(
+            {
+                "ACLINESEGMENT_MRID": ["mrid-1", "mrid-3", "mrid-4", "mrid-5"],
+                "LINE_EMSNAME": ["C_III-ÆØÅ", "E_GGG-HHH", "D_CCC-DDD", nan],
+                "DLR_ENABLED": [True, False, True, True],
+            }
+        ),
+    )
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+@pytest.mark.parametrize("chunk_size", [0, 1])
+def test_parse_aclineseg_scada_csvdata_to_dataframe_parse_stats(tmp_path, engine, chunk_size):
+    """
+    Verifies that skipped rows and unexpected DLR enabled values are counted and sampled in the parse statistics
+    """
+    # arrange
+    mrid_mapping_filepath = tmp_path / "seg_line_mrid_PROD.csv"
+    mrid_mapping_filepath.write_text(
+        "ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED\r\n"
+        + "------------------,------------,-----------\r\n"
+        + "mrid-1,E_AAA-BBB,YES\r\n"
+        + "mrid-2,E_GGG-HHH,NO,extra\r\n"
+        + "mrid-3,E_GGG-HHH,MAYBE\r\n"
+        + "mrid-4,E_GGG-HHH,\r\n"
+        + "mrid-5,E_GGG-HHH,NO,extra,extra\r\n"
+        + "mrid-6,E_GGG-HHH,MAYBE\r\n"
+    )
+
+    # act
+    parse_stats = parse_aclineseg_scada_csvdata_to_dataframe(
+        file_path=str(mrid_mapping_filepath), engine=engine, chunk_size=chunk_size
+    ).attrs["parse_stats"]
+
+    # assert
+    assert parse_stats["skipped_row_count"] == 2
+    assert [sample.split(": ")[1] for sample in parse_stats["skipped_row_samples"]] == [
+        "expected 3 fields, saw 4",
+        "expected 3 fields, saw 5",
+    ]
+    if engine == "pyarrow" and chunk_size == 0:
+        assert [sample.split(": ")[0] for sample in parse_stats["skipped_row_samples"]] == ["line", "line"]
+    else:
+        assert [sample.split(": ")[0] for sample in parse_stats["skipped_row_samples"]] == ["line 4", "line 7"]
+    assert parse_stats["unexpected_dlr_enabled_count"] == 3
+    assert parse_stats["unexpected_dlr_enabled_samples"] == ["MAYBE", "nan"]
+
+
+@pytest.mark.parametrize("engine", ["pyarrow", "c"])
+def test_parse_aclineseg_scada_csvdata_to_dataframe_chunked(tmp_path, engine):
+    """
+    Verifies that reading in chunks gives the same rows as reading at once, with only the join columns
+    """
+    # arrange file with rows in several chunks, extra columns and rows with too many values on chunk boundaries
+    mrid_mapping_filepath = tmp_path / "seg_line_mrid_PROD.csv"
+    with open(mrid_mapping_filepath, "w", encoding="cp1252", newline="") as file:
+        file.write("ACLINESEGMENT_MRID,LINE_EMSNAME,DLR_ENABLED,COMMENT\r\n---,---,---,---\r\n")
+        for index in range(5000):
+            extra_value = ",extra" if index in (1023, 1024, 2048) else ""
+            file.write(f"mrid-{index},E_AAA-BBB_{index % 7},{'NO' if index % 3 else 'YES'},Comment{extra_value}\r\n")
+
+    # act
+    dataframe = parse_aclineseg_scada_csvdata_to_dataframe(file_path=str(mrid_mapping_filepath), engine=engine)
+    chunked_dataframe = parse_aclineseg_scada_csvdata_to_dataframe(
+        file_path=str(mrid_mapping_filepath), engine=engine, chunk_size=1
+    )
+
+    # assert
+    assert len(chunked_dataframe) == 4997
+    assert list(chunked_dataframe.columns) == ["ACLINESEGMENT_MRID", "LINE_EMSNAME", "DLR_ENABLED"]
+    pd.testing.assert_frame_equal(chunked_dataframe, dataframe[chunked_dataframe.columns])
+
+
+@pytest.mark.parametrize("chunk_size", [0, 1])
+def test_parse_aclineseg_scada_csvdata_to_dataframe_missing_column(tmp_path, chunk_size):
+    """
+    Verifies that a missing column gives an error, also when reading in chunks
+    """
+    mrid_mapping_filepath = tmp_path / "seg_line_mrid_PROD.csv"
+    mrid_mapping_filepath.write_text("ACLINESEGMENT_MRID,LINE_EMSNAME\r\n---,---\r\nmrid-1,E_AAA-BBB\r\n")
+
+    with pytest.raises(ValueError):
+        parse_aclineseg_scada_csvdata_to_dataframe(file_path=str(mrid_mapping_filepath), chunk_size=chunk_size)
+
+
+def test_parse_aclineseg_scada_csvdata_to_dataframe_invalid_engine():
+    """
+    Verifies that an unknown CSV engine gives an error
+    """
+    with pytest.raises(ValueError):
+        parse_aclineseg_scada_csvdata_to_dataframe(file_path="seg_line_mrid_PROD.csv", engine="unknown")
@@ -1,6 +1,11 @@
 import pandas as pd
 import os
 
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
 from app.helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
 
 
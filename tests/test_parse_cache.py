@@ -0,0 +1,62 @@
+import pandas as pd
+import os
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.file_hash import calculate_file_hash
+from helpers.parse_cache import ParsedDataframeCache
+from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
+from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
+
+MRID_MAPPING_FILEPATH = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata/seg_line_mrid_PROD.csv"
+
+
+def test_parsed_dataframe_cache(tmp_path):
+    """
+    Verifies that a parsed dataframe is loaded identically from cache, and only for the same key
+    """
+    cache = ParsedDataframeCache(str(tmp_path))
+    dataframe = parse_aclineseg_scada_csvdata_to_dataframe(file_path=MRID_MAPPING_FILEPATH)
+    file_hash = calculate_file_hash(MRID_MAPPING_FILEPATH)
+    key = cache.get_key(file_hash=file_hash, parser=parse_aclineseg_scada_csvdata_to_dataframe, parser_kwargs={})
+
+    # Test nothing is loaded before dataframe is stored
+    assert cache.load(parser=parse_aclineseg_scada_csvdata_to_dataframe, key=key) is None
+
+    # Test dataframe is identical when loaded from cache
+    cache.store(parser=parse_aclineseg_scada_csvdata_to_dataframe, key=key, dataframe=dataframe)
+    pd.testing.assert_frame_equal(
+        cache.load(parser=parse_aclineseg_scada_csvdata_to_dataframe, key=key), dataframe
+    )
+
+    # Test key depends on file content, parser and parser arguments
+    assert key != cache.get_key(
+        file_hash="other", parser=parse_aclineseg_scada_csvdata_to_dataframe, parser_kwargs={}
+    )
+    assert key != cache.get_key(
+        file_hash=file_hash, parser=parse_acline_namemap_excelsheet_to_dataframe, parser_kwargs={}
+    )
+    assert key != cache.get_key(
+        file_hash=file_hash, parser=parse_aclineseg_scada_csvdata_to_dataframe, parser_kwargs={"engine": "c"}
+    )
+
+    # Test only newest dataframe of parser is kept
+    cache.store(parser=parse_aclineseg_scada_csvdata_to_dataframe, key="newer", dataframe=dataframe)
+    assert cache.load(parser=parse_aclineseg_scada_csvdata_to_dataframe, key=key) is None
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_parsed_dataframe_cache_skips_dataframes_which_change_when_stored(tmp_path):
+    """
+    Verifies that dataframes which can not be stored without changes are not cached
+    """
+    cache = ParsedDataframeCache(str(tmp_path))
+    dataframe = pd.DataFrame({"mixed": [1, "A"]})
+
+    cache.store(parser=parse_aclineseg_scada_csvdata_to_dataframe, key="mixed", dataframe=dataframe)
+
+    assert cache.load(parser=parse_aclineseg_scada_csvdata_to_dataframe, key="mixed") is None
+    assert os.listdir(tmp_path) == []
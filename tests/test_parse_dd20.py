@@ -13,7 +13,10 @@ path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
 from helpers.parse_dd20 import (
     DD20StationDataframeParser,
     DD20LineDataframeParser,
+    DD20_to_acline_properties_dataframe,
+    DD20_to_acline_properties_mapper,
     parse_dd20_excelsheets_to_dataframe,
+    TRANSLATION_MEMO,
 )
 
 
@@ -227,6 +230,29 @@ def test_DD20StationDataframeParser(dd20_data):
     assert data_parse_result.get_cablelim_40h_dict() == expected_cablelim_40h
 
 
+def test_DD20StationDataframeParser_acline_properties_dataframe(dd20_data):
+    """
+    Verfies that dataframe with all DD20 "station" properties matches the dictionaries.
+    """
+
+    # Parsing dataframe
+    data_parse_result = DD20StationDataframeParser(
+        df_station=dd20_data[DD20_SHEETNAME_STATIONSDATA]
+    )
+    df_acline_properties = data_parse_result.get_acline_properties_dataframe()
+
+    # Test dataframe has one row per AC-line in order of AC-line name list
+    assert df_acline_properties.index.to_list() == expected_acline_datasource_names
+
+    # Test columns contain same values as dictionaries
+    assert df_acline_properties["kv_level"].to_dict() == expected_conductor_kv_level
+    assert df_acline_properties["conductor_count"].to_dict() == expected_conductor_count
+    assert df_acline_properties["system_count"].to_dict() == expected_system_count
+    assert df_acline_properties["conductor_type"].to_dict() == expected_conductor_type
+    assert df_acline_properties["conductor_max_temp"].to_dict() == expected_max_temperature
+    assert df_acline_properties["cablelim_continuous"].to_dict() == expected_cablelim_continuous
+
+
 def test_DD20LineDataframeParser(dd20_data):
     """
     Verfies that all DD20 "line" data are parsed correctly.
@@ -271,6 +297,115 @@ def test_DD20LineDataframeParser(dd20_data):
     assert data_parse_result.get_complim_40h_dict() == expected_complim_40h
 
 
+def test_DD20LineDataframeParser_acline_min_values_dataframe(dd20_data):
+    """
+    Verfies that dataframe with all DD20 "line" minimum values matches the expected values.
+    """
+
+    # Parsing dataframe
+    data_parse_result = DD20LineDataframeParser(df_line=dd20_data[DD20_SHEETNAME_LINJEDATA])
+    df_acline_min_values = data_parse_result.get_acline_min_values_dataframe()
+
+    # Test dataframe has one row per AC-line in order of AC-line name list
+    assert df_acline_min_values.index.to_list() == expected_acline_datasource_names
+
+    # Test columns contain expected minimum values
+    assert df_acline_min_values["kv_level"].to_dict() == expected_conductor_kv_level
+    assert df_acline_min_values["acline_lim_continuous"].to_dict() == expected_acline_lim_continuous
+    assert df_acline_min_values["complim_continuous"].to_dict() == expected_complim_continuous
+    assert df_acline_min_values["complim_15m"].to_dict() == expected_complim_15m
+    assert df_acline_min_values["complim_1h"].to_dict() == expected_complim_1h
+    assert df_acline_min_values["complim_40h"].to_dict() == expected_complim_40h
+
+
+@pytest.mark.parametrize("component_limit", [nan, "n/a"])
+def test_DD20LineDataframeParser_sparse_and_non_numeric_component_limits(component_limit):
+    """
+    Verfies that missing and non-numeric component limits give the same minimum values as per AC-line lookup.
+    """
+
+    # arrange line data with unit row and component limits in column 4-5 and 6-7
+    df_linedata = pd.DataFrame(
+        {
+            "System": ["Navn", "AAA-BBB", "AAA-BBB", "CCC-DDD", "CCC-DDD"],
+            "Spændingsniveau": ["kV", 150, 150, 220, 220],
+            "I-kontinuert": ["A", 1000, 900, 800, nan],
+            "Antal sys.": ["Stk.", 1, 1, 1, 1],
+            "c1": ["A", 500, nan, component_limit, component_limit],
+            "c2": ["A", 400, nan, component_limit, component_limit],
+            "c3": ["A", 300.5, 200, nan, nan],
+            "c4": ["A", nan, nan, nan, nan],
+        },
+        dtype=object,
+    )
+
+    # Parsing dataframe
+    data_parse_result = DD20LineDataframeParser(
+        df_line=df_linedata,
+        complim_continuous_col_rng=range(4, 6),
+        complim_15m_col_rng=range(6, 8),
+        complim_1h_col_rng=range(4, 6),
+        complim_40h_col_rng=range(6, 8),
+    )
+
+    # Test mapping of minimum values, where NaN is only returned if AC-line has no values
+    assert data_parse_result.get_acline_lim_continuous_dict() == {"AAA-BBB": 900, "CCC-DDD": 800}
+    assert data_parse_result.get_complim_15m_dict()["AAA-BBB"] == 200
+    assert pd.isna(data_parse_result.get_complim_15m_dict()["CCC-DDD"])
+    assert data_parse_result.get_complim_continuous_dict()["AAA-BBB"] == 400
+    if isinstance(component_limit, str):
+        assert data_parse_result.get_complim_continuous_dict()["CCC-DDD"] == component_limit
+    else:
+        assert pd.isna(data_parse_result.get_complim_continuous_dict()["CCC-DDD"])
+
+
+def test_DD20_to_acline_properties_mapper_matches_dataframe(dd20_data):
+    """
+    Verifies that the ACLineProperties objects are a view of the combined DD20 dataframe
+    """
+    data_station = DD20StationDataframeParser(df_station=dd20_data[DD20_SHEETNAME_STATIONSDATA])
+    data_line = DD20LineDataframeParser(df_line=dd20_data[DD20_SHEETNAME_LINJEDATA])
+
+    acline_objects = DD20_to_acline_properties_mapper(data_station=data_station, data_line=data_line)
+    acline_properties_dataframe = DD20_to_acline_properties_dataframe(data_station=data_station, data_line=data_line)
+
+    # Test dataframe created from objects is identical to dataframe created from columns
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(data=[acline.__dict__ for acline in acline_objects]), acline_properties_dataframe
+    )
+
+
+def test_DD20_to_acline_properties_dataframe_untranslatable_names(dd20_data):
+    """
+    Verifies that AC-line names with unexpected format give an error listing the names
+    """
+    dd20_data = {
+        sheet_name: df.replace({"EEE-FFF-2": "EE-FFF-2", "III-ÆØÅ": "III-ÆØÅ-12"}) for sheet_name, df in dd20_data.items()
+    }
+    data_station = DD20StationDataframeParser(df_station=dd20_data[DD20_SHEETNAME_STATIONSDATA])
+    data_line = DD20LineDataframeParser(df_line=dd20_data[DD20_SHEETNAME_LINJEDATA])
+
+    with pytest.raises(ValueError, match=r"unepxected format:\['EE-FFF-2', 'III-ÆØÅ-12'\]"):
+        DD20_to_acline_properties_dataframe(data_station=data_station, data_line=data_line)
+
+
+def test_DD20_to_acline_properties_dataframe_translation_memo(dd20_data):
+    """
+    Verifies that translated names are remembered, and that remembered names give the same dataframe
+    """
+    data_station = DD20StationDataframeParser(df_station=dd20_data[DD20_SHEETNAME_STATIONSDATA])
+    data_line = DD20LineDataframeParser(df_line=dd20_data[DD20_SHEETNAME_LINJEDATA])
+    TRANSLATION_MEMO.clear()
+
+    translated_dataframe = DD20_to_acline_properties_dataframe(data_station=data_station, data_line=data_line)
+    hits_before = TRANSLATION_MEMO.hits
+    remembered_dataframe = DD20_to_acline_properties_dataframe(data_station=data_station, data_line=data_line)
+
+    assert len(TRANSLATION_MEMO) == len(expected_acline_datasource_names)
+    assert TRANSLATION_MEMO.hits - hits_before == len(expected_acline_datasource_names)
+    pd.testing.assert_frame_equal(translated_dataframe, remembered_dataframe)
+
+
 # test combined DD20 dataframe
 def test_parse_dd20_excelsheets_to_dataframe(dd20_data):
     """
@@ -445,3 +580,22 @@ def test_parse_dd20_excelsheets_to_dataframe(dd20_data):
         ignore_nan_inequality=True,
         ignore_numeric_type_changes=True
     )
+
+
+def test_parse_dd20_excelsheets_to_dataframe_streaming():
+    """
+    Verifies DD20 dataframe is identical when only used columns are streamed from DD20
+    """
+    pd.testing.assert_frame_equal(
+        parse_dd20_excelsheets_to_dataframe(
+            file_path=DD20_FILE_PATH,
+            line_data_valid_hash=LINE_DATA_VALID_HASH,
+            station_data_valid_hash=STATION_DATA_VALID_HASH,
+            streaming=True,
+        ),
+        parse_dd20_excelsheets_to_dataframe(
+            file_path=DD20_FILE_PATH,
+            line_data_valid_hash=LINE_DATA_VALID_HASH,
+            station_data_valid_hash=STATION_DATA_VALID_HASH,
+        ),
+    )
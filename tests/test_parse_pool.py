@@ -0,0 +1,38 @@
+import os
+import pandas as pd
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.parse_pool import ParsePool
+from helpers.parse_mrid_map import parse_aclineseg_scada_csvdata_to_dataframe
+from helpers.parse_namemap import parse_acline_namemap_excelsheet_to_dataframe
+
+TESTDATA_PATH = f"{os.path.dirname(os.path.realpath(__file__))}/valid-testdata"
+
+
+def test_parse_pool():
+    """
+    Verifies that files parsed in worker processes equal files parsed directly, and that errors are isolated
+    """
+    parse_tasks = {
+        "namemap": (parse_acline_namemap_excelsheet_to_dataframe, f"{TESTDATA_PATH}/Limits_other.xlsx", {}),
+        "mrid": (parse_aclineseg_scada_csvdata_to_dataframe, f"{TESTDATA_PATH}/seg_line_mrid_PROD.csv", {}),
+        "missing": (parse_aclineseg_scada_csvdata_to_dataframe, f"{TESTDATA_PATH}/missing.csv", {}),
+    }
+
+    parse_pool = ParsePool(max_workers=2)
+    try:
+        results = parse_pool.parse(parse_tasks)
+    finally:
+        parse_pool.close()
+
+    pd.testing.assert_frame_equal(
+        results["namemap"], parse_acline_namemap_excelsheet_to_dataframe(f"{TESTDATA_PATH}/Limits_other.xlsx")
+    )
+    pd.testing.assert_frame_equal(
+        results["mrid"], parse_aclineseg_scada_csvdata_to_dataframe(f"{TESTDATA_PATH}/seg_line_mrid_PROD.csv")
+    )
+    assert isinstance(results["missing"], FileNotFoundError)
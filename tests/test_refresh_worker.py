@@ -0,0 +1,89 @@
+import os
+import threading
+import pytest
+import pandas as pd
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.refresh_worker import RefreshWorker
+from helpers.file_watcher import FileWatcher, is_inotify_available
+
+
+def test_refresh_worker_publishes_new_dataframes():
+    """
+    Verifies that only new dataframes are published, and that a failing refresh keeps the published dataframe
+    """
+    # arrange
+    initial_dataframe = pd.DataFrame({"A": [1]})
+    new_dataframe = pd.DataFrame({"A": [2]})
+
+    def fail():
+        raise ValueError("Parsing failed")
+
+    refresh_results = [lambda: initial_dataframe, lambda: new_dataframe, fail, lambda: new_dataframe]
+    published_dataframes = []
+    refreshed = threading.Event()
+
+    def refresh():
+        return refresh_results.pop(0)()
+
+    def wait():
+        if not refresh_results:
+            refreshed.set()
+            worker.stop(timeout=0)
+
+    worker = RefreshWorker(
+        refresh_func=refresh,
+        publish_func=published_dataframes.append,
+        wait_func=wait,
+        dataframe=initial_dataframe,
+    )
+
+    # act
+    worker.start()
+    assert refreshed.wait(timeout=5)
+    worker.join(timeout=5)
+
+    # assert
+    assert len(published_dataframes) == 1
+    assert published_dataframes[0] is new_dataframe
+    assert worker.dataframe is new_dataframe
+
+
+@pytest.mark.skipif(not is_inotify_available(), reason="inotify is not available")
+def test_refresh_worker_rechecks_files_without_events(tmp_path):
+    """
+    Verifies that waiting with a timeout picks up a change which gives no inotify event, i.e. a replaced directory
+    """
+    # arrange
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "a.csv").write_text("1")
+    published_dataframes = []
+    published = threading.Event()
+
+    def refresh():
+        return pd.read_csv(data_dir / "a.csv", header=None)
+
+    def publish(dataframe):
+        published_dataframes.append(dataframe)
+        if dataframe.iloc[0, 0] == 2:
+            published.set()
+
+    with FileWatcher([str(data_dir / "a.csv")], mode="inotify", debounce=0.01) as file_watcher:
+        worker = RefreshWorker(
+            refresh_func=refresh, publish_func=publish, wait_func=lambda: file_watcher.wait(timeout=0.1)
+        )
+
+        # act
+        worker.start()
+        os.rename(data_dir, tmp_path / "data.old")
+        data_dir.mkdir()
+        (data_dir / "a.csv").write_text("2")
+
+        # assert
+        assert published.wait(timeout=5)
+        worker.stop(timeout=5)
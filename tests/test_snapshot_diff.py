@@ -0,0 +1,80 @@
+import os
+import pandas as pd
+from numpy import nan
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.snapshot_diff import diff_aclinesegment_dataframes
+from helpers.combine_data import enforce_aclinesegment_schema
+
+
+def test_diff_aclinesegment_dataframes():
+    """
+    Verifies that added, removed and changed ACLineSegments are found, and that missing values and dtypes are ignored
+    """
+    # arrange
+    old_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3", "mrid-4"],
+            "LINE_EMSNAME": ["E_GGG-HHH", "E_GGG-HHH", "D_CCC-DDD", "D_CCC-DDD"],
+            "CONDUCTOR_COUNT": [1, 2, 1, 1],
+            "RESTRICT_CABLE_LIM_15M": [nan, nan, 800.0, nan],
+        }
+    )
+    new_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-5", "mrid-4", "mrid-3", "mrid-1"],
+            "LINE_EMSNAME": ["E_III-JJJ", "D_CCC-DDD", "D_CCC-DDD", "E_GGG-HHH"],
+            "CONDUCTOR_COUNT": [1, 1, 2, 1],
+            "RESTRICT_CABLE_LIM_15M": [nan, 900.0, 800.0, nan],
+        }
+    )
+
+    # act
+    diff = diff_aclinesegment_dataframes(old_dataframe, new_dataframe)
+
+    # assert
+    assert diff.added == ["mrid-5"]
+    assert diff.removed == ["mrid-2"]
+    assert diff.changed == ["mrid-3", "mrid-4"]
+    assert len(diff) == 4
+    assert len(diff_aclinesegment_dataframes(old_dataframe, enforce_aclinesegment_schema(old_dataframe))) == 0
+    assert diff_aclinesegment_dataframes(pd.DataFrame(), old_dataframe).added == old_dataframe[
+        "ACLINESEGMENT_MRID"
+    ].tolist()
+    assert diff_aclinesegment_dataframes(old_dataframe, old_dataframe.drop(columns="CONDUCTOR_COUNT")).changed == [
+        "mrid-1",
+        "mrid-2",
+        "mrid-3",
+        "mrid-4",
+    ]
+
+
+def test_diff_aclinesegment_dataframes_compares_floats_at_narrower_precision():
+    """
+    Verifies that float values which are not whole numbers are unchanged when cast to float32, but changes are found
+    """
+    # arrange
+    old_dataframe = pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3"],
+            "RESTRICT_CABLE_LIM_15M": [800.1, nan, 0.3],
+        }
+    )
+    new_dataframe = old_dataframe.astype({"RESTRICT_CABLE_LIM_15M": "float32"})
+    changed_dataframe = new_dataframe.copy()
+    changed_dataframe.loc[2, "RESTRICT_CABLE_LIM_15M"] = 0.4
+
+    # act
+    diff = diff_aclinesegment_dataframes(old_dataframe, new_dataframe)
+    reversed_diff = diff_aclinesegment_dataframes(new_dataframe, old_dataframe)
+    changed_diff = diff_aclinesegment_dataframes(old_dataframe, changed_dataframe)
+
+    # assert
+    assert len(diff) == 0
+    assert len(reversed_diff) == 0
+    assert changed_diff.changed == ["mrid-3"]
+    assert len(diff_aclinesegment_dataframes(old_dataframe, enforce_aclinesegment_schema(old_dataframe))) == 0
@@ -0,0 +1,186 @@
+import os
+import pytest
+import pandas as pd
+from io import BytesIO
+from numpy import nan
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.snapshot_store import ACLineSegmentIndex, SnapshotStore
+from helpers.combine_data import enforce_aclinesegment_schema
+
+
+def create_dataframe() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "ACLINESEGMENT_MRID": ["mrid-1", "mrid-2", "mrid-3"],
+            "LINE_EMSNAME": ["E_GGG-HHH", "E_GGG-HHH", "D_CCC-DDD"],
+            "DLR_ENABLED": [True, False, True],
+            "CONDUCTOR_COUNT": [1, 2, 1],
+            "RESTRICT_CABLE_LIM_15M": [nan, nan, 800.0],
+        }
+    )
+
+
+def test_aclinesegment_index():
+    """
+    Verifies lookup of records by MRID and AC-line name, with missing values as None
+    """
+    # arrange / act
+    index = ACLineSegmentIndex(create_dataframe())
+
+    # assert
+    assert len(index) == 3
+    assert index.get_by_mrid(["mrid-3", "unknown", "mrid-1"]) == [
+        {
+            "ACLINESEGMENT_MRID": "mrid-3",
+            "LINE_EMSNAME": "D_CCC-DDD",
+            "DLR_ENABLED": True,
+            "CONDUCTOR_COUNT": 1,
+            "RESTRICT_CABLE_LIM_15M": 800.0,
+        },
+        {
+            "ACLINESEGMENT_MRID": "mrid-1",
+            "LINE_EMSNAME": "E_GGG-HHH",
+            "DLR_ENABLED": True,
+            "CONDUCTOR_COUNT": 1,
+            "RESTRICT_CABLE_LIM_15M": None,
+        },
+    ]
+    assert [record["ACLINESEGMENT_MRID"] for record in index.get_by_line_emsname(["E_GGG-HHH"])] == [
+        "mrid-1",
+        "mrid-2",
+    ]
+    assert index.get_by_line_emsname(["unknown"]) == []
+    assert len(ACLineSegmentIndex(pd.DataFrame())) == 0
+
+
+def test_aclinesegment_index_compact_dtypes():
+    """
+    Verifies that records have the same values when the dataframe has compact dtypes
+    """
+    dataframe = create_dataframe()
+
+    assert ACLineSegmentIndex(enforce_aclinesegment_schema(dataframe)).get_by_mrid(
+        ["mrid-1", "mrid-3"]
+    ) == ACLineSegmentIndex(dataframe).get_by_mrid(["mrid-1", "mrid-3"])
+    assert ACLineSegmentIndex(enforce_aclinesegment_schema(dataframe)).get_by_line_emsname(
+        ["E_GGG-HHH"]
+    ) == ACLineSegmentIndex(dataframe).get_by_line_emsname(["E_GGG-HHH"])
+
+
+def test_aclinesegment_index_duplicated_mrid():
+    """
+    Verifies that the last ACLineSegment is found if a MRID exists more than once
+    """
+    dataframe = create_dataframe()
+    dataframe.loc[2, "ACLINESEGMENT_MRID"] = "mrid-1"
+
+    index = ACLineSegmentIndex(dataframe)
+
+    assert len(index) == 2
+    assert "mrid-1" in index
+    assert [record["LINE_EMSNAME"] for record in index.get_by_mrid(["mrid-1"])] == ["D_CCC-DDD"]
+
+
+def test_snapshot_store_publish():
+    """
+    Verifies that each published dataframe becomes the current snapshot with the next generation
+    """
+    # arrange
+    snapshot_store = SnapshotStore()
+    dataframe = create_dataframe()
+
+    # act / assert
+    assert snapshot_store.current is None
+
+    first_snapshot = snapshot_store.publish(dataframe)
+    assert first_snapshot.generation == 1
+    assert first_snapshot.dataframe is dataframe
+    assert snapshot_store.current is first_snapshot
+
+    second_snapshot = snapshot_store.publish(dataframe.iloc[:1])
+    assert second_snapshot.generation == 2
+    assert snapshot_store.current is second_snapshot
+    assert len(second_snapshot.index) == 1
+    assert len(first_snapshot.index) == 3
+
+
+def test_snapshot_store_build_and_activate():
+    """
+    Verifies that a built snapshot only becomes current when activated, and that an outdated snapshot is rejected
+    """
+    # arrange
+    snapshot_store = SnapshotStore()
+    dataframe = create_dataframe()
+    snapshot_store.publish(dataframe)
+
+    # act
+    snapshot = snapshot_store.build(dataframe.iloc[:1])
+
+    # assert
+    assert snapshot.generation == 2
+    assert snapshot.rendered["json"].body
+    assert snapshot_store.current.generation == 1
+
+    assert snapshot_store.activate(snapshot) is snapshot_store.current
+    assert snapshot_store.current is snapshot
+    with pytest.raises(ValueError):
+        snapshot_store.activate(snapshot)
+
+
+def test_snapshot_store_changes_since():
+    """
+    Verifies that differences of several generations are combined, and that unknown generations give no difference
+    """
+    # arrange
+    snapshot_store = SnapshotStore(max_history=3)
+    dataframe = create_dataframe()
+    changed_dataframe = dataframe.copy()
+    changed_dataframe.loc[0, "CONDUCTOR_COUNT"] = 2
+    added_dataframe = pd.concat([changed_dataframe, dataframe.iloc[:1].assign(ACLINESEGMENT_MRID="mrid-4")])
+
+    # act
+    snapshot_store.publish(dataframe)
+    snapshot_store.publish(changed_dataframe.iloc[1:])
+    snapshot_store.publish(added_dataframe)
+
+    # assert
+    snapshot, diff = snapshot_store.changes_since(1)
+    assert snapshot.generation == 3
+    assert (diff.added, diff.removed, diff.changed) == (["mrid-4"], [], ["mrid-1"])
+
+    snapshot, diff = snapshot_store.changes_since(0)
+    assert (sorted(diff.added), diff.removed, diff.changed) == (["mrid-1", "mrid-2", "mrid-3", "mrid-4"], [], [])
+
+    snapshot, diff = snapshot_store.changes_since(2)
+    assert (diff.added, diff.removed, diff.changed) == (["mrid-1", "mrid-4"], [], [])
+
+    assert len(snapshot_store.changes_since(3)[1]) == 0
+    assert snapshot_store.changes_since(4)[1] is None
+
+    # Difference of generation 1 is no longer kept
+    snapshot_store.publish(dataframe)
+    assert snapshot_store.changes_since(0)[1] is None
+    assert snapshot_store.changes_since(1)[1] is not None
+
+
+def test_snapshot_store_binary_formats():
+    """
+    Verifies that Arrow IPC stream and Parquet renderings of a snapshot have the values of the dataframe
+    """
+    pa = pytest.importorskip("pyarrow")
+
+    # arrange
+    dataframe = enforce_aclinesegment_schema(create_dataframe())
+
+    # act
+    snapshot = SnapshotStore().publish(dataframe)
+
+    # assert
+    assert snapshot.rendered["arrow"].content_type == "application/vnd.apache.arrow.stream"
+    pd.testing.assert_frame_equal(pa.ipc.open_stream(snapshot.rendered["arrow"].body).read_pandas(), dataframe)
+    pd.testing.assert_frame_equal(pd.read_parquet(BytesIO(snapshot.rendered["parquet"].body)), dataframe)
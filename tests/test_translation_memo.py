@@ -0,0 +1,43 @@
+import os
+
+from sys import path
+# Ugly hack to allow absolute import from the root folder
+# whatever its name is. Please forgive the heresy.
+path.append(os.path.join(os.path.split(os.path.split(__file__)[0])[0], "app"))
+
+from helpers.translation_memo import TranslationMemo
+
+
+def test_translation_memo_lru():
+    """
+    Verifies that lookups are counted, and that the least recently used translation is forgotten first
+    """
+    # arrange
+    translation_memo = TranslationMemo(max_size=2, rules_version=1)
+    translation_memo.put_many({("AAA-BBB", 150): "E_AAA-BBB", ("CCC-DDD", 220): "D_CCC-DDD"})
+
+    # act
+    first_lookup = translation_memo.get_many([("AAA-BBB", 150), ("EEE-FFF-1", 132)])
+    translation_memo.put_many({("EEE-FFF-1", 132): "E_EEE-FFF_1"})
+    second_lookup = translation_memo.get_many([("AAA-BBB", 150), ("CCC-DDD", 220), ("EEE-FFF-1", 132)])
+
+    # assert
+    assert first_lookup == ["E_AAA-BBB", None]
+    assert second_lookup == ["E_AAA-BBB", None, "E_EEE-FFF_1"]
+    assert len(translation_memo) == 2
+    assert (translation_memo.hits, translation_memo.misses) == (3, 2)
+
+
+def test_translation_memo_rules_version():
+    """
+    Verifies that translations are forgotten when the translation rules version changes
+    """
+    translation_memo = TranslationMemo(max_size=10, rules_version=1)
+    translation_memo.put_many({("AAA-BBB", 150): "E_AAA-BBB"})
+
+    translation_memo.use_rules_version(1)
+    assert translation_memo.get_many([("AAA-BBB", 150)]) == ["E_AAA-BBB"]
+
+    translation_memo.use_rules_version(2)
+    assert translation_memo.get_many([("AAA-BBB", 150)]) == [None]
+    assert translation_memo.rules_version == 2